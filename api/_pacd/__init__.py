@@ -0,0 +1,6 @@
+"""
+Núcleo compartilhado pelas serverless functions do PACD
+
+Módulos com prefixo "_" dentro de api/ não viram endpoints na Vercel,
+então aqui ficam as rotinas reaproveitadas por todos os handlers.
+"""
@@ -0,0 +1,531 @@
+"""
+Armazenamento das abas: Google Sheets ou SQLite
+
+Os endpoints gravam, leem e excluem registros das abas 'atividades',
+'simulados', 'questoes' e 'redacoes' por meio de obter_armazenamento():
+
+- ArmazenamentoSheets (padrão): a planilha, com as leituras e gravações
+  em lote de _pacd.leitura/_pacd.escrita;
+- ArmazenamentoSQLite (PACD_ARMAZENAMENTO=sqlite): um arquivo SQLite
+  (PACD_SQLITE) com uma tabela por aba e índices no ID e em ID_ATIVIDADE.
+  Serve para rodar sem conta do Google (desenvolvimento, testes e
+  benchmarks) ou para servir de um disco persistente.
+
+Com o Sheets, PACD_REPLICA faz as leituras de tabelas virem da réplica
+local sincronizada por incremento (ver _pacd.replica).
+
+Os dois devolvem as mesmas Tabelas: o SQLite guarda os valores como
+texto, como a planilha os devolve, e a conversão é a mesma de ler_abas().
+As listagens (listar_exercicios, listar_redacoes e listar_painel) também
+passam por aqui: no Sheets, as abas são lidas e juntadas em Python
+(_pacd.listagem); no SQLite, o join com as abas derivadas é feito em SQL,
+pelo índice em ID_ATIVIDADE, sem copiar as tabelas inteiras.
+
+As exclusões também passam por aqui: cada armazenamento aplica a exclusão
+lógica (se houver), pede a reconciliação da réplica e invalida o cache das
+listagens, então o endpoint não precisa saber qual deles está em uso.
+"""
+import os
+import sqlite3
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+
+from gspread.utils import absolute_range_name, rowcol_to_a1
+
+from _pacd.cache import invalidar_listagens
+from _pacd.chamadas import chamar_sheets
+from _pacd.escrita import acrescentar_linhas, excluir_linhas
+from _pacd.exclusao_logica import EXCLUSAO_LOGICA, esta_excluido, marcar_excluidos
+from _pacd.indice import ler_colunas, localizar_linha
+from _pacd.ids import MARCA_EXCLUSAO
+from _pacd.leitura import converter_valor, ler_abas, para_tabela
+from _pacd.listagem import (
+    CAMPOS_INFO_QUESTOES, CAMPOS_INFO_SIMULADO, CAMPOS_REDACAO, MOTOR_PADRAO,
+    montar_exercicios, montar_exercicios_juntados, montar_redacoes, montar_redacoes_juntadas
+)
+from _pacd.log import obter_log
+from _pacd.medicao import fase
+from _pacd.planilha import obter_planilha
+from _pacd.registros import COLUNAS_POR_ABA
+
+
+log = obter_log(__name__)
+
+
+ARMAZENAMENTO = os.environ.get("PACD_ARMAZENAMENTO", "sheets").lower()
+CAMINHO_SQLITE = os.environ.get("PACD_SQLITE", os.path.join(tempfile.gettempdir(), "pacd_dados.sqlite3"))
+
+ABAS_EXERCICIOS = ("atividades", "simulados", "questoes")
+ABAS_REDACOES = ("atividades", "redacoes")
+ABAS_PAINEL = ("atividades", "simulados", "questoes", "redacoes")
+
+
+class Armazenamento(ABC):
+    """
+    Interface comum dos armazenamentos
+
+    Os IDs são comparados como texto e ficam na coluna A de cada aba; os
+    registros derivados apontam para a atividade pela coluna ID_ATIVIDADE.
+    Um armazenamento que não implemente todos os métodos abstratos falha
+    ao ser criado, não no primeiro uso.
+    """
+
+    # Se cada operação vai à rede (o diário de gravação só vale nesse caso)
+    remoto = False
+
+    def acrescentar(self, nome_aba, linha):
+        """Acrescenta uma linha ao final da aba"""
+        self.acrescentar_lote({nome_aba: [linha]})
+
+    @abstractmethod
+    def acrescentar_lote(self, linhas_por_aba):
+        """
+        Acrescenta linhas em várias abas de uma vez (tudo ou nada)
+
+        Args:
+            linhas_por_aba: {nome da aba: [linha, ...]}
+        """
+
+    @abstractmethod
+    def ler_tabelas(self, *nomes_abas):
+        """
+        Lê abas inteiras
+
+        Returns:
+            dict: {nome da aba: Tabela}
+        """
+
+    def ler_tabela(self, nome_aba):
+        """Lê uma aba inteira como Tabela"""
+        return self.ler_tabelas(nome_aba)[nome_aba]
+
+    def listar_exercicios(self, motor=MOTOR_PADRAO):
+        """Payload da listagem de exercícios (ver _pacd.listagem.montar_exercicios)"""
+        return montar_exercicios(self.ler_tabelas(*ABAS_EXERCICIOS), motor)
+
+    def listar_redacoes(self):
+        """Payload da listagem de redações (ver _pacd.listagem.montar_redacoes)"""
+        return montar_redacoes(self.ler_tabelas(*ABAS_REDACOES))
+
+    def listar_painel(self, motor=MOTOR_PADRAO):
+        """Exercícios e redações, lendo a aba 'atividades' uma única vez"""
+        var_dicTabelas = self.ler_tabelas(*ABAS_PAINEL)
+        return {
+            "exercicios": montar_exercicios(var_dicTabelas, motor),
+            "redacoes": montar_redacoes(var_dicTabelas)
+        }
+
+    @abstractmethod
+    def ler_colunas(self, nome_aba, *colunas):
+        """
+        Lê só algumas colunas de uma aba, como texto
+
+        Returns:
+            dict: {coluna: [valor por linha, sem o cabeçalho]}
+        """
+
+    @abstractmethod
+    def buscar_por_id(self, nome_aba, id_registro):
+        """
+        Primeiro registro com o ID informado (coluna A)
+
+        Returns:
+            dict | None: {coluna: valor} ou None se não existir
+        """
+
+    def excluir_por_id(self, nome_aba, id_registro):
+        """
+        Exclui o registro com o ID informado
+
+        Returns:
+            bool: Se o registro existia
+        """
+        return self.excluir_lote([(nome_aba, id_registro)])[0]
+
+    @abstractmethod
+    def excluir_lote(self, pedidos, derivadas=()):
+        """
+        Exclui vários registros de uma vez
+
+        Args:
+            pedidos: [(nome da aba, ID), ...]
+            derivadas: Abas cujos registros com ID_ATIVIDADE igual ao ID de
+                uma atividade excluída também são excluídos
+
+        Returns:
+            list: Para cada pedido, se o registro existia
+        """
+
+
+def _primeiro_registro(tabela):
+    if not len(tabela):
+        return None
+    return tabela.registros(list(tabela.colunas))[0]
+
+
+def _linhas_com_valor(coluna, valor):
+    """Linhas (1-based, sem o cabeçalho) em que a coluna tem o valor"""
+    return [i for i, atual in enumerate(coluna, start=1) if i > 1 and atual == valor]
+
+
+class ArmazenamentoSheets(Armazenamento):
+    """Abas da planilha do Google Sheets (leituras opcionalmente pela réplica local)"""
+
+    remoto = True
+
+    def __init__(self, replica=None):
+        self.replica = replica
+
+    def acrescentar_lote(self, linhas_por_aba):
+        acrescentar_linhas(linhas_por_aba)
+
+    def ler_tabelas(self, *nomes_abas):
+        if self.replica is not None:
+            return self.replica.ler_tabelas(*nomes_abas)
+        return ler_abas(*nomes_abas)
+
+    # Com a réplica, as listagens são juntadas em SQL na cópia local
+    def listar_exercicios(self, motor=MOTOR_PADRAO):
+        if self.replica is not None:
+            return self.replica.listar_exercicios(motor)
+        return super().listar_exercicios(motor)
+
+    def listar_redacoes(self):
+        if self.replica is not None:
+            return self.replica.listar_redacoes()
+        return super().listar_redacoes()
+
+    def listar_painel(self, motor=MOTOR_PADRAO):
+        if self.replica is not None:
+            return self.replica.listar_painel(motor)
+        return super().listar_painel(motor)
+
+    def _letra(self, nome_aba, coluna):
+        """Letra da coluna pelo cabeçalho esperado da aba"""
+        return rowcol_to_a1(1, COLUNAS_POR_ABA[nome_aba].index(coluna) + 1).rstrip("1")
+
+    def ler_colunas(self, nome_aba, *colunas):
+        # Direto da planilha (não da réplica), em uma única chamada
+        intervalos = [(nome_aba, self._letra(nome_aba, coluna)) for coluna in colunas]
+        valores = ler_colunas(intervalos)
+        return {coluna: valores[intervalo][1:] for coluna, intervalo in zip(colunas, intervalos)}
+
+    def buscar_por_id(self, nome_aba, id_registro):
+        # A linha vem do índice ID -> linha da aba (só a coluna A é lida)
+        linha = localizar_linha(nome_aba, id_registro)
+        if linha is None:
+            return None
+
+        # Cabeçalho e a linha encontrada em uma única chamada
+        resposta = chamar_sheets(
+            obter_planilha().values_batch_get,
+            [absolute_range_name(nome_aba, "1:1"), absolute_range_name(nome_aba, f"{linha}:{linha}")]
+        )
+        valores = [intervalo.get("values", [[]])[0] for intervalo in resposta.get("valueRanges", [])]
+        return _primeiro_registro(para_tabela(valores))
+
+    def _excluir_linhas(self, ids_por_aba):
+        """
+        Exclui as linhas em um único batchUpdate (atômico) ou, com
+        PACD_EXCLUSAO_LOGICA, só marca as células de ID (ver _pacd.exclusao_logica)
+
+        Args:
+            ids_por_aba: {nome da aba: {número da linha: ID atual}}
+        """
+        if EXCLUSAO_LOGICA:
+            marcar_excluidos(ids_por_aba)
+        else:
+            excluir_linhas({nome_aba: sorted(ids) for nome_aba, ids in ids_por_aba.items()})
+
+        if self.replica is not None:
+            self.replica.exigir_reconciliacao(*ids_por_aba)
+        invalidar_listagens()
+
+    def excluir_por_id(self, nome_aba, id_registro):
+        # A linha vem do índice ID -> linha da aba (só a coluna A é lida)
+        linha = localizar_linha(nome_aba, id_registro)
+        if linha is None:
+            return False
+
+        log.debug("❗ Registro encontrado na linha %d de '%s'", linha, nome_aba)
+        self._excluir_linhas({nome_aba: {linha: id_registro}})
+        return True
+
+    def excluir_lote(self, pedidos, derivadas=()):
+        # Uma única leitura traz as colunas necessárias de todas as abas
+        # envolvidas: IDs das abas pedidas e, para atividades, ID_ATIVIDADE
+        # das derivadas (e os IDs delas, para marcar e pular as já marcadas)
+        intervalos = set()
+        for nome_aba, _ in pedidos:
+            intervalos.add((nome_aba, "A"))
+            if nome_aba == "atividades":
+                intervalos.update((derivada, self._letra(derivada, "ID_ATIVIDADE")) for derivada in derivadas)
+                if EXCLUSAO_LOGICA:
+                    intervalos.update((derivada, "A") for derivada in derivadas)
+
+        colunas = ler_colunas(sorted(intervalos)) if intervalos else {}
+
+        ids_por_aba = {}
+        resultados = []
+        for nome_aba, id_registro in pedidos:
+            id_registro = str(id_registro)
+
+            # Primeira ocorrência do ID, como em excluir_por_id()
+            linhas = _linhas_com_valor(colunas[(nome_aba, "A")], id_registro)[:1]
+            resultados.append(bool(linhas))
+            if not linhas:
+                continue
+            ids_por_aba.setdefault(nome_aba, {})[linhas[0]] = id_registro
+
+            if nome_aba != "atividades":
+                continue
+            for derivada in derivadas:
+                linhas = _linhas_com_valor(colunas[(derivada, self._letra(derivada, "ID_ATIVIDADE"))], id_registro)
+                ids = colunas.get((derivada, "A"), [])
+                if EXCLUSAO_LOGICA:
+                    linhas = [i for i in linhas if i <= len(ids) and not esta_excluido(ids[i - 1])]
+                if linhas:
+                    log.debug("🗑️ %d registro(s) derivado(s) em '%s'", len(linhas), derivada)
+                    ids_por_aba.setdefault(derivada, {}).update(
+                        (i, ids[i - 1] if i <= len(ids) else "") for i in linhas
+                    )
+
+        if ids_por_aba:
+            self._excluir_linhas(ids_por_aba)
+        return resultados
+
+
+def _texto(valor):
+    """Valor como a planilha o devolveria (gravação RAW, leitura formatada)"""
+    if valor is None:
+        return ""
+    if isinstance(valor, bool):
+        return "TRUE" if valor else "FALSE"
+    return str(valor)
+
+
+class ArmazenamentoSQLite(Armazenamento):
+    """Uma tabela SQLite por aba, com índices no ID e em ID_ATIVIDADE"""
+
+    def __init__(self, caminho=CAMINHO_SQLITE, colunas_por_aba=COLUNAS_POR_ABA):
+        self.caminho = caminho
+        self.colunas_por_aba = colunas_por_aba
+        self._lock = threading.Lock()
+        self._conexao = None
+
+    def _conectar(self):
+        if self._conexao is None:
+            os.makedirs(os.path.dirname(self.caminho) or ".", exist_ok=True)
+            conexao = sqlite3.connect(self.caminho, timeout=30, isolation_level=None, check_same_thread=False)
+            conexao.execute("PRAGMA journal_mode=WAL")
+
+            for nome_aba, colunas in self.colunas_por_aba.items():
+                # A ordem de inserção (posicao) faz o papel do número da linha
+                definicoes = ", ".join(f'"{coluna}" TEXT NOT NULL DEFAULT \'\'' for coluna in colunas)
+                conexao.execute(f'CREATE TABLE IF NOT EXISTS "{nome_aba}" (posicao INTEGER PRIMARY KEY AUTOINCREMENT, {definicoes})')
+                for coluna in {colunas[0], "ID_ATIVIDADE"} & set(colunas):
+                    conexao.execute(f'CREATE INDEX IF NOT EXISTS "idx_{nome_aba}_{coluna}" ON "{nome_aba}" ("{coluna}")')
+
+            self._conexao = conexao
+        return self._conexao
+
+    def _colunas(self, nome_aba):
+        if nome_aba not in self.colunas_por_aba:
+            raise ValueError(f"Aba desconhecida: {nome_aba!r}")
+        return self.colunas_por_aba[nome_aba]
+
+    def acrescentar_lote(self, linhas_por_aba):
+        with self._lock:
+            conexao = self._conectar()
+            conexao.execute("BEGIN IMMEDIATE")
+            try:
+                for nome_aba, linhas in linhas_por_aba.items():
+                    colunas = self._colunas(nome_aba)
+                    if not linhas:
+                        continue
+                    if any(len(linha) > len(colunas) for linha in linhas):
+                        raise ValueError(f"Linha com mais colunas que a aba '{nome_aba}'")
+
+                    nomes = ", ".join(f'"{coluna}"' for coluna in colunas)
+                    marcadores = ", ".join("?" for _ in colunas)
+                    conexao.executemany(
+                        f'INSERT INTO "{nome_aba}" ({nomes}) VALUES ({marcadores})',
+                        [[_texto(valor) for valor in linha] + [""] * (len(colunas) - len(linha)) for linha in linhas]
+                    )
+                conexao.execute("COMMIT")
+            except BaseException:
+                conexao.execute("ROLLBACK")
+                raise
+
+    @fase("sqlite")
+    def _selecionar(self, nome_aba, where="", parametros=()):
+        colunas = self._colunas(nome_aba)
+        nomes = ", ".join(f'"{coluna}"' for coluna in colunas)
+        with self._lock:
+            linhas = self._conectar().execute(
+                f'SELECT {nomes} FROM "{nome_aba}" {where} ORDER BY posicao', parametros
+            ).fetchall()
+        return para_tabela([colunas] + [list(linha) for linha in linhas])
+
+    def ler_tabelas(self, *nomes_abas):
+        return self._tabelas_locais(*nomes_abas)
+
+    def _tabelas_locais(self, *nomes_abas):
+        # Separado de ler_tabelas(), que a réplica sobrescreve para sincronizar antes
+        return {nome_aba: self._selecionar(nome_aba) for nome_aba in nomes_abas}
+
+    def _nao_excluido(self, alias, nome_aba):
+        """Condição SQL que descarta as linhas marcadas pela exclusão lógica"""
+        return f'substr({alias}."{self._colunas(nome_aba)[0]}", 1, {len(MARCA_EXCLUSAO)}) <> :marca'
+
+    def _sql_exercicios(self):
+        """Atividades (exceto redações) com seus simulados ou questões, pelo índice em ID_ATIVIDADE"""
+        campos_simulado = ", ".join(f's."{campo}"' for campo in CAMPOS_INFO_SIMULADO)
+        campos_questoes = ", ".join(f'q."{campo}"' for campo in CAMPOS_INFO_QUESTOES)
+        return (
+            f'SELECT a.posicao, a."ID_ATIVIDADE", a."TITULO", a."TIPO", a."DT_INICIO",'
+            f' s.posicao, {campos_simulado}, q.posicao, {campos_questoes}'
+            f' FROM atividades a'
+            f' LEFT JOIN simulados s ON a."TIPO" = \'Simulado\' AND s."ID_ATIVIDADE" = a."ID_ATIVIDADE"'
+            f' AND {self._nao_excluido("s", "simulados")}'
+            f' LEFT JOIN questoes q ON a."TIPO" = \'Questões\' AND q."ID_ATIVIDADE" = a."ID_ATIVIDADE"'
+            f' AND {self._nao_excluido("q", "questoes")}'
+            f' WHERE a."TIPO" <> \'Redação\' AND {self._nao_excluido("a", "atividades")}'
+            f' ORDER BY a.posicao, s.posicao, q.posicao'
+        )
+
+    def _sql_redacoes(self):
+        """Atividades do tipo redação com a última redação de cada uma"""
+        campos = ", ".join(f'r."{campo}"' for campo in CAMPOS_REDACAO)
+        return (
+            f'SELECT a."ID_ATIVIDADE", a."TITULO", a."TIPO", a."DT_INICIO", r.posicao, {campos}'
+            f' FROM atividades a'
+            f' LEFT JOIN redacoes r ON r.posicao = ('
+            f'SELECT MAX(posicao) FROM redacoes ultima WHERE ultima."ID_ATIVIDADE" = a."ID_ATIVIDADE"'
+            f' AND {self._nao_excluido("ultima", "redacoes")})'
+            f' WHERE a."TIPO" = \'Redação\' AND {self._nao_excluido("a", "atividades")}'
+            f' ORDER BY a.posicao'
+        )
+
+    @fase("sqlite")
+    def _consultar(self, *consultas):
+        """Executa as consultas em uma única transação de leitura (mesmo instantâneo)"""
+        with self._lock:
+            conexao = self._conectar()
+            conexao.execute("BEGIN")
+            try:
+                return [conexao.execute(sql, {"marca": MARCA_EXCLUSAO}).fetchall() for sql in consultas]
+            finally:
+                conexao.execute("COMMIT")
+
+    @staticmethod
+    def _linhas_exercicios(linhas):
+        """Converte as linhas do join de exercícios para montar_exercicios_juntados()"""
+        inicio_questoes = 6 + len(CAMPOS_INFO_SIMULADO)
+        for linha in linhas:
+            if linha[5] is not None:
+                info = dict(zip(CAMPOS_INFO_SIMULADO, map(converter_valor, linha[6:inicio_questoes])))
+            elif linha[inicio_questoes] is not None:
+                info = dict(zip(CAMPOS_INFO_QUESTOES, map(converter_valor, linha[inicio_questoes + 1:])))
+            else:
+                info = None
+            yield (linha[0], *map(converter_valor, linha[1:5]), info)
+
+    @staticmethod
+    def _linhas_redacoes(linhas):
+        """Converte as linhas do join de redações para montar_redacoes_juntadas()"""
+        for linha in linhas:
+            notas = None if linha[4] is None else dict(zip(CAMPOS_REDACAO, map(converter_valor, linha[5:])))
+            yield (*map(converter_valor, linha[:4]), notas)
+
+    def listar_exercicios(self, motor=MOTOR_PADRAO):
+        if motor != MOTOR_PADRAO:
+            return montar_exercicios(self._tabelas_locais(*ABAS_EXERCICIOS), motor)
+        linhas, = self._consultar(self._sql_exercicios())
+        return montar_exercicios_juntados(self._linhas_exercicios(linhas))
+
+    def listar_redacoes(self):
+        linhas, = self._consultar(self._sql_redacoes())
+        return montar_redacoes_juntadas(self._linhas_redacoes(linhas))
+
+    def listar_painel(self, motor=MOTOR_PADRAO):
+        if motor != MOTOR_PADRAO:
+            var_dicTabelas = self._tabelas_locais(*ABAS_PAINEL)
+            return {
+                "exercicios": montar_exercicios(var_dicTabelas, motor),
+                "redacoes": montar_redacoes(var_dicTabelas)
+            }
+        exercicios, redacoes = self._consultar(self._sql_exercicios(), self._sql_redacoes())
+        return {
+            "exercicios": montar_exercicios_juntados(self._linhas_exercicios(exercicios)),
+            "redacoes": montar_redacoes_juntadas(self._linhas_redacoes(redacoes))
+        }
+
+    @fase("sqlite")
+    def ler_colunas(self, nome_aba, *colunas):
+        desconhecidas = set(colunas) - set(self._colunas(nome_aba))
+        if desconhecidas:
+            raise ValueError(f"Coluna desconhecida em '{nome_aba}': {sorted(desconhecidas)!r}")
+
+        nomes = ", ".join(f'"{coluna}"' for coluna in colunas)
+        with self._lock:
+            linhas = self._conectar().execute(f'SELECT {nomes} FROM "{nome_aba}" ORDER BY posicao').fetchall()
+        return {coluna: [linha[i] for linha in linhas] for i, coluna in enumerate(colunas)}
+
+    def buscar_por_id(self, nome_aba, id_registro):
+        # Pelo índice no ID (coluna A)
+        coluna_id = self._colunas(nome_aba)[0]
+        return _primeiro_registro(self._selecionar(nome_aba, f'WHERE "{coluna_id}" = ?', (str(id_registro),)))
+
+    def excluir_lote(self, pedidos, derivadas=()):
+        # Exclusão física, tudo em uma transação, pelos índices no ID e em ID_ATIVIDADE
+        resultados = []
+        with self._lock:
+            conexao = self._conectar()
+            conexao.execute("BEGIN IMMEDIATE")
+            try:
+                for nome_aba, id_registro in pedidos:
+                    coluna_id = self._colunas(nome_aba)[0]
+                    cursor = conexao.execute(f'DELETE FROM "{nome_aba}" WHERE "{coluna_id}" = ?', (str(id_registro),))
+                    resultados.append(cursor.rowcount > 0)
+
+                    if nome_aba == "atividades" and cursor.rowcount:
+                        for derivada in derivadas:
+                            if "ID_ATIVIDADE" not in self._colunas(derivada):
+                                raise ValueError(f"Coluna desconhecida em '{derivada}': 'ID_ATIVIDADE'")
+                            conexao.execute(f'DELETE FROM "{derivada}" WHERE "ID_ATIVIDADE" = ?', (str(id_registro),))
+                conexao.execute("COMMIT")
+            except BaseException:
+                conexao.execute("ROLLBACK")
+                raise
+
+        if any(resultados):
+            invalidar_listagens()
+        return resultados
+
+
+_lock = threading.Lock()
+_armazenamento = None
+
+
+def obter_armazenamento():
+    """
+    Armazenamento configurado em PACD_ARMAZENAMENTO ('sheets' ou 'sqlite')
+
+    Returns:
+        Armazenamento: Instância compartilhada pela instância serverless
+    """
+    global _armazenamento
+
+    with _lock:
+        if _armazenamento is None:
+            if ARMAZENAMENTO == "sqlite":
+                log.info("🗄️ Armazenamento SQLite em %s", CAMINHO_SQLITE)
+                _armazenamento = ArmazenamentoSQLite()
+            elif ARMAZENAMENTO == "sheets":
+                from _pacd.replica import REPLICA_LOCAL, ReplicaPlanilha
+                _armazenamento = ArmazenamentoSheets(ReplicaPlanilha() if REPLICA_LOCAL else None)
+            else:
+                raise ValueError(f"PACD_ARMAZENAMENTO inválido: {ARMAZENAMENTO!r}")
+        return _armazenamento
@@ -0,0 +1,203 @@
+"""
+Cache read-through das listagens
+
+Os payloads montados pelas listagens ficam em dois níveis:
+
+1. memória do processo (LRU limitado por quantidade de itens);
+2. arquivos em /tmp, que sobrevivem a um recarregamento do módulo e são
+   compartilhados por processos da mesma instância.
+
+Toda função que grava na planilha chama invalidar_listagens(), mas isso
+só vale para a instância que gravou: o /tmp não é compartilhado entre
+instâncias da Vercel. Para que quem gravou veja a própria alteração em
+qualquer instância, a listagem pode pedir um valor carregado depois de um
+instante (`desde`, ver _pacd.resposta.ler_desde): itens carregados antes
+dele são tratados como ausentes e recarregados. Para os demais, o TTL
+limita por quanto tempo uma listagem desatualizada pode ser servida.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from _pacd.log import obter_log
+from _pacd.medicao import fase
+from _pacd.resposta import iterar_json
+
+
+log = obter_log(__name__)
+
+
+TTL_LISTAGENS = int(os.environ.get("PACD_CACHE_TTL", "120"))
+MAX_ITENS_MEMORIA = 32
+MAX_ARQUIVOS_DISCO = 64
+PASTA_CACHE = os.environ.get("PACD_CACHE_DIR", os.path.join(tempfile.gettempdir(), "pacd_cache"))
+
+
+class CacheListagens:
+    """Cache LRU com TTL em memória e segundo nível em disco"""
+
+    def __init__(self, ttl=TTL_LISTAGENS, max_itens=MAX_ITENS_MEMORIA,
+                 max_arquivos=MAX_ARQUIVOS_DISCO, pasta=PASTA_CACHE):
+        self.ttl = ttl
+        self.max_itens = max_itens
+        self.max_arquivos = max_arquivos
+        self.pasta = pasta
+        self._itens = OrderedDict()
+        self._geracao = 0
+        self._lock = threading.Lock()
+
+    def _caminho(self, chave):
+        nome = hashlib.sha1(chave.encode("utf-8")).hexdigest()
+        return os.path.join(self.pasta, f"{nome}.json")
+
+    def _ler_memoria(self, chave, agora):
+        with self._lock:
+            item = self._itens.get(chave)
+            if item is None:
+                return None
+            if item[0] <= agora:
+                del self._itens[chave]
+                return None
+            self._itens.move_to_end(chave)
+            return item
+
+    def _gravar_memoria(self, chave, expira_em, valor, versao, carregado_em):
+        with self._lock:
+            self._itens[chave] = (expira_em, valor, versao, carregado_em)
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.max_itens:
+                self._itens.popitem(last=False)
+
+    def _ler_disco(self, chave, agora):
+        try:
+            with open(self._caminho(chave), "r", encoding="utf-8") as arquivo:
+                conteudo = json.load(arquivo)
+        except (OSError, ValueError):
+            return None
+
+        if conteudo.get("chave") != chave or conteudo.get("expira_em", 0) <= agora or "versao" not in conteudo:
+            return None
+        return conteudo["expira_em"], conteudo["valor"], conteudo["versao"], conteudo.get("carregado_em", 0)
+
+    def _gravar_disco(self, chave, expira_em, valor, versao, carregado_em):
+        try:
+            os.makedirs(self.pasta, exist_ok=True)
+
+            # Grava em arquivo temporário e renomeia para não expor JSON pela metade
+            descritor, temporario = tempfile.mkstemp(dir=self.pasta, suffix=".tmp")
+            with os.fdopen(descritor, "w", encoding="utf-8") as arquivo:
+                json.dump({
+                    "chave": chave, "expira_em": expira_em, "carregado_em": carregado_em,
+                    "versao": versao, "valor": valor
+                }, arquivo)
+            os.replace(temporario, self._caminho(chave))
+
+            self._limitar_disco()
+        except OSError as e:
+            log.aviso("⚠️ Não foi possível gravar o cache em disco: %s", e)
+
+    def _limitar_disco(self):
+        """Remove os arquivos menos usados quando passa de max_arquivos"""
+        arquivos = [
+            os.path.join(self.pasta, nome)
+            for nome in os.listdir(self.pasta) if nome.endswith(".json")
+        ]
+        if len(arquivos) <= self.max_arquivos:
+            return
+
+        arquivos.sort(key=os.path.getmtime)
+        for caminho in arquivos[:len(arquivos) - self.max_arquivos]:
+            try:
+                os.remove(caminho)
+            except OSError:
+                pass
+
+    def obter_versionado(self, chave, carregar, desde=None):
+        """
+        Retorna o valor em cache (ou carrega, guarda e retorna) com sua versão
+
+        A versão é um hash do JSON do valor, calculado uma vez ao carregar,
+        e serve de base para o ETag sem serializar o payload a cada requisição.
+
+        Args:
+            chave: Identificador da listagem (ex.: 'exercicios:padrao')
+            carregar: Função sem argumentos que monta o payload
+            desde: Instante (time.time()) a partir do qual o valor deve ter
+                sido carregado; itens mais antigos são recarregados
+
+        Returns:
+            tuple: (valor compartilhado, que não deve ser alterado; versão)
+        """
+        agora = time.time()
+        desde = desde or 0
+
+        item = self._ler_memoria(chave, agora)
+        if item is not None and item[3] >= desde:
+            log.debug("⚡ Cache em memória: '%s'", chave)
+            return item[1], item[2]
+
+        item = self._ler_disco(chave, agora)
+        if item is not None and item[3] >= desde:
+            log.debug("⚡ Cache em disco: '%s'", chave)
+            self._gravar_memoria(chave, *item)
+            return item[1], item[2]
+
+        if desde:
+            log.debug("🔄 Cache de '%s' anterior a uma gravação, recarregando", chave)
+
+        geracao = self._geracao
+        carregado_em = time.time()
+        valor = carregar()
+        versao = calcular_versao(valor)
+
+        # Uma gravação durante o carregamento torna o valor obsoleto
+        if geracao != self._geracao:
+            return valor, versao
+
+        expira_em = time.time() + self.ttl
+        self._gravar_memoria(chave, expira_em, valor, versao, carregado_em)
+        self._gravar_disco(chave, expira_em, valor, versao, carregado_em)
+        return valor, versao
+
+    def obter(self, chave, carregar, desde=None):
+        """Como obter_versionado(), retornando só o valor"""
+        return self.obter_versionado(chave, carregar, desde)[0]
+
+    def invalidar(self):
+        """Descarta todas as listagens (memória e disco)"""
+        with self._lock:
+            self._geracao += 1
+            self._itens.clear()
+
+        try:
+            nomes = os.listdir(self.pasta)
+        except OSError:
+            return
+
+        for nome in nomes:
+            try:
+                os.remove(os.path.join(self.pasta, nome))
+            except OSError:
+                pass
+
+
+@fase("versao")
+def calcular_versao(valor):
+    """Hash do JSON do valor, serializado item a item"""
+    var_objHash = hashlib.sha256()
+    for parte in iterar_json(valor):
+        var_objHash.update(parte)
+    return var_objHash.hexdigest()
+
+
+cache_listagens = CacheListagens()
+
+
+def invalidar_listagens():
+    """Hook chamado por toda função que grava ou exclui linhas da planilha"""
+    log.debug("🧹 Invalidando cache das listagens")
+    cache_listagens.invalidar()
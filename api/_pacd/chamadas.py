@@ -0,0 +1,230 @@
+"""
+Chamadas à API do Sheets com cota, novas tentativas e coalescência
+
+Toda chamada à planilha passa por chamar_sheets():
+
+- Cota: um balde de tokens para leituras e outro para escritas, com a
+  cota por minuto do projeto (PACD_COTA_LEITURA / PACD_COTA_ESCRITA).
+  Sem token disponível, a chamada espera em vez de ir ao Google e
+  receber 429.
+- Novas tentativas: 429 e 5xx são repetidos com espera exponencial com
+  jitter, respeitando o Retry-After quando a API o envia. Escritas que
+  não são idempotentes (appendCells, deleteDimension) só são repetidas
+  em 429, já que a requisição recusada por cota não foi executada; um
+  5xx pode ter sido aplicado e repetir duplicaria/removeria linhas.
+- Coalescência: leituras idênticas e simultâneas (mesmo método e mesmos
+  argumentos) fazem uma única chamada; as demais esperam e recebem o
+  mesmo resultado (que não deve ser alterado por quem o recebe).
+"""
+import os
+import random
+import threading
+import time
+
+import gspread
+
+from _pacd.log import obter_log
+from _pacd.medicao import fase, registrar_chamada_sheets
+
+
+log = obter_log(__name__)
+
+
+# Cota padrão da API do Sheets por usuário (a Service Account) por minuto
+COTA_LEITURA = int(os.environ.get("PACD_COTA_LEITURA", "60"))
+COTA_ESCRITA = int(os.environ.get("PACD_COTA_ESCRITA", "60"))
+
+TENTATIVAS_MAXIMAS = 5
+ESPERA_BASE = 0.5
+ESPERA_MAXIMA = 32
+
+# Tempo total (segundos) que uma chamada pode passar esperando, para não
+# estourar o limite de execução da função
+ESPERA_TOTAL_MAXIMA = 20
+
+STATUS_REPETIVEIS = (429, 500, 502, 503, 504)
+
+
+class BaldeTokens:
+    """Balde de tokens (seguro entre threads) que reabastece a cota por minuto"""
+
+    def __init__(self, por_minuto, relogio=time.monotonic, dormir=time.sleep):
+        self.capacidade = por_minuto
+        self.taxa = por_minuto / 60
+        self._relogio = relogio
+        self._dormir = dormir
+        self._lock = threading.Lock()
+        self._tokens = float(por_minuto)
+        self._atualizado_em = relogio()
+
+    def retirar(self):
+        """
+        Retira um token, esperando o reabastecimento se o balde estiver vazio
+
+        Returns:
+            float: Segundos esperados
+        """
+        if self.capacidade <= 0:
+            return 0.0
+
+        esperado = 0.0
+        while True:
+            with self._lock:
+                agora = self._relogio()
+                self._tokens = min(self.capacidade, self._tokens + (agora - self._atualizado_em) * self.taxa)
+                self._atualizado_em = agora
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return esperado
+
+                espera = (1 - self._tokens) / self.taxa
+
+            self._dormir(espera)
+            esperado += espera
+
+
+balde_leitura = BaldeTokens(COTA_LEITURA)
+balde_escrita = BaldeTokens(COTA_ESCRITA)
+
+
+class _Voo:
+    """Leitura em andamento compartilhada pelas requisições que a aguardam"""
+
+    def __init__(self):
+        self.evento = threading.Event()
+        self.resultado = None
+        self.erro = None
+
+
+_lock_voos = threading.Lock()
+_voos = {}
+
+
+def _status(erro):
+    """Status HTTP de um erro da API, ou None se não for uma resposta da API"""
+    if isinstance(erro, gspread.exceptions.APIError):
+        return erro.response.status_code
+    return None
+
+
+def _retry_after(erro):
+    """Segundos pedidos no cabeçalho Retry-After, se houver"""
+    try:
+        return float(erro.response.headers.get("Retry-After"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _repetivel(erro, idempotente):
+    status = _status(erro)
+    if status == 429:
+        return True
+    if not idempotente:
+        return False
+    # Falhas de rede (requests.ConnectionError/Timeout são OSError) também são repetidas
+    return status in STATUS_REPETIVEIS or (status is None and isinstance(erro, OSError))
+
+
+def calcular_espera(tentativa, retry_after=None):
+    """
+    Espera antes da próxima tentativa: exponencial com jitter total
+
+    Args:
+        tentativa: Número da tentativa que falhou (0 para a primeira)
+        retry_after: Valor do Retry-After em segundos (opcional)
+
+    Returns:
+        float: Segundos de espera
+    """
+    espera = random.uniform(0, min(ESPERA_MAXIMA, ESPERA_BASE * 2 ** tentativa))
+    if retry_after is not None:
+        espera = max(espera, retry_after)
+    return espera
+
+
+def _executar(metodo, args, kwargs, balde, idempotente):
+    inicio = time.monotonic()
+    tentativa = 0
+
+    while True:
+        with fase("espera_cota"):
+            balde.retirar()
+        registrar_chamada_sheets()
+        try:
+            with fase("sheets"):
+                return metodo(*args, **kwargs)
+        except Exception as e:
+            tentativa += 1
+            if tentativa >= TENTATIVAS_MAXIMAS or not _repetivel(e, idempotente):
+                raise
+
+            espera = calcular_espera(tentativa - 1, _retry_after(e))
+            if time.monotonic() - inicio + espera > ESPERA_TOTAL_MAXIMA:
+                raise
+
+            log.aviso(
+                "⏳ Sheets respondeu %s, nova tentativa em %.1fs (%d/%d)",
+                _status(e) or type(e).__name__, espera, tentativa, TENTATIVAS_MAXIMAS - 1
+            )
+            with fase("espera_cota"):
+                time.sleep(espera)
+
+
+def _coalescer(chave, executar):
+    with _lock_voos:
+        voo = _voos.get(chave)
+        lider = voo is None
+        if lider:
+            voo = _voos[chave] = _Voo()
+
+    if not lider:
+        voo.evento.wait()
+        if voo.erro is not None:
+            raise voo.erro
+        return voo.resultado
+
+    try:
+        voo.resultado = executar()
+        return voo.resultado
+    except Exception as e:
+        voo.erro = e
+        raise
+    finally:
+        with _lock_voos:
+            _voos.pop(chave, None)
+        voo.evento.set()
+
+
+def chamar_sheets(metodo, *args, escrita=False, idempotente=None, **kwargs):
+    """
+    Executa uma chamada à API do Sheets respeitando a cota
+
+    Args:
+        metodo: Método do gspread (ex.: planilha.values_batch_get)
+        args, kwargs: Argumentos do método
+        escrita: True para chamadas que alteram a planilha (cota de escrita)
+        idempotente: Se a chamada pode ser repetida após um 5xx/erro de
+            rede; padrão: leituras sim, escritas não
+
+    Returns:
+        Retorno do método
+    """
+    if idempotente is None:
+        idempotente = not escrita
+
+    balde = balde_escrita if escrita else balde_leitura
+
+    def executar():
+        return _executar(metodo, args, kwargs, balde, idempotente)
+
+    if escrita:
+        return executar()
+
+    chave = (
+        getattr(getattr(metodo, "__self__", None), "id", None),
+        getattr(metodo, "__qualname__", repr(metodo)),
+        repr(args),
+        repr(sorted(kwargs.items()))
+    )
+    return _coalescer(chave, executar)
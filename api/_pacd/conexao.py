@@ -0,0 +1,126 @@
+"""
+Conexão compartilhada com o Google Sheets
+
+As credenciais, a sessão HTTP autorizada e o cliente gspread ficam em
+nível de módulo. Enquanto a instância serverless estiver "quente", as
+próximas requisições reaproveitam o token OAuth e a conexão keep-alive
+em vez de refazer a troca de token e o handshake TLS.
+"""
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+
+import gspread
+from google.auth.transport.requests import AuthorizedSession, Request
+from google.oauth2.service_account import Credentials
+from requests.adapters import HTTPAdapter
+
+from _pacd.log import obter_log
+from _pacd.medicao import fase, registrar_resposta_http
+
+
+log = obter_log(__name__)
+
+
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive"
+]
+
+SPREADSHEET_NAME = "PACD_DADOS_DEV"
+
+# Renova o token um pouco antes de expirar para não pagar a renovação
+# no meio de uma requisição
+MARGEM_RENOVACAO_TOKEN = timedelta(minutes=5)
+
+# Conexões mantidas abertas com os hosts do Google (sheets, drive, oauth2)
+TAMANHO_POOL_CONEXOES = 10
+
+_lock = threading.Lock()
+_credenciais = None
+_requisicao_token = None
+_sessao = None
+_cliente = None
+
+
+def get_google_credentials():
+    """Cria credenciais do Google a partir de variáveis de ambiente"""
+    return Credentials.from_service_account_info(
+        {
+            "type": os.environ.get("GOOGLE_TYPE", "service_account"),
+            "project_id": os.environ["GOOGLE_PROJECT_ID"],
+            "private_key_id": os.environ["GOOGLE_PRIVATE_KEY_ID"],
+            "private_key": os.environ["GOOGLE_PRIVATE_KEY"].replace("\\n", "\n"),
+            "client_email": os.environ["GOOGLE_CLIENT_EMAIL"],
+            "client_id": os.environ["GOOGLE_CLIENT_ID"],
+            "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+            "token_uri": "https://oauth2.googleapis.com/token",
+            "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
+            "client_x509_cert_url": f"https://www.googleapis.com/robot/v1/metadata/x509/{os.environ['GOOGLE_CLIENT_EMAIL']}",
+        },
+        scopes=SCOPES
+    )
+
+
+def _criar_sessao(credenciais, requisicao_token):
+    """Cria a sessão autorizada com pool de conexões keep-alive"""
+    sessao = AuthorizedSession(credenciais, auth_request=requisicao_token)
+    adaptador = HTTPAdapter(
+        pool_connections=TAMANHO_POOL_CONEXOES,
+        pool_maxsize=TAMANHO_POOL_CONEXOES
+    )
+    sessao.mount("https://", adaptador)
+    # Conta chamadas e bytes na medição da requisição em andamento
+    sessao.hooks["response"].append(registrar_resposta_http)
+    return sessao
+
+
+def _token_expirando(credenciais):
+    """Indica se o token ainda não existe ou expira dentro da margem"""
+    if not credenciais.token or credenciais.expiry is None:
+        return True
+
+    # google-auth trabalha com datetimes UTC sem timezone
+    agora = datetime.now(timezone.utc).replace(tzinfo=None)
+    return credenciais.expiry - agora <= MARGEM_RENOVACAO_TOKEN
+
+
+@fase("credenciais")
+def obter_cliente():
+    """
+    Retorna o cliente gspread compartilhado pela instância
+
+    Na primeira chamada cria credenciais, sessão e cliente. Nas seguintes
+    apenas renova o token quando ele está perto de expirar.
+
+    Returns:
+        gspread.Client: Cliente autorizado
+    """
+    global _credenciais, _requisicao_token, _sessao, _cliente
+
+    with _lock:
+        if _cliente is None:
+            log.info("🔑 Criando cliente gspread compartilhado...")
+            _credenciais = get_google_credentials()
+            _requisicao_token = Request()
+            _sessao = _criar_sessao(_credenciais, _requisicao_token)
+            _cliente = gspread.authorize(_credenciais, session=_sessao)
+
+        if _token_expirando(_credenciais):
+            log.info("🔄 Renovando token do Google...")
+            _credenciais.refresh(_requisicao_token)
+
+        return _cliente
+
+
+def descartar_cliente():
+    """Descarta o cliente compartilhado (ex.: após erro de autenticação)"""
+    global _credenciais, _requisicao_token, _sessao, _cliente
+
+    with _lock:
+        if _sessao is not None:
+            _sessao.close()
+        _credenciais = None
+        _requisicao_token = None
+        _sessao = None
+        _cliente = None
@@ -0,0 +1,216 @@
+"""
+Filtros, projeção de campos e paginação da listagem de exercícios
+
+Aplicados sobre o payload já montado (e possivelmente em cache), antes da
+serialização. Nada aqui altera a lista recebida: os itens projetados são
+dicionários novos, e sem projeção os próprios itens do cache são apenas
+referenciados.
+
+A paginação é por chave (keyset): com limit ou cursor, as atividades vêm
+ordenadas pelo tempo do ID (chave_ordenacao de _pacd.ids) e o cursor guarda
+a chave do último item da página; a próxima começa logo depois dela, então
+inclusões e exclusões entre uma página e outra não repetem nem pulam itens,
+o que um deslocamento faria. IDs legados se repetem (só têm a hora do dia),
+por isso a chave leva também a ocorrência do ID entre os iguais.
+"""
+import base64
+import binascii
+import bisect
+import json
+
+from _pacd.ids import chave_ordenacao
+
+
+LIMITE_PADRAO = None
+LIMITE_MAXIMO = 500
+
+
+def _valores(var_dicParametros, nome):
+    """Valores de um parâmetro, aceitando repetição (?tipo=a&tipo=b) e vírgulas"""
+    var_listValores = []
+    for var_strValor in var_dicParametros.get(nome, []):
+        var_listValores.extend(v.strip() for v in var_strValor.split(",") if v.strip())
+    return var_listValores
+
+
+def _normalizar(valor):
+    """Comparação sem diferenciar maiúsculas/minúsculas"""
+    return str(valor).strip().casefold()
+
+
+def codificar_cursor(id_atividade, ocorrencia=0):
+    """Cursor opaco para a página que começa depois do item informado"""
+    var_dicCursor = {"id": str(id_atividade), "n": ocorrencia}
+    return base64.urlsafe_b64encode(json.dumps(var_dicCursor).encode()).decode().rstrip("=")
+
+
+def decodificar_cursor(cursor):
+    """
+    Chave de paginação a partir do cursor
+
+    Returns:
+        tuple: (chave_ordenacao do ID, ocorrência do ID entre os iguais)
+
+    Raises:
+        ValueError: Se o cursor for inválido
+    """
+    try:
+        var_dicCursor = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        id_atividade = var_dicCursor["id"]
+        ocorrencia = var_dicCursor.get("n", 0)
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError, AttributeError):
+        raise ValueError("cursor inválido")
+
+    if not isinstance(id_atividade, str) or not id_atividade:
+        raise ValueError("cursor inválido")
+    if not isinstance(ocorrencia, int) or isinstance(ocorrencia, bool) or ocorrencia < 0:
+        raise ValueError("cursor inválido")
+    return chave_ordenacao(id_atividade), ocorrencia
+
+
+def ordenar_para_paginacao(var_listAtividades):
+    """
+    Ordena as atividades pelo tempo do ID, com a chave de cada uma
+
+    A ordenação é estável: IDs iguais (legados repetidos) mantêm a ordem
+    das linhas e são desempatados pela ocorrência.
+
+    Returns:
+        tuple: (lista ordenada, [(chave_ordenacao do ID, ocorrência), ...])
+    """
+    var_listChaves = [chave_ordenacao(atividade.get("ID_ATIVIDADE", "")) for atividade in var_listAtividades]
+    var_listOrdem = sorted(range(len(var_listAtividades)), key=var_listChaves.__getitem__)
+
+    var_listPares = []
+    for i in var_listOrdem:
+        chave = var_listChaves[i]
+        ocorrencia = var_listPares[-1][1] + 1 if var_listPares and var_listPares[-1][0] == chave else 0
+        var_listPares.append((chave, ocorrencia))
+
+    return [var_listAtividades[i] for i in var_listOrdem], var_listPares
+
+
+def ler_consulta(var_dicParametros):
+    """
+    Valida os parâmetros da query string da listagem
+
+    Args:
+        var_dicParametros: Resultado de parse_qs() da URL
+
+    Returns:
+        dict: tipo, area, materia (listas), campos (lista ou None), limite
+            (int ou None) e apos (chave do cursor ou None)
+
+    Raises:
+        ValueError: Se limit ou cursor forem inválidos
+    """
+    var_strLimite = var_dicParametros.get("limit", [None])[0]
+    limite = LIMITE_PADRAO
+    if var_strLimite not in (None, ""):
+        if not var_strLimite.isdecimal() or not 1 <= int(var_strLimite) <= LIMITE_MAXIMO:
+            raise ValueError(f"limit deve ser um inteiro entre 1 e {LIMITE_MAXIMO}")
+        limite = int(var_strLimite)
+
+    var_strCursor = var_dicParametros.get("cursor", [""])[0]
+
+    return {
+        "tipo": _valores(var_dicParametros, "tipo"),
+        "area": _valores(var_dicParametros, "area"),
+        "materia": _valores(var_dicParametros, "materia"),
+        "campos": _valores(var_dicParametros, "fields") or None,
+        "limite": limite,
+        "apos": decodificar_cursor(var_strCursor) if var_strCursor else None
+    }
+
+
+def _info_confere(var_listInfo, campo, var_setValores):
+    """Indica se algum item de INFO tem o campo com um dos valores pedidos"""
+    return any(_normalizar(item.get(campo, "")) in var_setValores for item in var_listInfo)
+
+
+def filtrar_exercicios(var_listAtividades, tipo=(), area=(), materia=()):
+    """
+    Filtra atividades por TIPO e pela AREA/MATERIA dos registros em INFO
+
+    Uma atividade entra quando pelo menos um registro em INFO confere;
+    INFO e os totais são mantidos completos.
+
+    Returns:
+        list: Nova lista com as atividades que passam em todos os filtros
+    """
+    var_setTipos = {_normalizar(v) for v in tipo}
+    var_setAreas = {_normalizar(v) for v in area}
+    var_setMaterias = {_normalizar(v) for v in materia}
+
+    return [
+        atividade for atividade in var_listAtividades
+        if (not var_setTipos or _normalizar(atividade.get("TIPO", "")) in var_setTipos)
+        and (not var_setAreas or _info_confere(atividade.get("INFO", []), "AREA", var_setAreas))
+        and (not var_setMaterias or _info_confere(atividade.get("INFO", []), "MATERIA", var_setMaterias))
+    ]
+
+
+def projetar(var_listAtividades, var_listCampos):
+    """
+    Mantém só os campos pedidos em fields=
+
+    Campos de INFO são pedidos com prefixo: fields=ID_ATIVIDADE,INFO.AREA.
+    Pedir INFO sem prefixo devolve os registros completos.
+
+    Returns:
+        list: Novos dicionários com os campos selecionados
+    """
+    var_listTopo = [c for c in var_listCampos if "." not in c]
+    var_listInfo = [c.split(".", 1)[1] for c in var_listCampos if c.startswith("INFO.")]
+
+    var_listProjetada = []
+    for atividade in var_listAtividades:
+        var_dicItem = {c: atividade[c] for c in var_listTopo if c in atividade}
+        if var_listInfo and "INFO" not in var_dicItem:
+            var_dicItem["INFO"] = [
+                {c: item[c] for c in var_listInfo if c in item}
+                for item in atividade.get("INFO", [])
+            ]
+        var_listProjetada.append(var_dicItem)
+
+    return var_listProjetada
+
+
+def aplicar_consulta(var_listAtividades, consulta):
+    """
+    Aplica filtros, paginação e projeção, nesta ordem
+
+    Sem limit nem cursor, a lista filtrada mantém a ordem do payload; com
+    eles, as páginas seguem a ordem de ordenar_para_paginacao().
+
+    Args:
+        var_listAtividades: Payload completo de montar_exercicios() (não é alterado)
+        consulta: Resultado de ler_consulta()
+
+    Returns:
+        tuple: (página, total após os filtros, cursor da próxima página ou None)
+    """
+    var_listFiltrada = filtrar_exercicios(
+        var_listAtividades, consulta["tipo"], consulta["area"], consulta["materia"]
+    )
+    total = len(var_listFiltrada)
+
+    if consulta["limite"] is None and consulta["apos"] is None:
+        var_listPagina, proximo_cursor = var_listFiltrada, None
+    else:
+        var_listOrdenada, var_listPares = ordenar_para_paginacao(var_listFiltrada)
+
+        # O item do cursor pode ter sido excluído: a página começa na primeira chave posterior
+        inicio = 0 if consulta["apos"] is None else bisect.bisect_right(var_listPares, consulta["apos"])
+        fim = total if consulta["limite"] is None else inicio + consulta["limite"]
+        var_listPagina = var_listOrdenada[inicio:fim]
+
+        proximo_cursor = None
+        if fim < total:
+            ocorrencia = var_listPares[fim - 1][1]
+            proximo_cursor = codificar_cursor(var_listPagina[-1].get("ID_ATIVIDADE", ""), ocorrencia)
+
+    if consulta["campos"]:
+        var_listPagina = projetar(var_listPagina, consulta["campos"])
+
+    return var_listPagina, total, proximo_cursor
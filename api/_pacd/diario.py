@@ -0,0 +1,324 @@
+"""
+Diário de gravação (write-behind) em SQLite
+
+Com PACD_ESCRITA_DIFERIDA ativo, as linhas a acrescentar são gravadas
+primeiro em um diário SQLite (modo WAL, synchronous=FULL) e a requisição
+é respondida logo em seguida. Um descarregador junta as entradas
+pendentes, na ordem em que chegaram, e grava tudo com um único
+batchUpdate (acrescentar_linhas); só então as entradas saem do diário.
+
+- Ordem: entradas são descarregadas sempre a partir da mais antiga. Se um
+  lote falha, a entrada mais antiga passa a ser enviada sozinha até ser
+  gravada; depois de MAX_TENTATIVAS tentativas, ela vai para a tabela
+  'descartadas' (com o último erro) e deixa de bloquear as seguintes.
+- Atomicidade: cada entrada (ex.: atividade + registro derivado) vai
+  inteira no mesmo batchUpdate.
+- Recuperação: entradas pendentes são reenviadas no próximo uso do
+  diário. Um lote que já foi tentado pode ter chegado ao Sheets antes de
+  uma queda; nesse caso os IDs (coluna A) já gravados são pulados.
+
+O diário fica no disco local da instância (PACD_DIARIO, padrão em /tmp):
+sobrevive a reinícios do processo, mas não à troca de instância. Uma
+gravação confirmada ao usuário e ainda pendente se perde se a instância
+for reciclada antes da descarga.
+
+Ler e excluir chamam sincronizar_diario() antes, mas uma falha na
+descarga só é registrada no log: a leitura segue sem as pendências.
+"""
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from _pacd.armazenamento import obter_armazenamento
+from _pacd.cache import invalidar_listagens
+from _pacd.escrita import acrescentar_linhas
+from _pacd.indice import ler_colunas_ids
+from _pacd.log import obter_log, resumir
+
+
+log = obter_log(__name__)
+
+
+ESCRITA_DIFERIDA = os.environ.get("PACD_ESCRITA_DIFERIDA", "").lower() in ("1", "true", "sim")
+CAMINHO_DIARIO = os.environ.get("PACD_DIARIO", os.path.join(tempfile.gettempdir(), "pacd_diario.sqlite3"))
+
+# Espera antes de descarregar, para juntar gravações em rajada
+JANELA_DESCARGA = 0.5
+
+# Máximo de entradas por batchUpdate
+MAX_ENTRADAS_LOTE = 200
+
+# Tempo máximo (segundos) que um processo pode segurar a descarga
+DURACAO_TRAVA = 60
+
+# Tentativas de uma entrada antes de ir para 'descartadas'
+MAX_TENTATIVAS = 5
+
+
+class DiarioEscrita:
+    """Fila durável de linhas a acrescentar na planilha"""
+
+    def __init__(self, caminho=CAMINHO_DIARIO):
+        self.caminho = caminho
+        self._lock = threading.Lock()
+        self._lock_descarga = threading.Lock()
+        self._conexao = None
+        self._dono = f"{os.getpid()}:{id(self)}"
+
+    def _conectar(self):
+        if self._conexao is None:
+            os.makedirs(os.path.dirname(self.caminho) or ".", exist_ok=True)
+            conexao = sqlite3.connect(self.caminho, timeout=30, isolation_level=None, check_same_thread=False)
+            conexao.execute("PRAGMA journal_mode=WAL")
+            conexao.execute("PRAGMA synchronous=FULL")
+            conexao.execute(
+                "CREATE TABLE IF NOT EXISTS pendentes ("
+                " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " criado_em REAL NOT NULL,"
+                " linhas TEXT NOT NULL,"
+                " tentativas INTEGER NOT NULL DEFAULT 0,"
+                " erro TEXT)"
+            )
+            conexao.execute(
+                "CREATE TABLE IF NOT EXISTS descartadas ("
+                " seq INTEGER PRIMARY KEY,"
+                " criado_em REAL NOT NULL,"
+                " linhas TEXT NOT NULL,"
+                " tentativas INTEGER NOT NULL,"
+                " erro TEXT,"
+                " descartada_em REAL NOT NULL)"
+            )
+            conexao.execute("CREATE TABLE IF NOT EXISTS trava (id INTEGER PRIMARY KEY CHECK (id = 1), dono TEXT, expira_em REAL)")
+            conexao.execute("INSERT OR IGNORE INTO trava (id, dono, expira_em) VALUES (1, NULL, 0)")
+            self._conexao = conexao
+        return self._conexao
+
+    def registrar(self, linhas_por_aba):
+        """
+        Grava uma entrada no diário (confirmada em disco ao retornar)
+
+        Args:
+            linhas_por_aba: {nome da aba: [linha, ...]}, como em acrescentar_linhas()
+
+        Returns:
+            int: Número de sequência da entrada
+        """
+        with self._lock:
+            cursor = self._conectar().execute(
+                "INSERT INTO pendentes (criado_em, linhas) VALUES (?, ?)",
+                (time.time(), json.dumps(linhas_por_aba))
+            )
+            return cursor.lastrowid
+
+    def pendentes(self):
+        """Quantidade de entradas ainda não gravadas na planilha"""
+        with self._lock:
+            return self._conectar().execute("SELECT COUNT(*) FROM pendentes").fetchone()[0]
+
+    def descartadas(self):
+        """Quantidade de entradas que esgotaram as tentativas (não serão reenviadas)"""
+        with self._lock:
+            return self._conectar().execute("SELECT COUNT(*) FROM descartadas").fetchone()[0]
+
+    def _travar(self):
+        """Garante que só um processo descarrega por vez (trava com validade)"""
+        agora = time.time()
+        with self._lock:
+            cursor = self._conectar().execute(
+                "UPDATE trava SET dono = ?, expira_em = ? WHERE id = 1 AND (dono IS NULL OR expira_em < ?)",
+                (self._dono, agora + DURACAO_TRAVA, agora)
+            )
+            return cursor.rowcount == 1
+
+    def _destravar(self):
+        with self._lock:
+            self._conectar().execute("UPDATE trava SET dono = NULL, expira_em = 0 WHERE id = 1 AND dono = ?", (self._dono,))
+
+    def _descartar(self, seq, erro):
+        """Move a entrada para 'descartadas' (fora da fila de descarga)"""
+        with self._lock:
+            conexao = self._conectar()
+            conexao.execute("BEGIN IMMEDIATE")
+            try:
+                conexao.execute(
+                    "INSERT INTO descartadas (seq, criado_em, linhas, tentativas, erro, descartada_em)"
+                    " SELECT seq, criado_em, linhas, tentativas, ?, ? FROM pendentes WHERE seq = ?",
+                    (erro, time.time(), seq)
+                )
+                conexao.execute("DELETE FROM pendentes WHERE seq = ?", (seq,))
+                conexao.execute("COMMIT")
+            except BaseException:
+                conexao.execute("ROLLBACK")
+                raise
+
+    def _descarregar_lote(self):
+        """Grava o lote mais antigo; retorna quantas entradas saíram do diário"""
+        with self._lock:
+            conexao = self._conectar()
+            # Depois de uma falha, a entrada mais antiga vai sozinha até ser
+            # gravada ou descartada: uma entrada rejeitada não trava as demais
+            primeira = conexao.execute("SELECT erro FROM pendentes ORDER BY seq LIMIT 1").fetchone()
+            if primeira is None:
+                return 0
+            lote = 1 if primeira[0] is not None else MAX_ENTRADAS_LOTE
+            entradas = conexao.execute(
+                "SELECT seq, linhas, tentativas FROM pendentes ORDER BY seq LIMIT ?", (lote,)
+            ).fetchall()
+
+            # A tentativa é registrada antes da chamada: após uma queda, o lote é conferido
+            sequencias = [seq for seq, _, _ in entradas]
+            conexao.executemany("UPDATE pendentes SET tentativas = tentativas + 1 WHERE seq = ?", [(seq,) for seq in sequencias])
+
+        linhas_por_aba = {}
+        for _, linhas, _ in entradas:
+            for nome_aba, linhas_aba in json.loads(linhas).items():
+                linhas_por_aba.setdefault(nome_aba, []).extend(linhas_aba)
+
+        try:
+            if any(tentativas for _, _, tentativas in entradas):
+                linhas_por_aba = _sem_ids_gravados(linhas_por_aba)
+            acrescentar_linhas(linhas_por_aba)
+        except Exception as e:
+            # Só a mais antiga é marcada: ela vai sozinha na próxima descarga
+            seq, linhas, tentativas = entradas[0]
+            with self._lock:
+                self._conectar().execute("UPDATE pendentes SET erro = ? WHERE seq = ?", (str(e), seq))
+
+            if len(entradas) == 1 and tentativas + 1 >= MAX_TENTATIVAS:
+                self._descartar(seq, str(e))
+                log.erro(
+                    "☠️ Diário: entrada %s descartada após %d tentativas: %s", seq, tentativas + 1, e,
+                    linhas=resumir(json.loads(linhas))
+                )
+                return 1
+            raise
+
+        with self._lock:
+            self._conectar().executemany("DELETE FROM pendentes WHERE seq = ?", [(seq,) for seq in sequencias])
+
+        invalidar_listagens()
+        log.info("✅ Diário: %d entrada(s) gravada(s) na planilha", len(entradas))
+        return len(entradas)
+
+    def descarregar(self):
+        """
+        Grava na planilha todas as entradas pendentes, em ordem
+
+        Returns:
+            int: Entradas que saíram do diário, gravadas ou descartadas
+                (0 se outro processo está descarregando)
+        """
+        # Uma descarga por vez no processo (thread em segundo plano x sincronizar_diario)
+        with self._lock_descarga:
+            if not self._travar():
+                return 0
+
+            try:
+                total = 0
+                while True:
+                    gravadas = self._descarregar_lote()
+                    if not gravadas:
+                        return total
+                    total += gravadas
+            finally:
+                self._destravar()
+
+
+def _sem_ids_gravados(linhas_por_aba):
+    """Remove as linhas cujo ID (coluna A) já está na planilha"""
+    abas = [nome_aba for nome_aba, linhas in linhas_por_aba.items() if linhas]
+    if not abas:
+        return linhas_por_aba
+
+    colunas = ler_colunas_ids(*abas)
+    filtradas = {}
+    for nome_aba, linhas in linhas_por_aba.items():
+        gravados = set(colunas.get(nome_aba, []))
+        filtradas[nome_aba] = [linha for linha in linhas if str(linha[0]) not in gravados]
+        if len(filtradas[nome_aba]) < len(linhas):
+            log.info("♻️ Diário: %d linha(s) já gravada(s) em '%s'", len(linhas) - len(filtradas[nome_aba]), nome_aba)
+    return filtradas
+
+
+diario_escrita = DiarioEscrita()
+
+_lock_descarregador = threading.Lock()
+_descarregador = None
+
+
+def _executar_descarregador():
+    global _descarregador
+
+    time.sleep(JANELA_DESCARGA)
+    try:
+        diario_escrita.descarregar()
+    except Exception as e:
+        log.aviso("⚠️ Diário: descarga falhou, nova tentativa na próxima gravação: %s", e)
+    finally:
+        with _lock_descarregador:
+            _descarregador = None
+
+
+def agendar_descarga():
+    """Inicia o descarregador em segundo plano, se ainda não estiver rodando"""
+    global _descarregador
+
+    with _lock_descarregador:
+        if _descarregador is None:
+            _descarregador = threading.Thread(target=_executar_descarregador, daemon=True)
+            _descarregador.start()
+
+
+def gravar_linhas(linhas_por_aba):
+    """
+    Acrescenta linhas no armazenamento, direto ou pelo diário (PACD_ESCRITA_DIFERIDA)
+
+    O diário só é usado com o Google Sheets; o SQLite local grava direto.
+
+    Args:
+        linhas_por_aba: {nome da aba: [linha, ...]}
+
+    Returns:
+        bool: True se a gravação ficou pendente no diário
+    """
+    armazenamento = obter_armazenamento()
+    if not (ESCRITA_DIFERIDA and armazenamento.remoto):
+        armazenamento.acrescentar_lote(linhas_por_aba)
+        invalidar_listagens()
+        return False
+
+    seq = diario_escrita.registrar(linhas_por_aba)
+    log.debug("📒 Diário: entrada %s registrada, gravação na planilha em segundo plano", seq)
+    agendar_descarga()
+    return True
+
+
+def sincronizar_diario():
+    """
+    Grava agora o que estiver pendente no diário
+
+    Chamado antes de ler ou excluir, para que a requisição veja as
+    gravações já confirmadas ao usuário. Uma falha na descarga não impede
+    a leitura/exclusão: é registrada e a entrada segue no diário (até
+    MAX_TENTATIVAS, ver DiarioEscrita).
+    """
+    if not ESCRITA_DIFERIDA:
+        return
+    try:
+        if diario_escrita.pendentes():
+            diario_escrita.descarregar()
+    except Exception as e:
+        log.aviso("⚠️ Diário: descarga antes da leitura falhou, seguindo sem as pendências: %s", e)
+
+
+# Entradas que ficaram pendentes em um processo anterior são reenviadas
+if ESCRITA_DIFERIDA:
+    try:
+        if diario_escrita.pendentes():
+            log.info("📒 Diário: entradas pendentes encontradas, agendando descarga")
+            agendar_descarga()
+    except sqlite3.Error as e:
+        log.aviso("⚠️ Diário indisponível: %s", e)
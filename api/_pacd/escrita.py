@@ -0,0 +1,142 @@
+"""
+Gravação e exclusão em lote na planilha
+
+Cada append_row()/delete_rows() é uma requisição separada. Aqui as linhas
+de várias abas viram requests appendCells (ou deleteDimension) de um único
+spreadsheets.batchUpdate, que o Sheets aplica de forma atômica: ou todas
+as alterações são feitas, ou nenhuma.
+"""
+from _pacd.chamadas import chamar_sheets
+from _pacd.indice import registrar_exclusao, registrar_insercao
+from _pacd.log import obter_log
+from _pacd.planilha import obter_aba, obter_planilha
+
+
+log = obter_log(__name__)
+
+
+def _celula(valor):
+    """CellData equivalente a um valor gravado com append_row() (RAW)"""
+    if valor is None or valor == "":
+        return {}
+    if isinstance(valor, bool):
+        return {"userEnteredValue": {"boolValue": valor}}
+    if isinstance(valor, (int, float)):
+        return {"userEnteredValue": {"numberValue": valor}}
+    return {"userEnteredValue": {"stringValue": str(valor)}}
+
+
+def requisicao_append_cells(nome_aba, linhas):
+    """
+    Monta o request appendCells de uma aba
+
+    Args:
+        nome_aba: Nome da aba (ex.: 'atividades')
+        linhas: Lista de linhas (listas de valores)
+
+    Returns:
+        dict: Request para spreadsheets.batchUpdate
+    """
+    return {
+        "appendCells": {
+            "sheetId": obter_aba(nome_aba).id,
+            "rows": [{"values": [_celula(valor) for valor in linha]} for linha in linhas],
+            "fields": "userEnteredValue"
+        }
+    }
+
+
+def acrescentar_linhas(linhas_por_aba):
+    """
+    Acrescenta linhas em uma ou mais abas com um único batchUpdate atômico
+
+    Args:
+        linhas_por_aba: {nome da aba: [linha, ...]}, na ordem de gravação
+
+    Returns:
+        dict: Resposta do batchUpdate
+    """
+    requisicoes = [
+        requisicao_append_cells(nome_aba, linhas)
+        for nome_aba, linhas in linhas_por_aba.items() if linhas
+    ]
+    if not requisicoes:
+        return {}
+
+    log.debug("💾 batchUpdate com appendCells em %d aba(s)", len(requisicoes))
+    resposta = chamar_sheets(obter_planilha().batch_update, {"requests": requisicoes}, escrita=True)
+
+    for nome_aba, linhas in linhas_por_aba.items():
+        registrar_insercao(nome_aba, [linha[0] for linha in linhas])
+
+    return resposta
+
+
+def agrupar_intervalos(linhas):
+    """
+    Junta linhas consecutivas em intervalos, do último para o primeiro
+
+    Args:
+        linhas: Números de linha (1-based), em qualquer ordem
+
+    Returns:
+        list: [(primeira, última), ...] em ordem decrescente
+    """
+    intervalos = []
+    for linha in sorted(set(linhas), reverse=True):
+        if intervalos and intervalos[-1][0] == linha + 1:
+            intervalos[-1] = (linha, intervalos[-1][1])
+        else:
+            intervalos.append((linha, linha))
+    return intervalos
+
+
+def requisicoes_delete_dimension(nome_aba, linhas):
+    """
+    Monta os requests deleteDimension de uma aba
+
+    Os intervalos vão de baixo para cima, para que cada exclusão não
+    desloque as linhas das exclusões seguintes.
+
+    Returns:
+        list: Requests para spreadsheets.batchUpdate
+    """
+    id_aba = obter_aba(nome_aba).id
+    return [
+        {
+            "deleteDimension": {
+                "range": {
+                    "sheetId": id_aba,
+                    "dimension": "ROWS",
+                    "startIndex": primeira - 1,
+                    "endIndex": ultima
+                }
+            }
+        }
+        for primeira, ultima in agrupar_intervalos(linhas)
+    ]
+
+
+def excluir_linhas(linhas_por_aba):
+    """
+    Exclui linhas de uma ou mais abas com um único batchUpdate atômico
+
+    Args:
+        linhas_por_aba: {nome da aba: [número da linha (1-based), ...]}
+
+    Returns:
+        dict: Resposta do batchUpdate
+    """
+    requisicoes = []
+    for nome_aba, linhas in linhas_por_aba.items():
+        requisicoes.extend(requisicoes_delete_dimension(nome_aba, linhas))
+    if not requisicoes:
+        return {}
+
+    log.debug("💾 batchUpdate com %d deleteDimension", len(requisicoes))
+    resposta = chamar_sheets(obter_planilha().batch_update, {"requests": requisicoes}, escrita=True)
+
+    for nome_aba, linhas in linhas_por_aba.items():
+        registrar_exclusao(nome_aba, linhas)
+
+    return resposta
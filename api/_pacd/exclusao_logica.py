@@ -0,0 +1,108 @@
+"""
+Exclusão lógica (tombstones) e compactação
+
+Com PACD_EXCLUSAO_LOGICA ativo, excluir um registro só reescreve a
+célula do ID (coluna A) como 'EXCLUIDO:<id>': uma única célula, sem
+deslocar as linhas de baixo. As listagens ignoram essas linhas e a
+compactação (compactar_exclusoes) remove-as fisicamente depois, em lotes.
+"""
+import os
+
+from gspread.utils import absolute_range_name
+
+from _pacd.chamadas import chamar_sheets
+from _pacd.escrita import excluir_linhas
+from _pacd.ids import MARCA_EXCLUSAO
+from _pacd.indice import ler_colunas_ids
+from _pacd.log import obter_log
+from _pacd.planilha import obter_planilha
+
+
+log = obter_log(__name__)
+
+
+EXCLUSAO_LOGICA = os.environ.get("PACD_EXCLUSAO_LOGICA", "").lower() in ("1", "true", "sim")
+
+# Abas verificadas pela compactação
+ABAS_COMPACTACAO = ["atividades", "simulados", "questoes", "redacoes"]
+
+# Máximo de linhas removidas por batchUpdate na compactação
+LOTE_COMPACTACAO = 500
+
+
+def esta_excluido(id_registro):
+    """Indica se o valor da coluna A é um tombstone"""
+    return isinstance(id_registro, str) and id_registro.startswith(MARCA_EXCLUSAO)
+
+
+def marcar_excluidos(ids_por_aba):
+    """
+    Marca linhas como excluídas reescrevendo a célula do ID
+
+    Args:
+        ids_por_aba: {nome da aba: {número da linha: ID atual}}
+
+    Returns:
+        dict: Resposta do values:batchUpdate
+    """
+    dados = [
+        {
+            "range": absolute_range_name(nome_aba, f"A{linha}"),
+            "values": [[f"{MARCA_EXCLUSAO}{id_registro}"]]
+        }
+        for nome_aba, ids_por_linha in ids_por_aba.items()
+        for linha, id_registro in sorted(ids_por_linha.items())
+    ]
+    if not dados:
+        return {}
+
+    log.debug("🪦 Marcando %d linha(s) como excluída(s)", len(dados))
+    # Gravar o mesmo valor de novo não muda nada: pode ser repetido após 5xx
+    return chamar_sheets(
+        obter_planilha().values_batch_update,
+        {"valueInputOption": "RAW", "data": dados},
+        escrita=True,
+        idempotente=True
+    )
+
+
+def compactar_exclusoes(abas=ABAS_COMPACTACAO, lote=LOTE_COMPACTACAO):
+    """
+    Remove fisicamente as linhas marcadas como excluídas
+
+    Cada rodada lê só a coluna A das abas e exclui até `lote` linhas em um
+    batchUpdate, começando pelo fim das abas. Reler a coluna a cada rodada
+    mantém pequena a janela em que outra gravação poderia deslocar linhas.
+
+    Returns:
+        dict: {nome da aba: linhas removidas}
+    """
+    removidas = {nome_aba: 0 for nome_aba in abas}
+
+    while True:
+        colunas = ler_colunas_ids(*abas)
+
+        linhas_por_aba = {}
+        restante = lote
+        for nome_aba in abas:
+            marcadas = [
+                linha for linha, id_registro in enumerate(colunas[nome_aba], start=1)
+                if linha > 1 and esta_excluido(id_registro)
+            ]
+            if marcadas and restante:
+                linhas_por_aba[nome_aba] = marcadas[-restante:]
+                restante -= len(linhas_por_aba[nome_aba])
+
+        if not linhas_por_aba:
+            break
+
+        excluir_linhas(linhas_por_aba)
+        for nome_aba, linhas in linhas_por_aba.items():
+            removidas[nome_aba] += len(linhas)
+
+        # Tudo coube neste lote: não há por que reler as colunas
+        if restante:
+            break
+
+    log.info("✅ Compactação finalizada: %s", removidas)
+    return removidas
@@ -0,0 +1,179 @@
+"""
+Geração e leitura de IDs
+
+Formato atual: [prefixo] + '1' + segundos desde 2024-01-01 (9 dígitos) +
+contador (6 dígitos), por exemplo 1089123456123456 ou SIM1089123456123457.
+
+- Ordenável pelo tempo, tanto como texto quanto como número (largura fixa
+  e sem zero à esquerda, então a planilha e o frontend não o alteram);
+- Monotônico na instância: no mesmo segundo o contador só cresce;
+- Único entre instâncias na prática: o contador começa em um valor
+  aleatório a cada segundo (900 mil possibilidades);
+- Cabe em um número do JavaScript (< 2^53) até 2055.
+
+Formatos legados, ainda aceitos na leitura: atividade 'HHMM' + dígito
+(ex.: 14302) e derivados 'SIM'/'QST'/'RDC' + 'HHMMSS' + dígito.
+"""
+import bisect
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+
+EPOCA = datetime(2024, 1, 1, tzinfo=timezone.utc)
+VERSAO = "1"
+DIGITOS_SEGUNDOS = 9
+DIGITOS_CONTADOR = 6
+LIMITE_CONTADOR = 10 ** DIGITOS_CONTADOR
+
+# Início aleatório do contador a cada segundo; o restante fica para incrementos
+INICIO_MAXIMO_CONTADOR = LIMITE_CONTADOR * 9 // 10
+
+MARCA_EXCLUSAO = "EXCLUIDO:"
+
+_RE_ATUAL = re.compile(rf"^([A-Z]*)({VERSAO}\d{{{DIGITOS_SEGUNDOS}}})(\d{{{DIGITOS_CONTADOR}}})$")
+_RE_LEGADO_ATIVIDADE = re.compile(r"^(\d{1,4})(\d)$")
+_RE_LEGADO_DERIVADO = re.compile(r"^([A-Z]+)(\d{6})(\d)$")
+
+
+class GeradorIds:
+    """Gerador monotônico de IDs (seguro entre threads)"""
+
+    def __init__(self, relogio=time.time, aleatorio=random.SystemRandom()):
+        self._relogio = relogio
+        self._aleatorio = aleatorio
+        self._lock = threading.Lock()
+        self._segundo = -1
+        self._contador = 0
+
+    def proximo(self, prefixo=""):
+        """
+        Gera o próximo ID
+
+        Args:
+            prefixo: Prefixo do tipo de registro (ex.: 'SIM'); vazio para atividades
+
+        Returns:
+            str: ID no formato atual
+        """
+        with self._lock:
+            segundo = int(self._relogio() - EPOCA.timestamp())
+
+            # Relógio parado ou voltando: continua a sequência do último segundo
+            if segundo <= self._segundo:
+                self._contador += 1
+                if self._contador >= LIMITE_CONTADOR:
+                    self._segundo += 1
+                    self._contador = self._aleatorio.randrange(INICIO_MAXIMO_CONTADOR)
+            else:
+                self._segundo = segundo
+                self._contador = self._aleatorio.randrange(INICIO_MAXIMO_CONTADOR)
+
+            return f"{prefixo}{VERSAO}{self._segundo:0{DIGITOS_SEGUNDOS}d}{self._contador:0{DIGITOS_CONTADOR}d}"
+
+
+gerador_ids = GeradorIds()
+
+
+def gerar_id(prefixo=""):
+    """Gera um ID no formato atual com o gerador compartilhado da instância"""
+    return gerador_ids.proximo(prefixo)
+
+
+def interpretar_id(valor):
+    """
+    Lê um ID em qualquer formato (atual ou legado)
+
+    Args:
+        valor: ID como texto ou número
+
+    Returns:
+        dict: prefixo, formato ('atual', 'legado' ou 'desconhecido'),
+            criado_em (datetime UTC, só no formato atual) e hora
+            ('HH:MM' ou 'HH:MM:SS', só nos legados, que não têm data)
+    """
+    texto = str(valor)
+
+    atual = _RE_ATUAL.match(texto)
+    if atual:
+        segundos = int(atual.group(2)[len(VERSAO):])
+        return {
+            "prefixo": atual.group(1),
+            "formato": "atual",
+            "criado_em": EPOCA + timedelta(seconds=segundos),
+            "hora": None
+        }
+
+    legado = _RE_LEGADO_DERIVADO.match(texto)
+    if legado:
+        hhmmss = legado.group(2)
+        return {
+            "prefixo": legado.group(1),
+            "formato": "legado",
+            "criado_em": None,
+            "hora": f"{hhmmss[:2]}:{hhmmss[2:4]}:{hhmmss[4:]}"
+        }
+
+    legado = _RE_LEGADO_ATIVIDADE.match(texto)
+    if legado:
+        # A planilha converte '0930' + dígito em número, perdendo o zero à esquerda
+        hhmm = legado.group(1).zfill(4)
+        return {"prefixo": "", "formato": "legado", "criado_em": None, "hora": f"{hhmm[:2]}:{hhmm[2:]}"}
+
+    return {"prefixo": "", "formato": "desconhecido", "criado_em": None, "hora": None}
+
+
+def chave_ordenacao(valor):
+    """
+    Chave que ordena IDs legados antes dos atuais e os atuais pelo tempo
+
+    Os legados só têm a hora do dia, então ficam ordenados por ela (e pelo
+    texto, no empate) e se repetem de um dia para outro; IDs desconhecidos
+    vêm antes de todos. Tombstones da exclusão lógica mantêm a posição do
+    ID original.
+    """
+    texto = str(valor)
+    if texto.startswith(MARCA_EXCLUSAO):
+        texto = texto[len(MARCA_EXCLUSAO):]
+
+    atual = _RE_ATUAL.match(texto)
+    if atual:
+        return (1, int(atual.group(2) + atual.group(3)), "")
+
+    hora = interpretar_id(texto)["hora"]
+    if hora is None:
+        return (0, -1, texto)
+    segundos = sum(int(parte) * fator for parte, fator in zip(hora.split(":"), (3600, 60, 1)))
+    return (0, segundos, texto)
+
+
+def localizar_ordenado(ids, valor, inicio=0):
+    """
+    Posição de valor em uma coluna de IDs acrescentados em ordem
+
+    IDs no formato atual são procurados por busca binária; se a coluna não
+    estiver ordenada naquele trecho (gravações concorrentes, edição manual)
+    ou o ID for legado, cai para a busca linear.
+
+    Args:
+        ids: Lista de IDs (valores da coluna)
+        valor: ID procurado
+        inicio: Primeira posição considerada (ex.: 1 para pular o cabeçalho)
+
+    Returns:
+        int | None: Posição da primeira ocorrência, ou None
+    """
+    valor = str(valor)
+    chave = chave_ordenacao(valor)
+
+    if chave[0] == 1:
+        posicao = bisect.bisect_left(ids, chave, lo=inicio, key=chave_ordenacao)
+        if posicao < len(ids) and ids[posicao] == valor:
+            return posicao
+
+    try:
+        return ids.index(valor, inicio)
+    except ValueError:
+        return None
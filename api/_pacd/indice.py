@@ -0,0 +1,165 @@
+"""
+Índice ID -> número da linha das abas
+
+Para excluir um registro basta saber em que linha está o ID. Em vez de
+baixar a aba inteira com get_all_values(), só a coluna A é lida e mantida
+em memória pela instância, atualizada a cada inserção e exclusão feitas
+por ela. Como os IDs atuais crescem com o tempo e as linhas são
+acrescentadas no fim, a busca na coluna é binária (ver _pacd.ids).
+
+Outras instâncias podem ter alterado a aba, então a linha encontrada é
+sempre conferida com a leitura de uma única célula antes de ser usada; se
+não conferir, o índice é reconstruído.
+"""
+import threading
+import time
+
+from gspread.utils import absolute_range_name
+
+from _pacd.chamadas import chamar_sheets
+from _pacd.ids import localizar_ordenado
+from _pacd.log import obter_log
+from _pacd.planilha import obter_planilha
+
+
+log = obter_log(__name__)
+
+
+# Tempo (segundos) em que o índice de uma aba é reaproveitado
+TTL_INDICE = 300
+
+_lock = threading.Lock()
+_indices = {}
+
+
+class IndiceAba:
+    """Coluna A de uma aba; a posição i da lista é a linha i + 1 (cabeçalho na linha 1)"""
+
+    def __init__(self, ids):
+        self.carregado_em = time.monotonic()
+        self.ids = list(ids)
+
+    def expirado(self):
+        return time.monotonic() - self.carregado_em > TTL_INDICE
+
+    def linha(self, id_registro):
+        """Linha da primeira ocorrência do ID (ignora o cabeçalho), ou None"""
+        posicao = localizar_ordenado(self.ids, id_registro, inicio=1)
+        return None if posicao is None else posicao + 1
+
+
+def ler_colunas(intervalos):
+    """
+    Lê colunas inteiras de uma ou mais abas, em uma única chamada
+
+    Args:
+        intervalos: Lista de (nome da aba, letra da coluna)
+
+    Returns:
+        dict: {(nome da aba, coluna): [valor por linha, incluindo o cabeçalho]}
+    """
+    planilha = obter_planilha()
+    resposta = chamar_sheets(
+        planilha.values_batch_get,
+        [absolute_range_name(nome, f"{coluna}:{coluna}") for nome, coluna in intervalos],
+        params={"majorDimension": "COLUMNS"}
+    )
+
+    colunas = {}
+    for intervalo, valor_intervalo in zip(intervalos, resposta.get("valueRanges", [])):
+        valores = valor_intervalo.get("values", [])
+        colunas[tuple(intervalo)] = [str(valor) for valor in valores[0]] if valores else []
+    return colunas
+
+
+def ler_colunas_ids(*nomes_abas):
+    """
+    Lê apenas a coluna A (IDs) das abas, em uma única chamada
+
+    Returns:
+        dict: {nome da aba: [valor da coluna A por linha, incluindo o cabeçalho]}
+    """
+    colunas = ler_colunas([(nome, "A") for nome in nomes_abas])
+    return {nome: colunas[(nome, "A")] for nome in nomes_abas}
+
+
+def _carregar_indice(nome_aba):
+    log.debug("🔎 Lendo a coluna de IDs da aba '%s'...", nome_aba)
+    indice = IndiceAba(ler_colunas_ids(nome_aba)[nome_aba])
+    with _lock:
+        _indices[nome_aba] = indice
+    return indice
+
+
+def _obter_indice(nome_aba):
+    """Índice da aba e se ele acabou de ser lido da planilha"""
+    with _lock:
+        indice = _indices.get(nome_aba)
+    if indice is None or indice.expirado():
+        return _carregar_indice(nome_aba), True
+    return indice, False
+
+
+def _confere(nome_aba, linha, id_registro):
+    """Confere, lendo uma única célula, se o ID ainda está na linha"""
+    resposta = chamar_sheets(obter_planilha().values_get, absolute_range_name(nome_aba, f"A{linha}"))
+    valores = resposta.get("values", [])
+    return bool(valores) and bool(valores[0]) and str(valores[0][0]) == id_registro
+
+
+def localizar_linha(nome_aba, id_registro):
+    """
+    Número da linha (1-based) do registro com o ID informado
+
+    Args:
+        nome_aba: Nome da aba
+        id_registro: Valor da coluna A
+
+    Returns:
+        int | None: Linha do registro, ou None se o ID não existir
+    """
+    id_registro = str(id_registro)
+
+    indice, recem_lido = _obter_indice(nome_aba)
+    linha = indice.linha(id_registro)
+    if recem_lido:
+        return linha
+    if linha is not None and _confere(nome_aba, linha, id_registro):
+        return linha
+
+    # Índice desatualizado (ou ID inexistente): reconstrói uma vez
+    indice = _carregar_indice(nome_aba)
+    return indice.linha(id_registro)
+
+
+def registrar_insercao(nome_aba, ids):
+    """Acrescenta ao índice IDs gravados no fim da aba"""
+    with _lock:
+        indice = _indices.get(nome_aba)
+        if indice is None:
+            return
+        indice.ids.extend(str(id_registro) for id_registro in ids)
+
+
+def registrar_exclusao(nome_aba, linhas_excluidas):
+    """
+    Atualiza o índice depois de excluir linhas (as de baixo sobem)
+
+    Args:
+        nome_aba: Nome da aba
+        linhas_excluidas: Números das linhas removidas (1-based)
+    """
+    with _lock:
+        indice = _indices.get(nome_aba)
+        if indice is None:
+            return
+
+        for linha in sorted(set(linhas_excluidas), reverse=True):
+            if 1 < linha <= len(indice.ids):
+                del indice.ids[linha - 1]
+
+
+def descartar_indices():
+    """Descarta todos os índices (serão reconstruídos no próximo uso)"""
+    with _lock:
+        _indices.clear()
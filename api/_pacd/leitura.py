@@ -0,0 +1,77 @@
+"""
+Leitura em lote das abas da planilha
+
+Em vez de um worksheet() + get_all_records() por aba, todas as abas
+necessárias são lidas com um único values:batchGet e devolvidas como
+Tabela (colunas indexadas pelo cabeçalho, com números já convertidos
+como em get_all_records()). Linhas marcadas pela exclusão lógica são
+descartadas na leitura.
+"""
+from gspread.utils import absolute_range_name, fill_gaps, numericise
+
+from _pacd.chamadas import chamar_sheets
+from _pacd.exclusao_logica import esta_excluido
+from _pacd.log import obter_log
+from _pacd.medicao import fase
+from _pacd.planilha import obter_planilha
+from _pacd.tabela import Tabela
+
+
+log = obter_log(__name__)
+
+
+def converter_valor(valor):
+    """numericise() com atalhos para os casos comuns da planilha"""
+    if valor == "":
+        return ""
+    if valor.isdecimal():
+        return int(valor)
+
+    # Texto que float() nunca aceitaria: começa com letra (exceto inf/nan),
+    # datas (dd/mm/aaaa) e horários (hh:mm)
+    if valor[0].isalpha() and valor[0] not in "iInN":
+        return valor
+    if "/" in valor or ":" in valor:
+        return valor
+
+    return numericise(valor)
+
+
+def para_tabela(valores):
+    """Converte a matriz de uma aba em Tabela, como get_all_records()"""
+    if not valores:
+        return Tabela({}, 0)
+
+    valores = fill_gaps(valores)
+    cabecalho = valores[0]
+    # Linhas marcadas como excluídas (exclusão lógica) não aparecem nas listagens
+    linhas = [
+        [converter_valor(valor) for valor in linha]
+        for linha in valores[1:] if not esta_excluido(linha[0])
+    ]
+
+    return Tabela.de_linhas(cabecalho, linhas)
+
+
+def ler_abas(*nomes):
+    """
+    Lê várias abas inteiras em uma única chamada à API
+
+    Args:
+        nomes: Nomes das abas (ex.: 'atividades', 'simulados')
+
+    Returns:
+        dict: {nome_aba: Tabela}
+    """
+    planilha = obter_planilha()
+
+    log.debug("📄 Lendo abas %s em uma única chamada...", ", ".join(nomes))
+    resposta = chamar_sheets(planilha.values_batch_get, [absolute_range_name(nome) for nome in nomes])
+
+    tabelas = {}
+    with fase("conversao"):
+        for nome, intervalo in zip(nomes, resposta.get("valueRanges", [])):
+            tabelas[nome] = para_tabela(intervalo.get("values", []))
+            log.debug("✅ %d registros em '%s'", len(tabelas[nome]), nome)
+
+    return tabelas
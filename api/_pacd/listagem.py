@@ -0,0 +1,259 @@
+"""
+Montagem dos payloads de listagem
+
+Recebe as tabelas já lidas (ler_abas() ou obter_armazenamento()) e monta o JSON devolvido ao
+frontend. A aba 'atividades' é lida uma única vez e dividida por TIPO, o
+que permite montar exercícios e redações na mesma requisição.
+
+O caminho padrão usa apenas a biblioteca padrão (ver _pacd.tabela); o
+motor pandas é importado sob demanda só no modo analítico. Com o SQLite
+(armazenamento ou réplica), o join com as abas derivadas é feito em SQL e
+as linhas já juntadas são montadas por montar_exercicios_juntados() e
+montar_redacoes_juntadas().
+"""
+from _pacd.log import obter_log
+from _pacd.medicao import fase
+
+
+log = obter_log(__name__)
+
+
+MOTOR_PADRAO = "padrao"
+MOTOR_PANDAS = "pandas"
+MOTORES = (MOTOR_PADRAO, MOTOR_PANDAS)
+
+CAMPOS_ATIVIDADE = ['ID_ATIVIDADE', 'TITULO', 'TIPO', 'QUESTOES', 'ACERTOS', 'DT_INICIO', 'INFO']
+CAMPOS_INFO_SIMULADO = ['ID_SIMULADO', 'AREA', 'QUESTOES', 'ACERTOS', 'TEMPO_TOTAL', 'COMENTARIOS', 'DT_REALIZADO']
+CAMPOS_INFO_QUESTOES = ['ID_QUESTOES', 'AREA', 'MATERIA', 'ASSUNTO', 'QUESTOES', 'ACERTOS', 'TEMPO_TOTAL', 'COMENTARIOS', 'DT_REALIZADO']
+CAMPOS_REDACAO = ['C1', 'C2', 'C3', 'C4', 'C5']
+
+
+def _numero(valor):
+    """Valor numérico para os totais (células vazias ou texto contam como 0)"""
+    if isinstance(valor, (int, float)) and not isinstance(valor, bool):
+        return valor
+    return 0
+
+
+def agrupar_registros(var_tabRegistros, var_listCampos):
+    """
+    Agrupa os registros derivados (simulados ou questões) por atividade
+
+    Args:
+        var_tabRegistros: Tabela da aba derivada
+        var_listCampos: Colunas que compõem cada item de INFO
+
+    Returns:
+        dict: {ID_ATIVIDADE (texto): (INFO, total de QUESTOES, total de ACERTOS)}
+    """
+    var_listInfo = var_tabRegistros.registros(var_listCampos)
+    var_listQuestoes = var_tabRegistros.coluna('QUESTOES')
+    var_listAcertos = var_tabRegistros.coluna('ACERTOS')
+
+    var_dicAgrupado = {}
+    for var_strChave, var_listIndices in var_tabRegistros.indices_por('ID_ATIVIDADE').items():
+        var_dicAgrupado[var_strChave] = (
+            [var_listInfo[i] for i in var_listIndices],
+            sum(_numero(var_listQuestoes[i]) for i in var_listIndices),
+            sum(_numero(var_listAcertos[i]) for i in var_listIndices)
+        )
+
+    return var_dicAgrupado
+
+
+def ler_motor(var_dicParametros):
+    """
+    Valida o parâmetro motor= da query string
+
+    O motor faz parte da chave do cache das listagens, então valores
+    desconhecidos são recusados em vez de criar entradas novas.
+
+    Args:
+        var_dicParametros: Resultado de parse_qs() da URL
+
+    Returns:
+        str: MOTOR_PADRAO (se ausente) ou MOTOR_PANDAS
+
+    Raises:
+        ValueError: Se o motor não for um dos MOTORES
+    """
+    motor = var_dicParametros.get("motor", [""])[0] or MOTOR_PADRAO
+    if motor not in MOTORES:
+        raise ValueError(f"motor deve ser um de: {', '.join(MOTORES)}")
+    return motor
+
+
+@fase("montagem")
+def montar_exercicios(var_dicTabelas, motor=MOTOR_PADRAO):
+    """
+    Monta a lista de exercícios (simulados e questões) com INFO e totais
+
+    Args:
+        var_dicTabelas: Tabelas lidas por ler_abas() ('atividades', 'simulados' e 'questoes')
+        motor: MOTOR_PADRAO (biblioteca padrão) ou MOTOR_PANDAS (modo analítico)
+
+    Returns:
+        list: Atividades que não são redação, com dados completos
+    """
+    if motor == MOTOR_PANDAS:
+        from _pacd import listagem_pandas
+        var_jsonFinal = listagem_pandas.montar_exercicios(var_dicTabelas)
+        log.debug("✅ %d atividades completas montadas (pandas)", len(var_jsonFinal))
+        return var_jsonFinal
+
+    var_tabAtividades = var_dicTabelas["atividades"].filtrar('TIPO', lambda tipo: tipo != 'Redação')
+
+    log.debug(
+        "✅ %d simulados e %d questões encontrados", len(var_dicTabelas['simulados']), len(var_dicTabelas['questoes'])
+    )
+
+    var_dicPorTipo = {
+        'Simulado': agrupar_registros(var_dicTabelas["simulados"], CAMPOS_INFO_SIMULADO),
+        'Questões': agrupar_registros(var_dicTabelas["questoes"], CAMPOS_INFO_QUESTOES)
+    }
+
+    # Montagem do JSON final
+    var_jsonFinal = []
+
+    for var_intIdAtividade, var_strTitulo, var_strTipo, var_strDtInicio in zip(
+        var_tabAtividades.coluna('ID_ATIVIDADE'),
+        var_tabAtividades.coluna('TITULO'),
+        var_tabAtividades.coluna('TIPO'),
+        var_tabAtividades.coluna('DT_INICIO')
+    ):
+        var_listInfo, var_intQuestoes, var_intAcertos = var_dicPorTipo.get(var_strTipo, {}).get(
+            str(var_intIdAtividade), ([], 0, 0)
+        )
+
+        var_jsonFinal.append({
+            'ID_ATIVIDADE': var_intIdAtividade,
+            'TITULO': var_strTitulo,
+            'TIPO': var_strTipo,
+            'QUESTOES': var_intQuestoes,
+            'ACERTOS': var_intAcertos,
+            'DT_INICIO': var_strDtInicio,
+            'INFO': var_listInfo
+        })
+
+    log.debug("✅ %d atividades completas montadas", len(var_jsonFinal))
+    return var_jsonFinal
+
+
+@fase("montagem")
+def montar_exercicios_juntados(var_listLinhas):
+    """
+    Monta a lista de exercícios a partir do join atividade x registros derivados
+
+    Args:
+        var_listLinhas: Uma linha por (atividade, registro derivado), na ordem
+            das atividades e dos registros: (posição da atividade,
+            ID_ATIVIDADE, TITULO, TIPO, DT_INICIO, item de INFO ou None se a
+            atividade não tem registros), com os valores já convertidos
+
+    Returns:
+        list: Atividades que não são redação, como em montar_exercicios()
+    """
+    var_jsonFinal = []
+    var_intPosicao = None
+
+    for var_intPosicaoLinha, var_intIdAtividade, var_strTitulo, var_strTipo, var_strDtInicio, var_dicInfo in var_listLinhas:
+        if var_intPosicaoLinha != var_intPosicao:
+            var_intPosicao = var_intPosicaoLinha
+            var_dicAtividade = {
+                'ID_ATIVIDADE': var_intIdAtividade,
+                'TITULO': var_strTitulo,
+                'TIPO': var_strTipo,
+                'QUESTOES': 0,
+                'ACERTOS': 0,
+                'DT_INICIO': var_strDtInicio,
+                'INFO': []
+            }
+            var_jsonFinal.append(var_dicAtividade)
+
+        if var_dicInfo is not None:
+            var_dicAtividade['INFO'].append(var_dicInfo)
+            var_dicAtividade['QUESTOES'] += _numero(var_dicInfo['QUESTOES'])
+            var_dicAtividade['ACERTOS'] += _numero(var_dicInfo['ACERTOS'])
+
+    log.debug("✅ %d atividades completas montadas (join no SQLite)", len(var_jsonFinal))
+    return var_jsonFinal
+
+
+@fase("montagem")
+def montar_redacoes(var_dicTabelas):
+    """
+    Monta a lista de redações com as notas por competência
+
+    Args:
+        var_dicTabelas: Tabelas lidas por ler_abas() ('atividades' e 'redacoes')
+
+    Returns:
+        list: Atividades do tipo redação, com dados completos
+    """
+    var_tabAtividades = var_dicTabelas["atividades"].filtrar('TIPO', lambda tipo: tipo == 'Redação')
+    var_tabRedacoes = var_dicTabelas["redacoes"]
+
+    log.debug("✅ %d redacoes encontradas", len(var_tabRedacoes))
+
+    # Quando há mais de uma redação para a atividade, vale a última
+    var_listNotas = var_tabRedacoes.registros(CAMPOS_REDACAO)
+    var_dicNotasPorAtividade = {
+        var_strChave: var_listNotas[var_listIndices[-1]]
+        for var_strChave, var_listIndices in var_tabRedacoes.indices_por('ID_ATIVIDADE').items()
+    }
+
+    # Montagem do JSON final
+    var_jsonFinal = []
+
+    for var_intIdAtividade, var_strTitulo, var_strTipo, var_strDtInicio in zip(
+        var_tabAtividades.coluna('ID_ATIVIDADE'),
+        var_tabAtividades.coluna('TITULO'),
+        var_tabAtividades.coluna('TIPO'),
+        var_tabAtividades.coluna('DT_INICIO')
+    ):
+        var_dicNotas = var_dicNotasPorAtividade.get(str(var_intIdAtividade), {})
+
+        item = {
+            'ID_ATIVIDADE': var_intIdAtividade,
+            'TITULO': var_strTitulo,
+            'TIPO': var_strTipo
+        }
+        for var_strCampo in CAMPOS_REDACAO:
+            item[var_strCampo] = var_dicNotas.get(var_strCampo, 0)
+        item['DT_INICIO'] = var_strDtInicio
+
+        var_jsonFinal.append(item)
+
+    log.debug("✅ %d redacoes completas montadas", len(var_jsonFinal))
+    return var_jsonFinal
+
+
+@fase("montagem")
+def montar_redacoes_juntadas(var_listLinhas):
+    """
+    Monta a lista de redações a partir do join atividade x última redação
+
+    Args:
+        var_listLinhas: Uma linha por atividade do tipo redação: (ID_ATIVIDADE,
+            TITULO, TIPO, DT_INICIO, {C1..C5} ou None se não há redação),
+            com os valores já convertidos
+
+    Returns:
+        list: Atividades do tipo redação, como em montar_redacoes()
+    """
+    var_jsonFinal = []
+
+    for var_intIdAtividade, var_strTitulo, var_strTipo, var_strDtInicio, var_dicNotas in var_listLinhas:
+        item = {
+            'ID_ATIVIDADE': var_intIdAtividade,
+            'TITULO': var_strTitulo,
+            'TIPO': var_strTipo
+        }
+        for var_strCampo in CAMPOS_REDACAO:
+            item[var_strCampo] = (var_dicNotas or {}).get(var_strCampo, 0)
+        item['DT_INICIO'] = var_strDtInicio
+
+        var_jsonFinal.append(item)
+
+    log.debug("✅ %d redacoes completas montadas (join no SQLite)", len(var_jsonFinal))
+    return var_jsonFinal
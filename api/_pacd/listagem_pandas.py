@@ -0,0 +1,80 @@
+"""
+Montagem vetorizada da listagem de exercícios com pandas
+
+Usada apenas no modo analítico (motor="pandas"). Este módulo é importado
+sob demanda por _pacd.listagem para que pandas/NumPy não entrem no cold
+start do caminho padrão.
+"""
+import numpy as np
+import pandas as pd
+
+from _pacd.listagem import CAMPOS_ATIVIDADE, CAMPOS_INFO_QUESTOES, CAMPOS_INFO_SIMULADO
+
+
+def _para_dataframe(var_tabDados, var_listColunas):
+    """Converte a Tabela em DataFrame garantindo as colunas esperadas"""
+    var_dfDados = pd.DataFrame(columns=var_listColunas)
+    return pd.concat([var_dfDados, pd.DataFrame(var_tabDados.colunas)], ignore_index=True)
+
+
+def agrupar_registros(var_dfRegistros, var_strTipo, var_listCampos):
+    """
+    Agrupa os registros derivados (simulados ou questões) por atividade
+
+    Args:
+        var_dfRegistros: DataFrame da aba derivada
+        var_strTipo: TIPO da atividade a que os registros pertencem
+        var_listCampos: Colunas que compõem cada item de INFO
+
+    Returns:
+        DataFrame: Uma linha por atividade com CHAVE, TIPO, INFO, QUESTOES e ACERTOS
+    """
+    var_arrInfo = np.array(var_dfRegistros[var_listCampos].to_dict('records'), dtype=object)
+
+    var_objGrupos = pd.DataFrame({
+        'CHAVE': var_dfRegistros['ID_ATIVIDADE'].astype(str),
+        'QUESTOES': pd.to_numeric(var_dfRegistros['QUESTOES'], errors='coerce').fillna(0),
+        'ACERTOS': pd.to_numeric(var_dfRegistros['ACERTOS'], errors='coerce').fillna(0)
+    }).groupby('CHAVE', sort=False)
+
+    # Totais somados pelo groupby e INFO montado a partir dos índices de cada grupo
+    var_dfAgrupado = var_objGrupos[['QUESTOES', 'ACERTOS']].sum().reset_index()
+    var_dfAgrupado['INFO'] = [var_arrInfo[var_objGrupos.indices[var_strChave]].tolist() for var_strChave in var_dfAgrupado['CHAVE']]
+    var_dfAgrupado['TIPO'] = var_strTipo
+
+    return var_dfAgrupado
+
+
+def montar_exercicios(var_dicTabelas):
+    """
+    Monta a lista de exercícios com groupby/merge (mesmo formato do caminho padrão)
+
+    Args:
+        var_dicTabelas: Tabelas lidas por ler_abas() ('atividades', 'simulados' e 'questoes')
+
+    Returns:
+        list: Atividades que não são redação, com dados completos
+    """
+    var_dfDadosAtividades = _para_dataframe(var_dicTabelas["atividades"], ['ID_ATIVIDADE', 'TITULO', 'TIPO', 'DT_INICIO'])
+    var_dfDadosAtividades = var_dfDadosAtividades[var_dfDadosAtividades['TIPO'] != 'Redação']
+
+    var_dfDadosSimulados = _para_dataframe(var_dicTabelas["simulados"], ['ID_ATIVIDADE'] + CAMPOS_INFO_SIMULADO)
+    var_dfDadosQuestoes = _para_dataframe(var_dicTabelas["questoes"], ['ID_ATIVIDADE'] + CAMPOS_INFO_QUESTOES)
+
+    # Agrupa simulados e questões por atividade (INFO + totais) e junta
+    # tudo com as atividades em um único merge, sem laços linha a linha
+    var_dfRegistros = pd.concat([
+        agrupar_registros(var_dfDadosSimulados, 'Simulado', CAMPOS_INFO_SIMULADO),
+        agrupar_registros(var_dfDadosQuestoes, 'Questões', CAMPOS_INFO_QUESTOES)
+    ], ignore_index=True)
+
+    var_dfFinal = var_dfDadosAtividades[['ID_ATIVIDADE', 'TITULO', 'TIPO', 'DT_INICIO']].assign(
+        CHAVE=var_dfDadosAtividades['ID_ATIVIDADE'].astype(str)
+    )
+    var_dfFinal = var_dfFinal.merge(var_dfRegistros, on=['CHAVE', 'TIPO'], how='left')
+
+    var_dfFinal['QUESTOES'] = pd.to_numeric(var_dfFinal['QUESTOES'].fillna(0), downcast='integer')
+    var_dfFinal['ACERTOS'] = pd.to_numeric(var_dfFinal['ACERTOS'].fillna(0), downcast='integer')
+    var_dfFinal['INFO'] = [var_listInfo if isinstance(var_listInfo, list) else [] for var_listInfo in var_dfFinal['INFO']]
+
+    return var_dfFinal[CAMPOS_ATIVIDADE].to_dict('records')
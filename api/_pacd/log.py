@@ -0,0 +1,176 @@
+"""
+Log estruturado: níveis, formatação preguiçosa, truncamento e amostragem
+
+Cada registro vira uma linha JSON em stdout (o que a Vercel guarda como
+log da função), com nível, origem, mensagem e campos extras:
+
+    log = obter_log(__name__)
+    log.info("🆔 ID gerado: %s", id_atividade, aba="atividades")
+    log.debug("📦 Payload recebido: %s", resumir(dados))
+
+- A mensagem só é formatada (e resumir() só serializa) se o registro
+  for emitido; abaixo do nível configurado, a chamada só compara números.
+- PACD_LOG_NIVEL define o nível (padrão INFO).
+- PACD_LOG_AMOSTRA é a fração das requisições (0 a 1, padrão 0) que
+  emitem também os registros DEBUG, para ter rastros completos de
+  algumas requisições em produção sem pagar por isso em todas.
+- Mensagens e payloads resumidos são truncados (PACD_LOG_LIMITE).
+"""
+import json
+import logging
+import os
+import random
+import sys
+from contextvars import ContextVar
+
+
+NIVEL = logging.getLevelName(os.environ.get("PACD_LOG_NIVEL", "INFO").upper())
+if not isinstance(NIVEL, int):
+    NIVEL = logging.INFO
+
+AMOSTRA_DEBUG = float(os.environ.get("PACD_LOG_AMOSTRA", "0"))
+
+# Caracteres máximos de uma mensagem formatada ou de um payload resumido
+LIMITE = int(os.environ.get("PACD_LOG_LIMITE", "500"))
+
+_depuracao_amostrada = ContextVar("depuracao_amostrada", default=False)
+
+
+def _truncar(texto, limite):
+    if limite and len(texto) > limite:
+        return f"{texto[:limite]}… (+{len(texto) - limite} caracteres)"
+    return texto
+
+
+class _Resumo:
+    """Payload serializado e truncado só quando convertido em texto"""
+
+    __slots__ = ("valor", "limite")
+
+    def __init__(self, valor, limite):
+        self.valor = valor
+        self.limite = limite
+
+    def __str__(self):
+        valor = self.valor
+        if isinstance(valor, (bytes, bytearray)):
+            texto = valor.decode("utf-8", errors="replace")
+        elif isinstance(valor, str):
+            texto = valor
+        else:
+            try:
+                texto = json.dumps(valor, ensure_ascii=False, default=str)
+            except (TypeError, ValueError):
+                texto = repr(valor)
+        return _truncar(texto, self.limite)
+
+
+def resumir(valor, limite=None):
+    """
+    Payload para log, serializado e truncado só se o registro for emitido
+
+    Args:
+        valor: Qualquer valor (dict/list viram JSON; bytes são decodificados)
+        limite: Caracteres máximos (padrão LIMITE)
+    """
+    return _Resumo(valor, LIMITE if limite is None else limite)
+
+
+class _FormatoJson(logging.Formatter):
+    """Uma linha JSON por registro"""
+
+    def format(self, registro):
+        linha = {
+            "nivel": registro.levelname,
+            "origem": registro.name,
+            "mensagem": _truncar(registro.getMessage(), LIMITE * 4)
+        }
+        linha.update(getattr(registro, "campos", None) or {})
+        if registro.exc_info:
+            linha["erro"] = self.formatException(registro.exc_info)
+        return json.dumps(linha, ensure_ascii=False, default=str)
+
+
+class _SaidaPadrao(logging.StreamHandler):
+    """StreamHandler que escreve no sys.stdout do momento (respeita redirecionamentos)"""
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, valor):
+        pass
+
+
+_raiz = logging.getLogger("pacd")
+_raiz.setLevel(logging.DEBUG)
+_raiz.propagate = False
+if not _raiz.handlers:
+    _saida = _SaidaPadrao()
+    _saida.setFormatter(_FormatoJson())
+    _raiz.addHandler(_saida)
+
+
+class Log:
+    """Logger de um módulo; campos extras viram chaves da linha JSON"""
+
+    __slots__ = ("_logger",)
+
+    def __init__(self, nome):
+        self._logger = _raiz.getChild(nome)
+
+    def ativo(self, nivel):
+        """Se um registro do nível seria emitido (para evitar montar argumentos caros)"""
+        return nivel >= NIVEL or (_depuracao_amostrada.get() and nivel >= logging.DEBUG)
+
+    def _registrar(self, nivel, mensagem, args, campos, exc_info=None):
+        if not self.ativo(nivel):
+            return
+        self._logger.log(nivel, mensagem, *args, exc_info=exc_info, extra={"campos": campos}, stacklevel=3)
+
+    def debug(self, mensagem, *args, **campos):
+        self._registrar(logging.DEBUG, mensagem, args, campos)
+
+    def info(self, mensagem, *args, **campos):
+        self._registrar(logging.INFO, mensagem, args, campos)
+
+    def aviso(self, mensagem, *args, **campos):
+        self._registrar(logging.WARNING, mensagem, args, campos)
+
+    def erro(self, mensagem, *args, **campos):
+        self._registrar(logging.ERROR, mensagem, args, campos)
+
+    def excecao(self, mensagem, *args, **campos):
+        """Erro com o traceback da exceção em tratamento"""
+        self._registrar(logging.ERROR, mensagem, args, campos, exc_info=True)
+
+
+def obter_log(nome):
+    """
+    Logger do módulo
+
+    Args:
+        nome: __name__ do módulo (o pacote, como '_pacd.' ou '_rotas.', é omitido)
+
+    Returns:
+        Log: Logger do módulo
+    """
+    return Log(nome.rpartition(".")[2])
+
+
+def sortear_depuracao():
+    """
+    Sorteia se a requisição atual emite registros DEBUG (PACD_LOG_AMOSTRA)
+
+    Returns:
+        Token para desfazer com encerrar_depuracao()
+    """
+    return _depuracao_amostrada.set(AMOSTRA_DEBUG > 0 and random.random() < AMOSTRA_DEBUG)
+
+
+def encerrar_depuracao(token):
+    _depuracao_amostrada.reset(token)
@@ -0,0 +1,167 @@
+"""
+Medição por requisição: tempo por fase e chamadas à API do Google
+
+Cada requisição atendida por HandlerMedido ganha uma MedicaoRequisicao
+(em um ContextVar, então requisições em threads diferentes não se
+misturam). O código marca as fases com fase("nome"), como bloco with ou
+decorador; chamar_sheets() conta as chamadas à API e a sessão HTTP do
+gspread soma os bytes dos corpos enviados e recebidos.
+
+Ao final são emitidos:
+- o cabeçalho Server-Timing, com o que foi medido até o envio dos
+  cabeçalhos (ex.: credenciais;dur=3.1, sheets;dur=212.4;desc="1 chamada");
+- um registro de log (evento 'requisicao') com todas as fases, inclusive
+  as posteriores aos cabeçalhos (serialização do corpo).
+
+A requisição também sorteia se emite os registros DEBUG (ver _pacd.log).
+
+As fases podem se sobrepor (ex.: 'sheets' dentro de 'planilha'); a soma
+delas não é o total.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from http.server import BaseHTTPRequestHandler
+
+from _pacd.log import encerrar_depuracao, obter_log, sortear_depuracao
+
+
+log = obter_log(__name__)
+
+
+class MedicaoRequisicao:
+    """Tempos acumulados por fase e uso da API durante uma requisição"""
+
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.fases = {}
+        self.chamadas = 0
+        self.bytes_enviados = 0
+        self.bytes_recebidos = 0
+        self._lock = threading.Lock()
+
+    def acumular(self, nome, segundos):
+        with self._lock:
+            self.fases[nome] = self.fases.get(nome, 0.0) + segundos
+
+    def registrar_chamada(self):
+        with self._lock:
+            self.chamadas += 1
+
+    def registrar_bytes(self, bytes_enviados, bytes_recebidos):
+        with self._lock:
+            self.bytes_enviados += bytes_enviados
+            self.bytes_recebidos += bytes_recebidos
+
+    def total_ms(self):
+        return (time.perf_counter() - self.inicio) * 1000
+
+    def server_timing(self):
+        """Valor do cabeçalho Server-Timing"""
+        with self._lock:
+            fases = dict(self.fases)
+
+        metricas = []
+        for nome, segundos in fases.items():
+            metrica = f"{nome};dur={segundos * 1000:.1f}"
+            if nome == "sheets":
+                plural = "chamada" if self.chamadas == 1 else "chamadas"
+                metrica += f';desc="{self.chamadas} {plural}, {self.bytes_recebidos} B"'
+            metricas.append(metrica)
+        metricas.append(f"total;dur={self.total_ms():.1f}")
+        return ", ".join(metricas)
+
+    def resumo(self):
+        """Dicionário da linha de log"""
+        with self._lock:
+            return {
+                "duracao_ms": round(self.total_ms(), 1),
+                "fases_ms": {nome: round(segundos * 1000, 1) for nome, segundos in self.fases.items()},
+                "sheets": {
+                    "chamadas": self.chamadas,
+                    "bytes_enviados": self.bytes_enviados,
+                    "bytes_recebidos": self.bytes_recebidos
+                }
+            }
+
+
+_medicao_atual = ContextVar("medicao_atual", default=None)
+
+
+def medicao_atual():
+    """MedicaoRequisicao da requisição em andamento (None fora de uma requisição)"""
+    return _medicao_atual.get()
+
+
+@contextmanager
+def fase(nome):
+    """
+    Mede o tempo do bloco (ou da função decorada) na fase informada
+
+    Fora de uma requisição medida, não faz nada.
+    """
+    medicao = _medicao_atual.get()
+    if medicao is None:
+        yield
+        return
+
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        medicao.acumular(nome, time.perf_counter() - inicio)
+
+
+def registrar_chamada_sheets():
+    """Conta uma chamada (tentativa) à API na requisição em andamento"""
+    medicao = _medicao_atual.get()
+    if medicao is not None:
+        medicao.registrar_chamada()
+
+
+def registrar_resposta_http(resposta, *args, **kwargs):
+    """Hook de resposta da sessão requests: soma os bytes dos corpos"""
+    medicao = _medicao_atual.get()
+    if medicao is not None:
+        corpo = resposta.request.body or b""
+        medicao.registrar_bytes(len(corpo), len(resposta.content))
+    return resposta
+
+
+class HandlerMedido(BaseHTTPRequestHandler):
+    """BaseHTTPRequestHandler que mede cada requisição e registra o resultado"""
+
+    def handle_one_request(self):
+        token = _medicao_atual.set(MedicaoRequisicao())
+        token_depuracao = sortear_depuracao()
+        self._status_medido = None
+        self.command = None
+        try:
+            super().handle_one_request()
+        finally:
+            if self.command:
+                rota = self.path.split("?", 1)[0]
+                log.info(
+                    "%s %s -> %s", self.command, rota, self._status_medido, evento="requisicao",
+                    metodo=self.command, rota=rota, status=self._status_medido, **_medicao_atual.get().resumo()
+                )
+            encerrar_depuracao(token_depuracao)
+            _medicao_atual.reset(token)
+
+    def log_message(self, format, *args):
+        # A linha de acesso do http.server (stderr) já está no evento 'requisicao'
+        log.debug(format, *args)
+
+    def log_error(self, format, *args):
+        log.aviso(format, *args)
+
+    def send_response(self, code, message=None):
+        self._status_medido = code
+        super().send_response(code, message)
+
+    def end_headers(self):
+        medicao = _medicao_atual.get()
+        if medicao is not None:
+            self.send_header("Server-Timing", medicao.server_timing())
+        super().end_headers()
@@ -0,0 +1,140 @@
+"""
+Resolução da planilha e cache de metadados das abas
+
+client.open(SPREADSHEET_NAME) faz uma busca no Drive pelo título e cada
+planilha.worksheet("...") busca de novo os metadados da planilha. Aqui o
+nome é resolvido para o ID uma única vez e as abas (sheetId, tamanho do
+grid) ficam em cache com TTL, sendo descartadas em caso de erro. Erros
+de autenticação descartam também o cliente (credenciais e sessão HTTP).
+"""
+import os
+import threading
+import time
+
+import gspread
+from google.auth.exceptions import RefreshError
+
+from _pacd.chamadas import chamar_sheets
+from _pacd.conexao import SPREADSHEET_NAME, descartar_cliente, obter_cliente
+from _pacd.log import obter_log
+from _pacd.medicao import fase
+
+
+log = obter_log(__name__)
+
+
+# Tempo (segundos) que os metadados das abas são considerados válidos
+TTL_METADADOS = 300
+
+_lock = threading.Lock()
+_ids_por_nome = {}
+_planilha = None
+_abas = {}
+_abas_carregadas_em = 0.0
+
+# Permite informar o ID diretamente e pular a busca por nome no Drive
+if os.environ.get("GOOGLE_SPREADSHEET_ID"):
+    _ids_por_nome[SPREADSHEET_NAME] = os.environ["GOOGLE_SPREADSHEET_ID"]
+
+
+@fase("planilha")
+def _abrir_planilha(cliente):
+    """Abre a planilha por ID, resolvendo o ID pelo nome só na primeira vez"""
+    id_planilha = _ids_por_nome.get(SPREADSHEET_NAME)
+
+    if id_planilha is None:
+        planilha = chamar_sheets(cliente.open, SPREADSHEET_NAME)
+        _ids_por_nome[SPREADSHEET_NAME] = planilha.id
+        log.info("📁 Planilha '%s' -> %s", SPREADSHEET_NAME, planilha.id)
+        return planilha
+
+    return chamar_sheets(cliente.open_by_key, id_planilha)
+
+
+@fase("planilha")
+def _carregar_abas(planilha):
+    """Busca os metadados de todas as abas em uma única chamada"""
+    global _abas, _abas_carregadas_em
+
+    _abas = {aba.title: aba for aba in chamar_sheets(planilha.worksheets)}
+    _abas_carregadas_em = time.monotonic()
+
+
+def obter_planilha():
+    """
+    Retorna a planilha compartilhada pela instância
+
+    Returns:
+        gspread.Spreadsheet: Planilha SPREADSHEET_NAME
+    """
+    global _planilha
+
+    cliente = obter_cliente()
+
+    with _lock:
+        if _planilha is None or _planilha.client is not cliente.http_client:
+            _planilha = _abrir_planilha(cliente)
+            _abas.clear()
+
+        return _planilha
+
+
+def obter_aba(nome):
+    """
+    Retorna a aba pelo nome usando os metadados em cache
+
+    Args:
+        nome: Nome da aba (ex.: 'atividades')
+
+    Returns:
+        gspread.Worksheet: Aba solicitada
+    """
+    planilha = obter_planilha()
+
+    with _lock:
+        expirado = time.monotonic() - _abas_carregadas_em > TTL_METADADOS
+
+        if expirado or nome not in _abas:
+            _carregar_abas(planilha)
+
+        if nome not in _abas:
+            raise gspread.WorksheetNotFound(nome)
+
+        return _abas[nome]
+
+
+def _erro_autenticacao(erro):
+    """Token que não renova (RefreshError) ou resposta 401/403 da API"""
+    if isinstance(erro, RefreshError):
+        return True
+    return isinstance(erro, gspread.exceptions.APIError) and erro.response.status_code in (401, 403)
+
+
+def invalidar_cache_planilha(erro=None):
+    """
+    Descarta a planilha e os metadados em cache
+
+    Deve ser chamada quando uma operação falha, já que abas podem ter sido
+    renomeadas/excluídas ou a planilha movida. Em erros de autenticação,
+    o cliente também é descartado e a próxima requisição refaz as
+    credenciais em vez de repetir o token recusado.
+
+    Args:
+        erro: Exceção que motivou a invalidação (opcional). Erros que não
+            vêm do Sheets/rede (ex.: validação) não descartam o cache.
+    """
+    global _planilha, _abas_carregadas_em
+
+    if _erro_autenticacao(erro):
+        log.aviso("🔑 Erro de autenticação, descartando o cliente: %s", erro, tipo_erro=type(erro).__name__)
+        descartar_cliente()
+    elif erro is not None and not isinstance(erro, (gspread.exceptions.GSpreadException, OSError)):
+        return
+
+    with _lock:
+        _planilha = None
+        _abas.clear()
+        _abas_carregadas_em = 0.0
+
+        if isinstance(erro, gspread.SpreadsheetNotFound):
+            _ids_por_nome.pop(SPREADSHEET_NAME, None)
@@ -0,0 +1,177 @@
+"""
+Montagem das linhas gravadas na planilha
+
+Geração de IDs e conversão dos dados recebidos pelos endpoints de criação
+nas linhas das abas 'atividades', 'simulados', 'questoes' e 'redacoes'.
+"""
+from datetime import datetime
+
+from _pacd.ids import gerar_id
+from _pacd.log import obter_log, resumir
+
+
+log = obter_log(__name__)
+
+
+def gerar_id_atividade():
+    """Gera ID único e ordenável pelo tempo (ver _pacd.ids)"""
+    return gerar_id()
+
+
+def gerar_id_simulado():
+    """Gera ID único para simulado"""
+    return gerar_id("SIM")
+
+
+def gerar_id_questao():
+    """Gera ID único para questão"""
+    return gerar_id("QST")
+
+def gerar_id_redacao():
+    """Gera ID único para redação"""
+    return gerar_id("RDC")
+
+
+def _data_realizacao(dados):
+    """DT_REALIZADO do registro: 'dt_realizado' (nova entrada) ou 'dt_inicio' (nova atividade)"""
+    return dados.get('dt_realizado') or dados.get('dt_inicio', '')
+
+
+def montar_linha_atividade(id_atividade, dados):
+    """
+    Monta o registro da aba 'atividades' (apenas dados estruturais)
+
+    Args:
+        id_atividade: ID da atividade
+        dados: Dicionário com titulo, tipo e dt_inicio
+
+    Returns:
+        list: Linha a ser inserida
+    """
+    data_inclusao = datetime.now().strftime('%d/%m/%Y %H:%M:%S')
+
+    # Campos: id_atividade, titulo, tipo, dt_inicio, data_inclusao
+    return [
+        id_atividade,
+        dados.get('titulo', ''),
+        dados.get('tipo', ''),
+        dados.get('dt_inicio',''),
+        data_inclusao
+    ]
+
+
+def montar_linha_simulado(id_atividade, dados):
+    """
+    Monta o registro de simulado da aba 'simulados'
+
+    Args:
+        id_atividade: ID da atividade relacionada
+        dados: Dicionário com os dados do simulado
+
+    Returns:
+        tuple: (ID do simulado, linha a ser inserida)
+    """
+    id_simulado = gerar_id_simulado()
+    data_execucao = datetime.now().strftime('%d/%m/%Y %H:%M:%S')
+
+    # Campos: id_simulado, id_atividade, data_execucao, area, questoes, acertos, tempo, comentarios
+    linha_simulado = [
+        id_simulado,
+        id_atividade,
+        dados.get('area', ''),
+        dados.get('questoes', ''),
+        dados.get('acertos', ''),
+        dados.get('tempo_total', ''),
+        dados.get('comentarios', ''),
+        _data_realizacao(dados),
+        data_execucao
+    ]
+
+    log.debug("📝 Simulado a ser inserido: %s", resumir(linha_simulado))
+    return id_simulado, linha_simulado
+
+
+def montar_linha_questoes(id_atividade, dados):
+    """
+    Monta o registro de questão da aba 'questoes'
+
+    Args:
+        id_atividade: ID da atividade relacionada
+        dados: Dicionário com os dados da questão
+
+    Returns:
+        tuple: (ID da questão, linha a ser inserida)
+    """
+    id_questao = gerar_id_questao()
+    data_execucao = datetime.now().strftime('%d/%m/%Y %H:%M:%S')
+
+    # Campos: id_questao, id_atividade, data_execucao, area, materia, assunto, questoes, acertos, tempo, comentarios
+    linha_questao = [
+        id_questao,
+        id_atividade,
+        dados.get('area', ''),
+        dados.get('materia', ''),
+        dados.get('assunto', ''),
+        dados.get('questoes', ''),
+        dados.get('acertos', ''),
+        dados.get('tempo_total', ''),
+        dados.get('comentarios', ''),
+        _data_realizacao(dados),
+        data_execucao
+    ]
+
+    log.debug("📝 Questão a ser inserida: %s", resumir(linha_questao))
+    return id_questao, linha_questao
+
+def montar_linha_redacao(id_atividade, dados):
+    """
+    Monta o registro de redação da aba 'redacoes'
+
+    Args:
+        id_atividade: ID da atividade relacionada
+        dados: Dicionário com os dados da redação
+
+    Returns:
+        tuple: (ID da redação, linha a ser inserida)
+    """
+    id_redacao = gerar_id_redacao()
+    data_execucao = datetime.now().strftime('%d/%m/%Y %H:%M:%S')
+
+    # Campos: id_questao, id_atividade, data_execucao, area, materia, assunto, questoes, acertos, tempo, comentarios
+    linha_redacao = [
+        id_redacao,
+        id_atividade,
+        'Redação',
+        dados.get('c1', ''),
+        dados.get('c2', ''),
+        dados.get('c3', ''),
+        dados.get('c4', ''),
+        dados.get('c5', ''),
+        dados.get('tempo_total', ''),
+        dados.get('comentarios', ''),
+        dados.get('dt_inicio',''),
+        data_execucao
+    ]
+
+    log.debug("📝 Redação a ser inserida: %s", resumir(linha_redacao))
+    return id_redacao, linha_redacao
+
+
+# Cabeçalho (linha 1) de cada aba, na ordem em que as linhas são montadas acima
+COLUNAS_POR_ABA = {
+    'atividades': ['ID_ATIVIDADE', 'TITULO', 'TIPO', 'DT_INICIO', 'DATA_INCLUSAO'],
+    'simulados': ['ID_SIMULADO', 'ID_ATIVIDADE', 'AREA', 'QUESTOES', 'ACERTOS', 'TEMPO_TOTAL',
+                  'COMENTARIOS', 'DT_REALIZADO', 'DATA_EXECUCAO'],
+    'questoes': ['ID_QUESTOES', 'ID_ATIVIDADE', 'AREA', 'MATERIA', 'ASSUNTO', 'QUESTOES', 'ACERTOS',
+                 'TEMPO_TOTAL', 'COMENTARIOS', 'DT_REALIZADO', 'DATA_EXECUCAO'],
+    'redacoes': ['ID_REDACAO', 'ID_ATIVIDADE', 'TIPO', 'C1', 'C2', 'C3', 'C4', 'C5', 'TEMPO_TOTAL',
+                 'COMENTARIOS', 'DT_REALIZADO', 'DATA_EXECUCAO'],
+}
+
+
+# Aba e função de montagem do registro derivado de cada tipo
+DERIVADOS_POR_TIPO = {
+    'Simulado': ('simulados', montar_linha_simulado),
+    'Questões': ('questoes', montar_linha_questoes),
+    'Redação': ('redacoes', montar_linha_redacao),
+}
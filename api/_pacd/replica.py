@@ -0,0 +1,242 @@
+"""
+Réplica local (SQLite) das abas da planilha, sincronizada por incremento
+
+Com PACD_REPLICA ativo, as listagens leem as abas de uma cópia em SQLite
+(ver ArmazenamentoSQLite) em vez de baixar a planilha inteira:
+
+- Incremento: a marca d'água de cada aba é a quantidade de linhas já
+  copiadas e o ID da última. A cada leitura, um único values:batchGet
+  traz, de todas as abas, só a última linha copiada e as seguintes; se o
+  ID da última linha mudou (linha excluída ou marcada acima dela), a aba
+  é relida inteira.
+- Reconciliação: cada aba é relida inteira a cada TTL_RECONCILIACAO
+  segundos, o que cobre exclusões feitas por outras instâncias, e logo
+  após as exclusões feitas por esta (exigir_reconciliacao()). Cada pedido
+  de reconciliação tem um número; uma releitura só atende os pedidos
+  feitos antes de ela ler a planilha, então uma exclusão que acontece
+  durante a sincronização não é esquecida.
+- Listagens: sincronizadas as abas, o join de 'atividades' com as abas
+  derivadas é feito em SQL (ver ArmazenamentoSQLite.listar_exercicios).
+
+As colunas são casadas pelo cabeçalho da planilha, então a ordem das
+colunas na aba não precisa ser a de COLUNAS_POR_ABA.
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+
+from gspread.utils import absolute_range_name, rowcol_to_a1
+
+from _pacd.armazenamento import ABAS_EXERCICIOS, ABAS_PAINEL, ABAS_REDACOES, ArmazenamentoSQLite
+from _pacd.chamadas import chamar_sheets
+from _pacd.listagem import MOTOR_PADRAO
+from _pacd.log import obter_log
+from _pacd.planilha import obter_planilha
+from _pacd.registros import COLUNAS_POR_ABA
+
+
+log = obter_log(__name__)
+
+
+REPLICA_LOCAL = os.environ.get("PACD_REPLICA", "").lower() in ("1", "true", "sim")
+CAMINHO_REPLICA = os.environ.get("PACD_REPLICA_ARQUIVO", os.path.join(tempfile.gettempdir(), "pacd_replica.sqlite3"))
+
+# Intervalo (segundos) entre releituras completas de cada aba
+TTL_RECONCILIACAO = int(os.environ.get("PACD_REPLICA_RECONCILIACAO", "600"))
+
+# Por aba: número do último pedido de reconciliação e do último já atendido
+_pedidos_reconciliacao = {}
+_reconciliacoes_atendidas = {}
+_lock_reconciliar = threading.Lock()
+
+
+def exigir_reconciliacao(*nomes_abas):
+    """
+    Faz a próxima leitura reler as abas inteiras (após exclusões)
+
+    Args:
+        nomes_abas: Abas alteradas; sem argumentos, todas
+    """
+    with _lock_reconciliar:
+        for nome_aba in nomes_abas or COLUNAS_POR_ABA:
+            _pedidos_reconciliacao[nome_aba] = _pedidos_reconciliacao.get(nome_aba, 0) + 1
+
+
+def _pedidos_ate_agora(nomes_abas):
+    """Último pedido de reconciliação de cada aba (guardado antes de ler a planilha)"""
+    with _lock_reconciliar:
+        return {nome_aba: _pedidos_reconciliacao.get(nome_aba, 0) for nome_aba in nomes_abas}
+
+
+def _pendente_reconciliar(nome_aba):
+    with _lock_reconciliar:
+        return _pedidos_reconciliacao.get(nome_aba, 0) > _reconciliacoes_atendidas.get(nome_aba, 0)
+
+
+def _reconciliada(nome_aba, pedido):
+    """Marca como atendidos os pedidos até `pedido`; os feitos depois continuam pendentes"""
+    with _lock_reconciliar:
+        _reconciliacoes_atendidas[nome_aba] = max(_reconciliacoes_atendidas.get(nome_aba, 0), pedido)
+
+
+class ReplicaPlanilha(ArmazenamentoSQLite):
+    """Cópia local das abas, lida no lugar da planilha pelas listagens"""
+
+    def __init__(self, caminho=CAMINHO_REPLICA, ttl_reconciliacao=TTL_RECONCILIACAO):
+        super().__init__(caminho)
+        self.ttl_reconciliacao = ttl_reconciliacao
+        self._lock_sincronizacao = threading.Lock()
+
+    def _conectar(self):
+        conexao = self._conexao
+        if conexao is None:
+            conexao = super()._conectar()
+            conexao.execute(
+                "CREATE TABLE IF NOT EXISTS marcas ("
+                " aba TEXT PRIMARY KEY,"
+                " cabecalho TEXT NOT NULL,"
+                " linhas INTEGER NOT NULL,"
+                " ultimo_id TEXT NOT NULL,"
+                " reconciliada_em REAL NOT NULL)"
+            )
+        return conexao
+
+    def _marcas(self):
+        with self._lock:
+            linhas = self._conectar().execute(
+                "SELECT aba, cabecalho, linhas, ultimo_id, reconciliada_em FROM marcas"
+            ).fetchall()
+        return {
+            aba: {"cabecalho": json.loads(cabecalho), "linhas": total, "ultimo_id": ultimo_id, "reconciliada_em": em}
+            for aba, cabecalho, total, ultimo_id, em in linhas
+        }
+
+    def _para_colunas(self, nome_aba, cabecalho, linhas):
+        """Reordena as linhas da planilha nas colunas da tabela local"""
+        posicoes = {nome: i for i, nome in enumerate(cabecalho)}
+        indices = [posicoes.get(coluna) for coluna in self.colunas_por_aba[nome_aba]]
+        return [
+            [linha[i] if i is not None and i < len(linha) else "" for i in indices]
+            for linha in linhas
+        ]
+
+    def _gravar(self, nome_aba, cabecalho, linhas, total, completa):
+        """Substitui (completa) ou acrescenta linhas e atualiza a marca d'água"""
+        colunas = self.colunas_por_aba[nome_aba]
+        nomes = ", ".join(f'"{coluna}"' for coluna in colunas)
+        marcadores = ", ".join("?" for _ in colunas)
+        ultimo_id = str(linhas[-1][0]) if linhas and linhas[-1] else None
+
+        with self._lock:
+            conexao = self._conectar()
+            conexao.execute("BEGIN IMMEDIATE")
+            try:
+                if completa:
+                    conexao.execute(f'DELETE FROM "{nome_aba}"')
+                if linhas:
+                    conexao.executemany(
+                        f'INSERT INTO "{nome_aba}" ({nomes}) VALUES ({marcadores})',
+                        self._para_colunas(nome_aba, cabecalho, linhas)
+                    )
+                if completa:
+                    conexao.execute(
+                        "INSERT OR REPLACE INTO marcas (aba, cabecalho, linhas, ultimo_id, reconciliada_em) VALUES (?, ?, ?, ?, ?)",
+                        (nome_aba, json.dumps(cabecalho), total, ultimo_id or (cabecalho[0] if cabecalho else ""), time.time())
+                    )
+                elif linhas:
+                    conexao.execute(
+                        "UPDATE marcas SET linhas = ?, ultimo_id = ? WHERE aba = ?", (total, ultimo_id, nome_aba)
+                    )
+                conexao.execute("COMMIT")
+            except BaseException:
+                conexao.execute("ROLLBACK")
+                raise
+
+    def _ler_planilha(self, intervalos):
+        """values:batchGet dos intervalos {aba: intervalo A1 ou None para a aba inteira}"""
+        nomes = list(intervalos)
+        resposta = chamar_sheets(
+            obter_planilha().values_batch_get,
+            [absolute_range_name(nome, intervalos[nome]) if intervalos[nome] else absolute_range_name(nome) for nome in nomes]
+        )
+        return {nome: intervalo.get("values", []) for nome, intervalo in zip(nomes, resposta.get("valueRanges", []))}
+
+    def sincronizar(self, *nomes_abas):
+        """
+        Traz da planilha as linhas novas (ou as abas inteiras, se necessário)
+
+        Args:
+            nomes_abas: Abas a sincronizar
+
+        Returns:
+            dict: {nome da aba: 'completa' | 'incremental'}
+        """
+        with self._lock_sincronizacao:
+            # Pedidos feitos a partir daqui podem não estar na leitura abaixo
+            pedidos = _pedidos_ate_agora(nomes_abas)
+            marcas = self._marcas()
+            agora = time.time()
+
+            intervalos = {}
+            for nome_aba in nomes_abas:
+                marca = marcas.get(nome_aba)
+                if (marca is None or marca["linhas"] == 0 or _pendente_reconciliar(nome_aba)
+                        or agora - marca["reconciliada_em"] > self.ttl_reconciliacao):
+                    intervalos[nome_aba] = None
+                else:
+                    # A partir da última linha copiada, para conferir o ID dela
+                    ultima_coluna = rowcol_to_a1(1, max(len(marca["cabecalho"]), 1)).rstrip("1")
+                    intervalos[nome_aba] = f"A{marca['linhas']}:{ultima_coluna}"
+
+            valores = self._ler_planilha(intervalos)
+
+            modos = {}
+            divergentes = []
+            for nome_aba, intervalo in intervalos.items():
+                linhas = valores.get(nome_aba, [])
+                marca = marcas.get(nome_aba)
+
+                if intervalo is None:
+                    cabecalho = linhas[0] if linhas else []
+                    self._gravar(nome_aba, cabecalho, linhas[1:], len(linhas), completa=True)
+                    _reconciliada(nome_aba, pedidos[nome_aba])
+                    modos[nome_aba] = "completa"
+                elif not linhas or not linhas[0] or str(linhas[0][0]) != marca["ultimo_id"]:
+                    divergentes.append(nome_aba)
+                else:
+                    novas = linhas[1:]
+                    self._gravar(nome_aba, marca["cabecalho"], novas, marca["linhas"] + len(novas), completa=False)
+                    modos[nome_aba] = "incremental"
+
+            if divergentes:
+                # Linhas removidas/alteradas acima da marca d'água: relê as abas inteiras
+                log.info("🔁 Réplica: %s mudou acima da marca d'água, relendo", ", ".join(divergentes))
+                for nome_aba, linhas in self._ler_planilha({nome: None for nome in divergentes}).items():
+                    cabecalho = linhas[0] if linhas else []
+                    self._gravar(nome_aba, cabecalho, linhas[1:], len(linhas), completa=True)
+                    _reconciliada(nome_aba, pedidos[nome_aba])
+                    modos[nome_aba] = "completa"
+
+            log.debug("🔄 Réplica sincronizada: %s", modos)
+            return modos
+
+    def exigir_reconciliacao(self, *nomes_abas):
+        exigir_reconciliacao(*nomes_abas)
+
+    def ler_tabelas(self, *nomes_abas):
+        self.sincronizar(*nomes_abas)
+        return super().ler_tabelas(*nomes_abas)
+
+    def listar_exercicios(self, motor=MOTOR_PADRAO):
+        self.sincronizar(*ABAS_EXERCICIOS)
+        return super().listar_exercicios(motor)
+
+    def listar_redacoes(self):
+        self.sincronizar(*ABAS_REDACOES)
+        return super().listar_redacoes()
+
+    def listar_painel(self, motor=MOTOR_PADRAO):
+        self.sincronizar(*ABAS_PAINEL)
+        return super().listar_painel(motor)
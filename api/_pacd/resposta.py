@@ -0,0 +1,151 @@
+"""
+Respostas HTTP das listagens: ETag / If-None-Match e JSON em partes
+
+O corpo é gerado item a item (iterar_json) e enviado com Transfer-Encoding
+chunked, sem montar o JSON inteiro em memória. O ETag vem da versão da
+listagem no cache (hash do conteúdo) e da URL pedida, então pode ser
+enviado antes do corpo; quando o navegador (ou o edge) reenvia o mesmo
+valor em If-None-Match, a resposta é um 304 sem corpo.
+"""
+import hashlib
+import json
+import time
+
+from _pacd.medicao import fase
+
+
+# Pode ser armazenado pelo navegador/edge, mas sempre revalidado com o ETag
+CACHE_CONTROL_LISTAGEM = "public, max-age=0, must-revalidate"
+
+# Tamanho aproximado de cada bloco enviado
+TAMANHO_BLOCO = 64 * 1024
+
+# Cabeçalho com o instante (segundos Unix, do cabeçalho Date da resposta) da
+# última gravação feita pelo cliente
+CABECALHO_GRAVADO_EM = "X-Pacd-Gravado-Em"
+
+
+def iterar_json(valor):
+    """
+    Gera o JSON de valor em partes (bytes), com a mesma saída de json.dumps()
+
+    Dicionários e listas são percorridos; cada item de lista é serializado
+    de uma vez, então a memória usada fica limitada ao maior item.
+    """
+    if isinstance(valor, dict):
+        yield b"{"
+        for indice, (chave, item) in enumerate(valor.items()):
+            yield (", " if indice else "").encode() + json.dumps(str(chave)).encode() + b": "
+            yield from iterar_json(item)
+        yield b"}"
+    elif isinstance(valor, list):
+        yield b"["
+        for indice, item in enumerate(valor):
+            yield (b", " if indice else b"") + json.dumps(item).encode()
+        yield b"]"
+    else:
+        yield json.dumps(valor).encode()
+
+
+def gerar_etag(versao, url):
+    """ETag forte a partir da versão da listagem e da URL (filtros/paginação)"""
+    return '"' + hashlib.sha256(f"{versao}|{url}".encode()).hexdigest()[:32] + '"'
+
+
+def etag_confere(if_none_match, etag):
+    """Indica se algum valor de If-None-Match corresponde ao ETag atual"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    # If-None-Match usa comparação fraca: W/"x" confere com "x"
+    return any(valor.strip().removeprefix("W/") == etag for valor in if_none_match.split(","))
+
+
+def _escrever_bloco(handler, bloco, chunked):
+    if chunked:
+        handler.wfile.write(f"{len(bloco):X}\r\n".encode() + bloco + b"\r\n")
+    else:
+        handler.wfile.write(bloco)
+
+
+def ler_desde(handler):
+    """
+    Instante a partir do qual a listagem em cache serve para esta requisição
+
+    O frontend envia em X-Pacd-Gravado-Em o cabeçalho Date da resposta da sua
+    última gravação; um item de cache carregado antes do fim daquele segundo
+    pode não ter a gravação e é recarregado (em qualquer instância).
+    Cache-Control: no-cache pede sempre um valor novo.
+
+    Args:
+        handler: Instância de BaseHTTPRequestHandler da requisição
+
+    Returns:
+        float | None: Instante (time.time()) ou None se qualquer item serve
+    """
+    diretivas = f"{handler.headers.get('Cache-Control', '')},{handler.headers.get('Pragma', '')}"
+    if "no-cache" in diretivas.lower():
+        return time.time()
+
+    try:
+        gravado_em = float(handler.headers.get(CABECALHO_GRAVADO_EM, ""))
+    except ValueError:
+        return None
+
+    # O Date tem resolução de segundos; um valor no futuro não desativa o cache
+    return min(gravado_em + 1, time.time())
+
+
+def enviar_json_condicional(handler, resultado, versao):
+    """
+    Envia o resultado como JSON em partes com ETag, ou 304 se o cliente já o tem
+
+    Args:
+        handler: Instância de BaseHTTPRequestHandler da requisição
+        resultado: Objeto serializável em JSON (não é alterado)
+        versao: Versão da listagem retornada por CacheListagens.obter_versionado()
+
+    Returns:
+        int: Status HTTP enviado (200 ou 304)
+    """
+    etag = gerar_etag(versao, handler.path)
+
+    if etag_confere(handler.headers.get("If-None-Match"), etag):
+        handler.send_response(304)
+        handler.send_header('ETag', etag)
+        handler.send_header('Cache-Control', CACHE_CONTROL_LISTAGEM)
+        handler.send_header('Access-Control-Allow-Origin', '*')
+        handler.end_headers()
+        return 304
+
+    # Chunked só existe em HTTP/1.1; em HTTP/1.0 o fim do corpo é o fim da conexão
+    chunked = handler.request_version == "HTTP/1.1"
+    if chunked:
+        handler.protocol_version = "HTTP/1.1"
+
+    handler.send_response(200)
+    handler.send_header('Content-Type', 'application/json')
+    if chunked:
+        handler.send_header('Transfer-Encoding', 'chunked')
+    handler.send_header('Connection', 'close')
+    handler.send_header('ETag', etag)
+    handler.send_header('Cache-Control', CACHE_CONTROL_LISTAGEM)
+    handler.send_header('Access-Control-Allow-Origin', '*')
+    handler.end_headers()
+
+    with fase("serializacao"):
+        var_bytBloco = bytearray()
+        for parte in iterar_json(resultado):
+            var_bytBloco += parte
+            if len(var_bytBloco) >= TAMANHO_BLOCO:
+                _escrever_bloco(handler, bytes(var_bytBloco), chunked)
+                var_bytBloco.clear()
+
+        if var_bytBloco:
+            _escrever_bloco(handler, bytes(var_bytBloco), chunked)
+        if chunked:
+            handler.wfile.write(b"0\r\n\r\n")
+
+    return 200
@@ -0,0 +1,73 @@
+"""
+Tabela colunar leve (somente biblioteca padrão)
+
+O caminho de listagem só precisa filtrar, agrupar por ID e gerar
+dicionários. Fazer isso com listas evita importar pandas/NumPy na
+inicialização da função, que é a maior parte do cold start.
+"""
+
+
+class Tabela:
+    """Colunas da aba guardadas como {nome_coluna: lista de valores}"""
+
+    def __init__(self, colunas, tamanho=None):
+        self.colunas = colunas
+        if tamanho is None:
+            tamanho = len(next(iter(colunas.values()), []))
+        self.tamanho = tamanho
+
+    @classmethod
+    def de_linhas(cls, cabecalho, linhas):
+        """
+        Monta a tabela a partir do cabeçalho e das linhas já normalizadas
+
+        Args:
+            cabecalho: Lista com o nome das colunas
+            linhas: Lista de linhas, todas com o mesmo tamanho do cabeçalho
+
+        Returns:
+            Tabela: Tabela com uma lista por coluna
+        """
+        if not linhas:
+            return cls({nome: [] for nome in cabecalho}, 0)
+
+        return cls(
+            {nome: list(valores) for nome, valores in zip(cabecalho, zip(*linhas))},
+            len(linhas)
+        )
+
+    def __len__(self):
+        return self.tamanho
+
+    def coluna(self, nome):
+        """Retorna os valores da coluna (vazios se a coluna não existir)"""
+        if nome in self.colunas:
+            return self.colunas[nome]
+        return [""] * self.tamanho
+
+    def selecionar(self, indices):
+        """Retorna uma nova tabela apenas com as linhas informadas"""
+        return Tabela(
+            {nome: [valores[i] for i in indices] for nome, valores in self.colunas.items()},
+            len(indices)
+        )
+
+    def filtrar(self, nome, predicado):
+        """Retorna uma nova tabela com as linhas cujo valor da coluna atende ao predicado"""
+        return self.selecionar([i for i, valor in enumerate(self.coluna(nome)) if predicado(valor)])
+
+    def indices_por(self, nome):
+        """
+        Agrupa os índices das linhas pelo valor (como texto) da coluna
+
+        Returns:
+            dict: {valor: [índices das linhas, na ordem original]}
+        """
+        grupos = {}
+        for i, valor in enumerate(self.coluna(nome)):
+            grupos.setdefault(str(valor), []).append(i)
+        return grupos
+
+    def registros(self, campos):
+        """Retorna uma lista de dicionários com os campos informados"""
+        return [dict(zip(campos, linha)) for linha in zip(*(self.coluna(campo) for campo in campos))]
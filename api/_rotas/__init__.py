@@ -0,0 +1,7 @@
+"""
+Rotas da API do PACD, despachadas por api/index.py
+
+Cada módulo expõe uma classe `handler` (BaseHTTPRequestHandler) com os
+métodos do_GET/do_POST/do_OPTIONS da rota. O prefixo "_" impede a Vercel
+de publicar estes arquivos como serverless functions separadas.
+"""
@@ -0,0 +1,67 @@
+"""
+Rota para compactar exclusões lógicas no Google Sheets
+Endpoint: GET /api/compactar-exclusoes
+
+Chamado pelo cron da Vercel (vercel.json) em horário de pouco uso. Remove
+fisicamente, em lotes, as linhas marcadas como excluídas. Se CRON_SECRET
+estiver configurado, exige 'Authorization: Bearer <CRON_SECRET>', que é o
+cabeçalho enviado pelo cron.
+"""
+import json
+import os
+
+from _pacd.exclusao_logica import compactar_exclusoes
+from _pacd.log import obter_log
+from _pacd.medicao import HandlerMedido
+from _pacd.planilha import invalidar_cache_planilha
+from _pacd.replica import exigir_reconciliacao
+
+
+log = obter_log(__name__)
+
+
+class handler(HandlerMedido):
+    """Handler da rota (despachado por api/index.py)"""
+
+    def do_GET(self):
+        """Processa requisição GET"""
+        log.info("🚀 INICIANDO COMPACTAÇÃO DE EXCLUSÕES")
+
+        segredo = os.environ.get("CRON_SECRET")
+        if segredo and self.headers.get("Authorization") != f"Bearer {segredo}":
+            log.aviso("❌ ERRO: Requisição sem autorização")
+            self.send_response(401)
+            self.send_header('Content-Type', 'application/json')
+            self.end_headers()
+            self.wfile.write(json.dumps({"success": False, "error": "Não autorizado"}).encode())
+            return
+
+        try:
+            removidas = compactar_exclusoes()
+            # Só as abas que perderam linhas precisam ser relidas pela réplica
+            abas_alteradas = [nome_aba for nome_aba, total in removidas.items() if total]
+            if abas_alteradas:
+                exigir_reconciliacao(*abas_alteradas)
+
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.end_headers()
+            self.wfile.write(json.dumps({
+                "success": True,
+                "removidas": removidas,
+                "total": sum(removidas.values())
+            }).encode())
+
+        except Exception as e:
+            log.excecao("❌ ERRO DURANTE COMPACTAÇÃO: %s", e)
+            invalidar_cache_planilha(e)
+
+            # Retornar erro (cada lote é atômico; os já aplicados continuam válidos)
+            self.send_response(500)
+            self.send_header('Content-Type', 'application/json')
+            self.end_headers()
+            self.wfile.write(json.dumps({
+                "success": False,
+                "error": str(e),
+                "error_type": type(e).__name__
+            }).encode())
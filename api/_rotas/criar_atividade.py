@@ -0,0 +1,138 @@
+"""
+Rota para criar nova atividade no Google Sheets
+Endpoint: POST /api/criar-atividade
+"""
+import json
+
+from _pacd.diario import gravar_linhas
+from _pacd.log import obter_log, resumir
+from _pacd.medicao import HandlerMedido
+from _pacd.planilha import invalidar_cache_planilha
+from _pacd.registros import DERIVADOS_POR_TIPO, gerar_id_atividade, montar_linha_atividade
+
+
+log = obter_log(__name__)
+
+
+def inserir_atividade(dados):
+    """
+    Insere uma nova atividade na planilha Google Sheets
+    E também insere na tabela específica (simulados, questoes ou redacoes)
+
+    As duas linhas são gravadas em um único batchUpdate: ou a atividade é
+    criada completa, ou nada é gravado.
+
+    Args:
+        dados (dict): Dicionário com titulo, tipo, tempo_total, area, materia, assunto, questoes, acertos, comentarios
+
+    Returns:
+        dict: Resposta com id_atividade gerado
+    """
+    log.debug("📊 Função inserir_atividade iniciada: %s", resumir(dados))
+
+    try:
+        # Gerar ID da atividade
+        id_atividade = gerar_id_atividade()
+        log.debug("🆔 ID gerado: %s", id_atividade)
+
+        # Preparar linha para tabela 'atividades' (apenas dados estruturais)
+        linha = montar_linha_atividade(id_atividade, dados)
+        log.debug("📝 Linha a ser inserida em 'atividades': %s", resumir(linha))
+
+        linhas_por_aba = {"atividades": [linha]}
+
+        # Linha da tabela específica baseado no tipo
+        tipo = dados.get('tipo', '')
+        id_secundario = None
+
+        if tipo in DERIVADOS_POR_TIPO:
+            aba_derivada, montar_linha = DERIVADOS_POR_TIPO[tipo]
+            log.debug("🎯 Tipo é %s, incluindo linha em '%s'...", tipo, aba_derivada)
+            id_secundario, linha_secundaria = montar_linha(id_atividade, dados)
+            linhas_por_aba[aba_derivada] = [linha_secundaria]
+
+        # Gravar todas as linhas juntas (uma ida ao Sheets, atômica, ou pelo diário)
+        log.debug("💾 Inserindo linhas em %s...", list(linhas_por_aba))
+        pendente = gravar_linhas(linhas_por_aba)
+
+        resultado = {
+            "success": True,
+            "id_atividade": id_atividade,
+            "id_secundario": id_secundario,
+            "pendente": pendente,
+            "message": "Atividade criada com sucesso"
+        }
+        log.info("✅ Atividade %s criada", id_atividade, tipo=tipo, pendente=pendente)
+        return resultado
+
+    except Exception as e:
+        log.erro("❌ ERRO em inserir_atividade: %s", e)
+        invalidar_cache_planilha(e)
+        raise
+
+
+class handler(HandlerMedido):
+    """Handler da rota (despachado por api/index.py)"""
+
+    def do_POST(self):
+        """Processa requisição POST"""
+        log.debug("🚀 INICIANDO PROCESSAMENTO DA REQUISIÇÃO")
+
+        try:
+            # Ler corpo da requisição
+            content_length = int(self.headers.get('Content-Length', 0))
+            body = self.rfile.read(content_length)
+            log.debug("📦 Body (%d bytes): %s", content_length, resumir(body))
+
+            dados = json.loads(body.decode('utf-8'))
+
+            # Validar dados obrigatórios
+            campos_obrigatorios = ['titulo', 'tipo', 'tempo_total']
+            for campo in campos_obrigatorios:
+                valor = dados.get(campo)
+
+                if not valor:
+                    log.aviso("❌ ERRO: Campo obrigatório ausente: %s", campo)
+                    self.send_response(400)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Access-Control-Allow-Origin', '*')
+                    self.end_headers()
+                    error_response = {
+                        "success": False,
+                        "error": f"Campo obrigatório ausente: {campo}"
+                    }
+                    self.wfile.write(json.dumps(error_response).encode())
+                    return
+
+            # Inserir atividade
+            resultado = inserir_atividade(dados)
+
+            # Retornar sucesso
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(json.dumps(resultado).encode())
+
+        except Exception as e:
+            log.excecao("❌ ERRO DURANTE PROCESSAMENTO: %s", e, tipo_erro=type(e).__name__)
+
+            # Retornar erro
+            self.send_response(500)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            error_response = {
+                "success": False,
+                "error": str(e),
+                "error_type": type(e).__name__
+            }
+            self.wfile.write(json.dumps(error_response).encode())
+
+    def do_OPTIONS(self):
+        """Processa requisição OPTIONS para CORS"""
+        self.send_response(200)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Allow-Methods', 'POST, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.end_headers()
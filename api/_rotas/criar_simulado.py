@@ -0,0 +1,89 @@
+"""
+Rota para criar novo simulado
+Endpoint: POST /api/criar-simulado
+"""
+import json
+
+from _pacd.diario import gravar_linhas
+from _pacd.log import obter_log
+from _pacd.medicao import HandlerMedido
+from _pacd.planilha import invalidar_cache_planilha
+from _pacd.registros import montar_linha_simulado
+
+
+log = obter_log(__name__)
+
+
+def inserir_simulado(id_atividade, dados):
+    id_simulado, linha = montar_linha_simulado(id_atividade, dados)
+
+    pendente = gravar_linhas({"simulados": [linha]})
+
+    return {
+        "id_simulado": id_simulado,
+        "id_atividade": id_atividade,
+        "pendente": pendente
+    }
+
+
+class handler(HandlerMedido):
+
+    def do_POST(self):
+        try:
+            content_length = int(self.headers.get("Content-Length", 0))
+            body = self.rfile.read(content_length)
+            dados = json.loads(body.decode("utf-8"))
+
+            id_atividade = dados.get("id_atividade")
+            if not id_atividade:
+                self.send_response(400)
+                self.end_headers()
+                self.wfile.write(json.dumps({
+                    "success": False,
+                    "error": "id_atividade é obrigatório"
+                }).encode())
+                return
+
+            resultado = inserir_simulado(id_atividade, dados)
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+
+            self.wfile.write(json.dumps({
+                "success": True,
+                "data": resultado
+            }).encode())
+
+        except Exception as e:
+            log.excecao("❌ ERRO DURANTE PROCESSAMENTO: %s", e, tipo_erro=type(e).__name__)
+            invalidar_cache_planilha(e)
+            self.send_response(500)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            self.wfile.write(json.dumps({
+                "success": False,
+                "error": str(e)
+            }).encode())
+
+    def do_OPTIONS(self):
+        self.send_response(200)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Methods", "POST, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.end_headers()
+
+if __name__ == '__main__':
+    param = {
+        "area": "Linguagens",
+        "questoes": 45,
+        "acertos": 42,
+        "tempo_total": "02:00",
+        "comentarios": "Teste criar_simulado",
+        "dt_realizado": '01/01/2025'
+    }
+
+
+    inserir_simulado(12391, param)
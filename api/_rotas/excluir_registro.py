@@ -0,0 +1,261 @@
+"""
+Rota para excluir registros no Google Sheets
+Endpoint: POST /api/excluir-atividade
+
+Corpo: {"tipo", "id"} para um registro, ou {"itens": [{"tipo", "id"}, ...]}
+para excluir vários de uma vez.
+"""
+import json
+
+from _pacd.armazenamento import obter_armazenamento
+from _pacd.diario import sincronizar_diario
+from _pacd.log import obter_log, resumir
+from _pacd.medicao import HandlerMedido
+from _pacd.planilha import invalidar_cache_planilha
+
+
+log = obter_log(__name__)
+
+
+# Abas cujos registros apontam para a atividade pela coluna B (ID_ATIVIDADE)
+ABAS_DERIVADAS = ["simulados", "questoes", "redacoes"]
+
+# Aba de cada tipo de registro derivado
+ABA_POR_TIPO = {"Simulado": "simulados", "Questões": "questoes", "Redação": "redacoes"}
+
+
+def excluir_registro(var_strAba, var_intIdRegistro):
+    """
+    Exclui um registro com base no ID
+
+    No Google Sheets, a linha é localizada pelo índice ID -> linha da aba
+    (só a coluna A é lida), sem baixar a aba inteira. Com
+    PACD_EXCLUSAO_LOGICA ativo, a linha só é marcada como excluída (ver
+    _pacd.exclusao_logica).
+
+    Args:
+        var_strAba: nome da aba
+        var_intIdRegistro: valor do ID (coluna A) a ser excluído
+    """
+    log.debug("🗑️  Iniciando exclusão em '%s' para ID %s", var_strAba, var_intIdRegistro)
+
+    # O registro pode ainda estar no diário de gravação
+    sincronizar_diario()
+
+    var_bolExcluido = obter_armazenamento().excluir_por_id(var_strAba, var_intIdRegistro)
+    if var_bolExcluido:
+        log.info("✅ Registro %s removido de '%s'", var_intIdRegistro, var_strAba)
+    else:
+        log.info("⚠️ Registro %s não encontrado em '%s'", var_intIdRegistro, var_strAba)
+    return var_bolExcluido
+
+
+def excluir_em_lote(var_listItens):
+    """
+    Exclui vários registros (e atividades completas) de uma só vez
+
+    No Google Sheets, uma única leitura traz as colunas necessárias de todas
+    as abas envolvidas (IDs na coluna A; ID_ATIVIDADE na coluna B das
+    derivadas) e todas as linhas encontradas são excluídas em um único
+    batchUpdate (atômico), com linhas vizinhas agrupadas em intervalos. Com
+    exclusão lógica, as células de ID são marcadas em um único
+    values:batchUpdate.
+
+    Args:
+        var_listItens: Lista de {"tipo": "Atividade"|"Simulado"|"Questões"|"Redação", "id": ...}
+
+    Returns:
+        list: Resultado por item ({"tipo", "id", "success", "error"?})
+    """
+    log.debug("🧹 Exclusão em lote iniciada (%d itens)", len(var_listItens))
+
+    var_listResultados = []
+    var_listPedidos = []
+
+    for var_dicItem in var_listItens:
+        var_strTipo = var_dicItem.get("tipo")
+        var_strId = str(var_dicItem.get("id") or "")
+        var_dicResultado = {"tipo": var_strTipo, "id": var_dicItem.get("id"), "success": False}
+        var_listResultados.append(var_dicResultado)
+
+        if not var_strId:
+            var_dicResultado["error"] = "Campos obrigatórios: tipo, id"
+            continue
+
+        var_strAba = "atividades" if var_strTipo == "Atividade" else ABA_POR_TIPO.get(var_strTipo)
+        if var_strAba is None:
+            var_dicResultado["error"] = "Tipo inválido para exclusão"
+            continue
+
+        var_listPedidos.append((var_dicResultado, var_strAba, var_strId))
+
+    if var_listPedidos:
+        # Os registros podem ainda estar no diário de gravação
+        sincronizar_diario()
+
+        # Atividade: também todos os registros derivados com ID_ATIVIDADE igual
+        var_listExcluidos = obter_armazenamento().excluir_lote(
+            [(var_strAba, var_strId) for _, var_strAba, var_strId in var_listPedidos], ABAS_DERIVADAS
+        )
+        for (var_dicResultado, _, _), var_bolExcluido in zip(var_listPedidos, var_listExcluidos):
+            if var_bolExcluido:
+                var_dicResultado["success"] = True
+            else:
+                var_dicResultado["error"] = "Registro não encontrado"
+
+    var_intExcluidos = sum(1 for var_dicResultado in var_listResultados if var_dicResultado["success"])
+    log.info("✅ Exclusão em lote finalizada: %d de %d itens", var_intExcluidos, len(var_listItens))
+    return var_listResultados
+
+
+def excluir_atividade(var_intIdRegistro, var_strTipoAtividade=None):
+    """
+    Exclui uma atividade e todos os seus registros derivados
+
+    Uma única leitura traz a coluna de IDs de 'atividades' e a coluna
+    ID_ATIVIDADE das abas derivadas; todas as linhas encontradas são
+    excluídas em um único batchUpdate (atômico).
+
+    Args:
+        var_intIdRegistro: ID da atividade
+        var_strTipoAtividade: aba derivada informada pelo frontend. Mantido
+            por compatibilidade: todas as abas derivadas são verificadas.
+    """
+    var_dicResultado = excluir_em_lote([{"tipo": "Atividade", "id": var_intIdRegistro}])[0]
+
+    if not var_dicResultado["success"]:
+        return False
+
+    return True
+
+
+def processar_exclusao(dados):
+    """
+    Processa exclusão baseada no tipo
+    """
+    log.debug("📊 Função processar_exclusao iniciada: %s", resumir(dados))
+
+    var_strTipo = dados.get("tipo")
+    var_intIdRegistro = dados.get("id")
+
+    if var_strTipo == "Atividade":
+        return excluir_atividade(var_intIdRegistro, dados.get("tipo_atividade"))
+
+    if var_strTipo in ABA_POR_TIPO:
+        return excluir_registro(ABA_POR_TIPO[var_strTipo], var_intIdRegistro)
+
+    raise ValueError("Tipo inválido para exclusão")
+
+
+class handler(HandlerMedido):
+    """Handler da rota (despachado por api/index.py)"""
+
+    def do_POST(self):
+        log.debug("🚀 INICIANDO EXCLUSÃO DE REGISTRO")
+
+        try:
+            content_length = int(self.headers.get("Content-Length", 0))
+            body = self.rfile.read(content_length)
+            dados = json.loads(body.decode("utf-8"))
+
+            log.debug("📦 Payload recebido: %s", resumir(dados))
+
+            # Exclusão em lote
+            if "itens" in dados:
+                var_listItens = dados["itens"]
+                if not isinstance(var_listItens, list) or not var_listItens \
+                        or not all(isinstance(var_dicItem, dict) for var_dicItem in var_listItens):
+                    self.send_response(400)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Access-Control-Allow-Origin", "*")
+                    self.end_headers()
+                    self.wfile.write(json.dumps({
+                        "success": False,
+                        "error": "itens deve ser uma lista de objetos {tipo, id}"
+                    }).encode())
+                    return
+
+                var_listResultados = excluir_em_lote(var_listItens)
+                var_intExcluidos = sum(1 for r in var_listResultados if r["success"])
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.end_headers()
+                self.wfile.write(json.dumps({
+                    "success": var_intExcluidos == len(var_listResultados),
+                    "excluidos": var_intExcluidos,
+                    "resultados": var_listResultados
+                }).encode())
+                return
+
+            if not dados.get("tipo") or not dados.get("id"):
+                self.send_response(400)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.end_headers()
+                self.wfile.write(json.dumps({
+                    "success": False,
+                    "error": "Campos obrigatórios: tipo, id"
+                }).encode())
+                return
+
+            sucesso = processar_exclusao(dados)
+
+            if not sucesso:
+                self.send_response(404)
+                resposta = {
+                    "success": False,
+                    "error": "Registro não encontrado"
+                }
+            else:
+                self.send_response(200)
+                resposta = {
+                    "success": True,
+                    "message": "Registro excluído com sucesso"
+                }
+
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            self.wfile.write(json.dumps(resposta).encode())
+
+        except Exception as e:
+            log.excecao("❌ ERRO DURANTE EXCLUSÃO: %s", e, tipo_erro=type(e).__name__)
+            invalidar_cache_planilha(e)
+
+            self.send_response(500)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            self.wfile.write(json.dumps({
+                "success": False,
+                "error": str(e),
+                "error_type": type(e).__name__
+            }).encode())
+
+    def do_OPTIONS(self):
+        self.send_response(200)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Methods", "POST, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.end_headers()
+
+if __name__ == '__main__':
+    
+    #Excluir Atividade Completa
+    param = {
+        "id": '17002',
+        "tipo": "Atividade",
+        "tipo_atividade": "simulados"
+    }
+
+    processar_exclusao(param)
+    
+    #Excluir simulados/questoes
+    param = {
+            "tipo": "simulados",
+            "id": "SIM123456"
+            }
+
+    processar_exclusao(param)
\ No newline at end of file
@@ -0,0 +1,277 @@
+"""
+Rota para importar atividades em lote no Google Sheets
+Endpoint: POST /api/importar-atividades
+
+Aceita um array JSON (Content-Type: application/json) ou um CSV com
+cabeçalho (Content-Type: text/csv) com os mesmos campos de criar_atividade.
+Linhas com id_atividade acrescentam só o registro derivado (simulado,
+questões ou redação) a uma atividade existente, do mesmo tipo: as colunas
+de ID e TIPO de 'atividades' são lidas uma vez para conferir todas.
+
+Todas as linhas válidas são gravadas em um único batchUpdate; as inválidas
+são devolvidas com os erros, sem impedir a importação das demais.
+"""
+import csv
+import io
+import json
+
+from _pacd.armazenamento import obter_armazenamento
+from _pacd.diario import gravar_linhas, sincronizar_diario
+from _pacd.log import obter_log
+from _pacd.medicao import HandlerMedido
+from _pacd.planilha import invalidar_cache_planilha
+from _pacd.registros import DERIVADOS_POR_TIPO, gerar_id_atividade, montar_linha_atividade
+
+
+log = obter_log(__name__)
+
+
+# Limite de registros por requisição
+MAX_REGISTROS = 1000
+
+CAMPOS_OBRIGATORIOS = ['titulo', 'tipo', 'tempo_total']
+CAMPOS_NUMERICOS = ['questoes', 'acertos', 'c1', 'c2', 'c3', 'c4', 'c5']
+
+
+def ler_registros(corpo, tipo_conteudo):
+    """
+    Converte o corpo da requisição em lista de registros
+
+    Args:
+        corpo: Bytes recebidos
+        tipo_conteudo: Cabeçalho Content-Type
+
+    Returns:
+        list: Dicionários, um por linha
+
+    Raises:
+        ValueError: Se o corpo não for um array JSON ou CSV válido
+    """
+    texto = corpo.decode("utf-8-sig")
+
+    if "csv" in (tipo_conteudo or ""):
+        # Planilhas exportadas em pt-BR costumam usar ';'
+        primeira_linha = texto.split("\n", 1)[0]
+        delimitador = ";" if primeira_linha.count(";") > primeira_linha.count(",") else ","
+        leitor = csv.DictReader(io.StringIO(texto), delimiter=delimitador)
+        return [
+            {chave.strip().lower(): (valor or "").strip() for chave, valor in linha.items() if chave}
+            for linha in leitor
+        ]
+
+    registros = json.loads(texto)
+    if not isinstance(registros, list):
+        raise ValueError("O corpo deve ser um array JSON de registros")
+    return registros
+
+
+def _normalizar_numero(valor):
+    """Número do campo ou None se não for um inteiro/decimal não negativo"""
+    if isinstance(valor, bool):
+        return None
+    if isinstance(valor, (int, float)):
+        return valor if valor >= 0 else None
+
+    texto = str(valor).strip().replace(",", ".")
+    try:
+        numero = float(texto)
+    except ValueError:
+        return None
+    if numero < 0:
+        return None
+    return int(numero) if numero.is_integer() else numero
+
+
+def validar_registro(registro):
+    """
+    Valida um registro e normaliza os campos numéricos
+
+    Args:
+        registro: Dicionário recebido
+
+    Returns:
+        tuple: (registro normalizado, lista de erros)
+    """
+    if not isinstance(registro, dict):
+        return None, ["Registro deve ser um objeto"]
+
+    dados = dict(registro)
+    erros = []
+
+    if not dados.get('id_atividade'):
+        for campo in CAMPOS_OBRIGATORIOS:
+            if not dados.get(campo):
+                erros.append(f"Campo obrigatório ausente: {campo}")
+
+    if dados.get('tipo') not in DERIVADOS_POR_TIPO:
+        erros.append(f"Tipo inválido: {dados.get('tipo')!r}")
+
+    for campo in CAMPOS_NUMERICOS:
+        if dados.get(campo) in (None, ""):
+            continue
+        numero = _normalizar_numero(dados[campo])
+        if numero is None:
+            erros.append(f"Campo numérico inválido: {campo}")
+        else:
+            dados[campo] = numero
+
+    questoes, acertos = dados.get('questoes'), dados.get('acertos')
+    if isinstance(questoes, (int, float)) and isinstance(acertos, (int, float)) and acertos > questoes:
+        erros.append("Acertos não pode ser maior que o total de questões")
+
+    return dados, erros
+
+
+def ler_tipos_atividades():
+    """
+    Tipos das atividades existentes, lidos em uma única chamada
+
+    Returns:
+        dict: {ID_ATIVIDADE: conjunto de TIPOs} (IDs legados podem se repetir)
+    """
+    # A atividade pode ainda estar no diário de gravação
+    sincronizar_diario()
+
+    colunas = obter_armazenamento().ler_colunas("atividades", "ID_ATIVIDADE", "TIPO")
+    tipos = {}
+    for id_atividade, tipo in zip(colunas["ID_ATIVIDADE"], colunas["TIPO"]):
+        tipos.setdefault(str(id_atividade), set()).add(tipo)
+    return tipos
+
+
+def conferir_atividade(dados, tipos_atividades):
+    """
+    Confere se a atividade referenciada por id_atividade existe e é do mesmo tipo
+
+    Returns:
+        list: Erros (vazia se a atividade confere)
+    """
+    id_atividade = str(dados['id_atividade'])
+    tipos = tipos_atividades.get(id_atividade)
+    if not tipos:
+        return [f"Atividade não encontrada: {id_atividade!r}"]
+    if dados['tipo'] not in tipos:
+        return [f"Tipo {dados['tipo']!r} diferente do tipo da atividade {id_atividade!r} ({', '.join(sorted(tipos))})"]
+    return []
+
+
+def importar_registros(registros):
+    """
+    Valida, gera IDs e grava todos os registros válidos de uma vez
+
+    Os IDs vêm do gerador compartilhado (_pacd.ids): únicos e em ordem
+    crescente dentro do lote.
+
+    Args:
+        registros: Lista de dicionários (ver ler_registros)
+
+    Returns:
+        dict: Totais e resultado por linha
+    """
+    log.debug("📊 Função importar_registros iniciada (%d registros)", len(registros))
+
+    if len(registros) > MAX_REGISTROS:
+        raise ValueError(f"Máximo de {MAX_REGISTROS} registros por importação")
+
+    linhas_por_aba = {"atividades": []}
+    resultados = []
+
+    validados = [validar_registro(registro) for registro in registros]
+
+    # Linhas que acrescentam a uma atividade existente: uma única leitura confere todas
+    tipos_atividades = {}
+    if any(not erros and dados.get('id_atividade') for dados, erros in validados):
+        tipos_atividades = ler_tipos_atividades()
+
+    for indice, (dados, erros) in enumerate(validados):
+        if not erros and dados.get('id_atividade'):
+            erros = conferir_atividade(dados, tipos_atividades)
+        if erros:
+            resultados.append({"linha": indice + 1, "success": False, "errors": erros})
+            continue
+
+        aba_derivada, montar_linha = DERIVADOS_POR_TIPO[dados['tipo']]
+
+        id_atividade = dados.get('id_atividade')
+        if not id_atividade:
+            id_atividade = gerar_id_atividade()
+            linhas_por_aba["atividades"].append(montar_linha_atividade(id_atividade, dados))
+
+        id_secundario, linha = montar_linha(id_atividade, dados)
+        linhas_por_aba.setdefault(aba_derivada, []).append(linha)
+
+        resultados.append({
+            "linha": indice + 1,
+            "success": True,
+            "id_atividade": id_atividade,
+            "id_secundario": id_secundario
+        })
+
+    importados = sum(1 for resultado in resultados if resultado["success"])
+
+    pendente = False
+    if importados:
+        # Uma única ida ao Sheets para todas as abas (atômica, ou pelo diário)
+        pendente = gravar_linhas(linhas_por_aba)
+        log.info(
+            "💾 %d registros gravados em %s", importados, [aba for aba, linhas in linhas_por_aba.items() if linhas],
+            pendente=pendente
+        )
+
+    return {
+        "success": importados > 0 or not registros,
+        "pendente": pendente,
+        "importados": importados,
+        "rejeitados": len(resultados) - importados,
+        "resultados": resultados
+    }
+
+
+class handler(HandlerMedido):
+    """Handler da rota (despachado por api/index.py)"""
+
+    def do_POST(self):
+        """Processa requisição POST"""
+        log.debug("🚀 INICIANDO IMPORTAÇÃO EM LOTE")
+
+        try:
+            content_length = int(self.headers.get('Content-Length', 0))
+            body = self.rfile.read(content_length)
+
+            try:
+                registros = ler_registros(body, self.headers.get('Content-Type'))
+                resultado = importar_registros(registros)
+                status = 200 if resultado["success"] else 400
+            except ValueError as e:
+                log.aviso("❌ ERRO: Corpo inválido: %s", e)
+                status = 400
+                resultado = {"success": False, "error": str(e)}
+
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(json.dumps(resultado).encode())
+
+        except Exception as e:
+            log.excecao("❌ ERRO DURANTE PROCESSAMENTO: %s", e, tipo_erro=type(e).__name__)
+            invalidar_cache_planilha(e)
+
+            # Retornar erro (o batchUpdate é atômico: nada foi gravado)
+            self.send_response(500)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(json.dumps({
+                "success": False,
+                "error": str(e),
+                "error_type": type(e).__name__
+            }).encode())
+
+    def do_OPTIONS(self):
+        """Processa requisição OPTIONS para CORS"""
+        self.send_response(200)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Allow-Methods', 'POST, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.end_headers()
@@ -0,0 +1,122 @@
+"""
+Rota para listar atividades do Google Sheets
+Endpoint: GET /api/listar-atividades
+
+Query string opcional: tipo, area, materia (aceitam vírgulas), fields
+(ex.: ID_ATIVIDADE,TITULO,INFO.AREA), limit e cursor (next_cursor da
+página anterior).
+"""
+import json
+from urllib.parse import parse_qs, urlparse
+
+from _pacd.armazenamento import obter_armazenamento
+from _pacd.cache import cache_listagens
+from _pacd.consulta import aplicar_consulta, ler_consulta
+from _pacd.diario import sincronizar_diario
+from _pacd.listagem import MOTOR_PADRAO, ler_motor
+from _pacd.log import obter_log
+from _pacd.log import obter_log
+from _pacd.medicao import HandlerMedido
+from _pacd.planilha import invalidar_cache_planilha
+from _pacd.resposta import enviar_json_condicional, ler_desde
+
+
+log = obter_log(__name__)
+
+
+log = obter_log(__name__)
+
+
+def listar_atividades(motor=MOTOR_PADRAO, desde=None):
+    """
+    Lista todas as atividades com seus dados detalhados (simulados e questões)
+
+    Args:
+        motor: MOTOR_PADRAO ou MOTOR_PANDAS (modo analítico, importa pandas)
+        desde: Instante mínimo de carregamento da listagem em cache (ver ler_desde)
+
+    Returns:
+        tuple: (lista de atividades com dados completos, versão da listagem no cache)
+    """
+    try:
+        # Gravações ainda no diário entram na planilha antes da leitura
+        sincronizar_diario()
+
+        # Ler abas 'atividades', 'simulados' e 'questoes' em uma única chamada
+        # (somente quando a listagem não está no cache)
+        var_jsonFinal, versao = cache_listagens.obter_versionado(
+            f"exercicios:{motor}", lambda: obter_armazenamento().listar_exercicios(motor), desde
+        )
+        return var_jsonFinal, versao
+
+    except Exception as e:
+        log.erro("❌ ERRO em listar_atividades: %s", e)
+        invalidar_cache_planilha(e)
+        raise
+
+
+class handler(HandlerMedido):
+    """Handler da rota (despachado por api/index.py)"""
+
+    def do_GET(self):
+        """Processa requisição GET"""
+        log.debug("🚀 INICIANDO PROCESSAMENTO DA REQUISIÇÃO GET")
+
+        try:
+            # Validar motor, filtros, projeção e paginação da query string
+            var_dicParametros = parse_qs(urlparse(self.path).query)
+            try:
+                motor = ler_motor(var_dicParametros)
+                consulta = ler_consulta(var_dicParametros)
+            except ValueError as e:
+                log.aviso("❌ ERRO: Parâmetro inválido: %s", e)
+                self.send_response(400)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.end_headers()
+                self.wfile.write(json.dumps({"success": False, "error": str(e)}).encode())
+                return
+
+            # Listar atividades
+            atividades, versao = listar_atividades(motor, ler_desde(self))
+
+            # Filtrar e paginar antes de serializar (o payload em cache não é alterado)
+            pagina, total, proximo_cursor = aplicar_consulta(atividades, consulta)
+            log.debug("✅ %d de %d atividades retornadas", len(pagina), total)
+
+            resultado = {
+                "success": True,
+                "data": pagina,
+                "total": total,
+                "next_cursor": proximo_cursor
+            }
+
+            # Retornar sucesso (ou 304 se o cliente já tem esta versão)
+            status = enviar_json_condicional(self, resultado, versao)
+            log.debug("📤 Resposta enviada com status %s", status)
+
+        except Exception as e:
+            log.excecao("❌ ERRO DURANTE PROCESSAMENTO: %s", e, tipo_erro=type(e).__name__)
+
+            # Retornar erro
+            self.send_response(500)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            error_response = {
+                "success": False,
+                "error": str(e),
+                "error_type": type(e).__name__
+            }
+            self.wfile.write(json.dumps(error_response).encode())
+
+    def do_OPTIONS(self):
+        """Processa requisição OPTIONS para CORS"""
+        self.send_response(200)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Allow-Methods', 'GET, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type, If-None-Match, Cache-Control, X-Pacd-Gravado-Em')
+        self.end_headers()
+        
+if __name__ == '__main__':
+    listar_atividades()
@@ -0,0 +1,112 @@
+"""
+Rota para listar exercícios e redações em uma única chamada
+Endpoint: GET /api/listar-painel
+"""
+import json
+from urllib.parse import parse_qs, urlparse
+
+from _pacd.armazenamento import obter_armazenamento
+from _pacd.cache import cache_listagens
+from _pacd.diario import sincronizar_diario
+from _pacd.listagem import MOTOR_PADRAO, ler_motor
+from _pacd.log import obter_log
+from _pacd.log import obter_log
+from _pacd.medicao import HandlerMedido
+from _pacd.planilha import invalidar_cache_planilha
+from _pacd.resposta import enviar_json_condicional, ler_desde
+
+
+log = obter_log(__name__)
+
+
+log = obter_log(__name__)
+
+
+def listar_painel(motor=MOTOR_PADRAO, desde=None):
+    """
+    Lista exercícios e redações lendo a aba 'atividades' uma única vez
+
+    Args:
+        motor: MOTOR_PADRAO ou MOTOR_PANDAS (modo analítico, importa pandas)
+        desde: Instante mínimo de carregamento do painel em cache (ver ler_desde)
+
+    Returns:
+        tuple: ({'exercicios': [...], 'redacoes': [...]}, versão do painel no cache)
+    """
+    try:
+        # Gravações ainda no diário entram na planilha antes da leitura
+        sincronizar_diario()
+
+        # Lê a planilha somente quando o painel não está no cache
+        # ('atividades' é lida uma vez e dividida por TIPO na montagem)
+        return cache_listagens.obter_versionado(
+            f"painel:{motor}", lambda: obter_armazenamento().listar_painel(motor), desde
+        )
+
+    except Exception as e:
+        log.erro("❌ ERRO em listar_painel: %s", e)
+        invalidar_cache_planilha(e)
+        raise
+
+
+class handler(HandlerMedido):
+    """Handler da rota (despachado por api/index.py)"""
+
+    def do_GET(self):
+        """Processa requisição GET"""
+        log.debug("🚀 INICIANDO PROCESSAMENTO DA REQUISIÇÃO GET")
+
+        try:
+            var_dicParametros = parse_qs(urlparse(self.path).query)
+            try:
+                motor = ler_motor(var_dicParametros)
+            except ValueError as e:
+                log.aviso("❌ ERRO: Parâmetro inválido: %s", e)
+                self.send_response(400)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.end_headers()
+                self.wfile.write(json.dumps({"success": False, "error": str(e)}).encode())
+                return
+
+            painel, versao = listar_painel(motor, ler_desde(self))
+            log.debug("✅ %d exercícios e %d redações retornados", len(painel['exercicios']), len(painel['redacoes']))
+
+            resultado = {
+                "success": True,
+                "data": painel,
+                "total": {
+                    "exercicios": len(painel["exercicios"]),
+                    "redacoes": len(painel["redacoes"])
+                }
+            }
+
+            # Retornar sucesso (ou 304 se o cliente já tem esta versão)
+            status = enviar_json_condicional(self, resultado, versao)
+            log.debug("📤 Resposta enviada com status %s", status)
+
+        except Exception as e:
+            log.excecao("❌ ERRO DURANTE PROCESSAMENTO: %s", e, tipo_erro=type(e).__name__)
+
+            # Retornar erro
+            self.send_response(500)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            error_response = {
+                "success": False,
+                "error": str(e),
+                "error_type": type(e).__name__
+            }
+            self.wfile.write(json.dumps(error_response).encode())
+
+    def do_OPTIONS(self):
+        """Processa requisição OPTIONS para CORS"""
+        self.send_response(200)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Allow-Methods', 'GET, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type, If-None-Match, Cache-Control, X-Pacd-Gravado-Em')
+        self.end_headers()
+
+if __name__ == '__main__':
+    listar_painel()
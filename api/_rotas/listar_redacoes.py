@@ -0,0 +1,99 @@
+"""
+Rota para listar atividades do Google Sheets
+Endpoint: GET /api/listar-atividades
+"""
+import json
+
+from _pacd.armazenamento import obter_armazenamento
+from _pacd.cache import cache_listagens
+from _pacd.diario import sincronizar_diario
+from _pacd.log import obter_log, resumir
+from _pacd.log import obter_log
+from _pacd.medicao import HandlerMedido
+from _pacd.planilha import invalidar_cache_planilha
+from _pacd.resposta import enviar_json_condicional, ler_desde
+
+
+log = obter_log(__name__)
+
+
+log = obter_log(__name__)
+
+
+def listar_redacoes(desde=None):
+    """
+    Lista todas as redações com seus dados detalhados (redações)
+
+    Args:
+        desde: Instante mínimo de carregamento da listagem em cache (ver ler_desde)
+
+    Returns:
+        tuple: (lista de redações com dados completos, versão da listagem no cache)
+    """
+    try:
+        # Gravações ainda no diário entram na planilha antes da leitura
+        sincronizar_diario()
+
+        # Ler abas 'atividades' e 'redacoes' em uma única chamada
+        # (somente quando a listagem não está no cache)
+        var_jsonFinal, versao = cache_listagens.obter_versionado(
+            "redacoes",
+            lambda: obter_armazenamento().listar_redacoes(),
+            desde
+        )
+        log.debug("📋 Redações: %s", resumir(var_jsonFinal))
+        return var_jsonFinal, versao
+
+    except Exception as e:
+        log.erro("❌ ERRO em listar_redacoes: %s", e)
+        invalidar_cache_planilha(e)
+        raise
+
+
+class handler(HandlerMedido):
+    """Handler da rota (despachado por api/index.py)"""
+
+    def do_GET(self):
+        """Processa requisição GET"""
+        log.debug("🚀 INICIANDO PROCESSAMENTO DA REQUISIÇÃO GET")
+
+        try:
+            # Listar atividades
+            atividades, versao = listar_redacoes(ler_desde(self))
+            log.debug("✅ %d redações retornadas", len(atividades))
+
+            resultado = {
+                "success": True,
+                "data": atividades,
+                "total": len(atividades)
+            }
+
+            # Retornar sucesso (ou 304 se o cliente já tem esta versão)
+            status = enviar_json_condicional(self, resultado, versao)
+            log.debug("📤 Resposta enviada com status %s", status)
+
+        except Exception as e:
+            log.excecao("❌ ERRO DURANTE PROCESSAMENTO: %s", e, tipo_erro=type(e).__name__)
+
+            # Retornar erro
+            self.send_response(500)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            error_response = {
+                "success": False,
+                "error": str(e),
+                "error_type": type(e).__name__
+            }
+            self.wfile.write(json.dumps(error_response).encode())
+
+    def do_OPTIONS(self):
+        """Processa requisição OPTIONS para CORS"""
+        self.send_response(200)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Allow-Methods', 'GET, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type, If-None-Match, Cache-Control, X-Pacd-Gravado-Em')
+        self.end_headers()
+        
+if __name__ == '__main__':
+    listar_redacoes()
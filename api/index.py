@@ -0,0 +1,112 @@
+"""
+Serverless function única do PACD: despacha /api/<rota> para a rota
+Endpoint: /api/* (vercel.json reescreve todos os caminhos de /api para cá)
+
+Com uma só função, a instância "quente" (cliente gspread, caches, índices,
+diário) é compartilhada por todos os endpoints e cada instância nova só
+paga um cold start. As rotas ficam em api/_rotas (o prefixo "_" impede a
+Vercel de publicá-las como funções separadas) e cada módulo é importado
+na primeira requisição que o usa.
+"""
+import importlib
+import json
+from urllib.parse import urlparse
+
+from _pacd.log import obter_log
+from _pacd.medicao import HandlerMedido
+
+
+log = obter_log(__name__)
+
+
+# Nome da rota no caminho -> módulo em api/_rotas
+ROTAS = {
+    "compactar_exclusoes": "compactar_exclusoes",
+    "criar_atividade": "criar_atividade",
+    "criar_questoes": "criar_questoes",
+    "criar_simulado": "criar_simulado",
+    "excluir_registro": "excluir_registro",
+    "importar_atividades": "importar_atividades",
+    "listar_exercicios": "listar_exercicios",
+    "listar_painel": "listar_painel",
+    "listar_redacoes": "listar_redacoes",
+}
+
+_handlers = {}
+
+
+def nome_rota(caminho):
+    """
+    Rota de um caminho da requisição
+
+    Só um segmento depois de /api é aceito: '/api/listar/painel' não é
+    uma rota (as rotas não têm subcaminhos).
+
+    Args:
+        caminho: Ex.: '/api/listar-painel?motor=pandas'
+
+    Returns:
+        str | None: Ex.: 'listar_painel' (hífens viram '_'), ou None se o
+            caminho tiver mais de um segmento
+    """
+    partes = urlparse(caminho).path.strip("/").split("/")
+    if partes and partes[0] == "api":
+        partes = partes[1:]
+    if len(partes) != 1:
+        return None
+    return partes[0].replace("-", "_")
+
+
+def obter_handler(rota):
+    """
+    Classe handler da rota, importando o módulo na primeira vez
+
+    Returns:
+        type | None: Classe handler ou None se a rota não existir
+    """
+    if rota not in ROTAS:
+        return None
+    if rota not in _handlers:
+        _handlers[rota] = importlib.import_module(f"_rotas.{ROTAS[rota]}").handler
+    return _handlers[rota]
+
+
+class handler(HandlerMedido):
+    """Handler para Vercel Serverless Functions: delega ao handler da rota"""
+
+    def _responder_erro(self, status, mensagem, cabecalhos=None):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        for nome, valor in (cabecalhos or {}).items():
+            self.send_header(nome, valor)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(json.dumps({"success": False, "error": mensagem}).encode())
+
+    def _despachar(self):
+        rota = nome_rota(self.path)
+        classe = obter_handler(rota)
+        if classe is None:
+            log.aviso("❌ ERRO: Rota não encontrada: %s", self.path)
+            self._responder_erro(404, "Rota não encontrada")
+            return
+
+        # Os handlers das rotas só usam a interface de BaseHTTPRequestHandler,
+        # então o método roda sobre esta mesma requisição
+        metodo = getattr(classe, f"do_{self.command}", None)
+        if metodo is None:
+            permitidos = sorted(nome[3:] for nome in dir(classe) if nome.startswith("do_"))
+            self._responder_erro(
+                405, f"Método {self.command} não suportado em /api/{rota}", {"Allow": ", ".join(permitidos)}
+            )
+            return
+        metodo(self)
+
+    def __getattr__(self, nome):
+        # BaseHTTPRequestHandler procura do_<MÉTODO>; qualquer método (PUT,
+        # DELETE, PATCH...) passa por _despachar e recebe 404/405 em JSON,
+        # em vez do 501 em HTML do http.server
+        if nome.startswith("do_"):
+            return self._despachar
+        raise AttributeError(nome)
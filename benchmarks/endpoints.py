@@ -0,0 +1,257 @@
+"""
+Benchmark das funções dos endpoints sobre uma planilha falsa em memória
+
+Semeia as abas 'atividades', 'simulados', 'questoes' e 'redacoes' com N
+atividades sintéticas (cada uma com um registro derivado) e mede, para
+cada tamanho, listar_atividades, listar_redacoes, listar_painel,
+inserir_atividade e excluir_registro:
+
+- tempo de parede (primeira execução, com índices/metadados frios, e
+  mediana/mín/máx das demais), sem o tempo gasto contando bytes;
+- chamadas à "API" por execução e bytes enviados/recebidos;
+- pico de memória (tracemalloc, em uma execução à parte).
+
+As listagens são medidas sem o cache de listagens (invalidado antes de
+cada execução). Nada vai à rede: ver benchmarks/planilha_falsa.py.
+
+Uso:
+    python benchmarks/endpoints.py [--linhas 1000 10000 100000] [--latencia 0.05]
+        [--repeticoes 5] [--saida resultados.json] [--comparar anterior.json]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+PASTA_BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+PASTA_API = os.path.join(PASTA_BENCHMARKS, "..", "api")
+
+# Configuração lida pelos módulos de api/ na importação: sem limite local de
+# cota (a planilha é falsa), cache em pasta própria e sem diário/réplica
+os.environ["PACD_COTA_LEITURA"] = "0"
+os.environ["PACD_COTA_ESCRITA"] = "0"
+os.environ["PACD_CACHE_DIR"] = tempfile.mkdtemp(prefix="pacd_bench_cache_")
+os.environ["GOOGLE_SPREADSHEET_ID"] = "planilha-falsa"
+for variavel in ("PACD_ESCRITA_DIFERIDA", "PACD_REPLICA", "PACD_EXCLUSAO_LOGICA", "PACD_ARMAZENAMENTO"):
+    os.environ.pop(variavel, None)
+
+sys.path.insert(0, PASTA_API)
+sys.path.insert(0, PASTA_BENCHMARKS)
+
+from planilha_falsa import ClienteFalso, Medidor, PlanilhaFalsa  # noqa: E402
+
+from _pacd import indice, planilha  # noqa: E402
+from _pacd.cache import invalidar_listagens  # noqa: E402
+from _pacd.ids import GeradorIds  # noqa: E402
+from _pacd.registros import COLUNAS_POR_ABA  # noqa: E402
+
+
+TIPOS = ["Simulado", "Questões", "Redação"]
+AREAS = ["Linguagens", "Humanas", "Natureza", "Matemática"]
+
+
+def semear_abas(quantidade, semente=42):
+    """
+    Abas sintéticas com `quantidade` atividades e um registro derivado cada
+
+    Returns:
+        dict: {nome da aba: linhas (texto), incluindo o cabeçalho}
+    """
+    aleatorio = random.Random(semente)
+    relogio = [datetime(2025, 1, 1).timestamp()]
+
+    def avancar():
+        relogio[0] += aleatorio.uniform(1, 600)
+        return relogio[0]
+
+    gerador = GeradorIds(relogio=lambda: relogio[0], aleatorio=aleatorio)
+    abas = {nome: [list(colunas)] for nome, colunas in COLUNAS_POR_ABA.items()}
+
+    for i in range(quantidade):
+        avancar()
+        tipo = TIPOS[i % len(TIPOS)]
+        id_atividade = gerador.proximo()
+        data = datetime.fromtimestamp(relogio[0]).strftime('%d/%m/%Y %H:%M:%S')
+        abas["atividades"].append([id_atividade, f"Atividade {i}", tipo, data[:10], data])
+
+        questoes = aleatorio.randint(10, 90)
+        acertos = str(aleatorio.randint(0, questoes))
+        area = aleatorio.choice(AREAS)
+        if tipo == "Simulado":
+            abas["simulados"].append([gerador.proximo("SIM"), id_atividade, area, str(questoes), acertos,
+                                      "02:30", "", data[:10], data])
+        elif tipo == "Questões":
+            abas["questoes"].append([gerador.proximo("QST"), id_atividade, area, "Matéria", "Assunto",
+                                     str(questoes), acertos, "01:00", "", data[:10], data])
+        else:
+            notas = [str(aleatorio.choice(range(0, 201, 20))) for _ in range(5)]
+            abas["redacoes"].append([gerador.proximo("RDC"), id_atividade, "Redação", *notas,
+                                     "01:30", "", data[:10], data])
+
+    return abas
+
+
+def preparar(quantidade, latencia):
+    """Nova planilha falsa, ligada no lugar do cliente gspread, e caches zerados"""
+    planilha_falsa = PlanilhaFalsa(semear_abas(quantidade), Medidor(latencia))
+    cliente = ClienteFalso(planilha_falsa)
+    planilha.obter_cliente = lambda: cliente
+    planilha.invalidar_cache_planilha()
+    indice.descartar_indices()
+    invalidar_listagens()
+    return planilha_falsa
+
+
+def cenarios(planilha_falsa):
+    """{nome: função sem argumentos} de cada endpoint medido"""
+    from _rotas import criar_atividade, excluir_registro, listar_exercicios, listar_painel, listar_redacoes
+
+    ids_simulados = [linha[0] for linha in planilha_falsa.aba("simulados").linhas[1:]]
+    random.Random(7).shuffle(ids_simulados)
+
+    def listar(funcao):
+        def executar():
+            invalidar_listagens()
+            funcao()
+        return executar
+
+    def inserir():
+        criar_atividade.inserir_atividade({
+            "titulo": "Benchmark", "tipo": "Simulado", "tempo_total": "01:00",
+            "area": "Natureza", "questoes": 45, "acertos": 30, "dt_inicio": "01/01/2025"
+        })
+
+    def excluir():
+        excluir_registro.excluir_registro("simulados", ids_simulados.pop())
+
+    return {
+        "listar_atividades": listar(listar_exercicios.listar_atividades),
+        "listar_redacoes": listar(listar_redacoes.listar_redacoes),
+        "listar_painel": listar(listar_painel.listar_painel),
+        "inserir_atividade": inserir,
+        "excluir_registro": excluir,
+    }
+
+
+def _silencioso(funcao):
+    """Executa sem os prints de log dos endpoints"""
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        return funcao()
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+
+def medir(funcao, medidor, repeticoes):
+    """
+    Mede uma função: tempos, chamadas/bytes por execução e pico de memória
+
+    Returns:
+        dict: Resultado do cenário
+    """
+    tempos = []
+    medidor.zerar()
+    for _ in range(repeticoes + 1):
+        sobrecarga = medidor.sobrecarga
+        inicio = time.perf_counter()
+        _silencioso(funcao)
+        tempos.append(time.perf_counter() - inicio - (medidor.sobrecarga - sobrecarga))
+    uso = medidor.resumo()
+
+    tracemalloc.start()
+    _silencioso(funcao)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    execucoes = repeticoes + 1
+    quentes = tempos[1:] or tempos
+    return {
+        "primeira_ms": round(tempos[0] * 1000, 2),
+        "mediana_ms": round(statistics.median(quentes) * 1000, 2),
+        "min_ms": round(min(quentes) * 1000, 2),
+        "max_ms": round(max(quentes) * 1000, 2),
+        "chamadas_por_execucao": round(uso["chamadas"] / execucoes, 2),
+        "chamadas_por_metodo": {metodo: round(total / execucoes, 2) for metodo, total in uso["chamadas_por_metodo"].items()},
+        "bytes_enviados_por_execucao": round(uso["bytes_enviados"] / execucoes),
+        "bytes_recebidos_por_execucao": round(uso["bytes_recebidos"] / execucoes),
+        "pico_memoria_kib": round(pico / 1024, 1)
+    }
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PASTA_BENCHMARKS, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def comparar(atual, anterior):
+    """Imprime a variação da mediana e das chamadas em relação a um resultado salvo"""
+    print(f"\nComparação com {anterior.get('commit')} ({anterior.get('data')}):")
+    for tamanho, resultados in atual["resultados"].items():
+        for nome, resultado in resultados.items():
+            base = anterior.get("resultados", {}).get(tamanho, {}).get(nome)
+            if not base:
+                continue
+            variacao = (resultado["mediana_ms"] / base["mediana_ms"] - 1) * 100 if base["mediana_ms"] else 0.0
+            print(
+                f"  {tamanho:>7} {nome:<20} mediana {base['mediana_ms']:>9.1f} -> {resultado['mediana_ms']:>9.1f} ms "
+                f"({variacao:+.0f}%)   chamadas {base['chamadas_por_execucao']} -> {resultado['chamadas_por_execucao']}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--linhas", type=int, nargs="+", default=[1000, 10000, 100000], help="atividades por cenário")
+    parser.add_argument("--latencia", type=float, default=0.0, help="segundos simulados por chamada à API")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--saida", help="arquivo JSON para salvar os resultados")
+    parser.add_argument("--comparar", help="resultado JSON anterior para comparar")
+    args = parser.parse_args()
+
+    relatorio = {
+        "commit": _commit(),
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "latencia_s": args.latencia,
+        "repeticoes": args.repeticoes,
+        "resultados": {}
+    }
+
+    print(f"{'linhas':>7} {'endpoint':<20}{'1ª (ms)':>10}{'mediana':>10}{'chamadas':>10}{'recebido (KiB)':>16}{'pico (KiB)':>12}")
+    for quantidade in args.linhas:
+        planilha_falsa = _silencioso(lambda: preparar(quantidade, args.latencia))
+        resultados = relatorio["resultados"][str(quantidade)] = {}
+
+        for nome, funcao in cenarios(planilha_falsa).items():
+            resultado = resultados[nome] = medir(funcao, planilha_falsa.medidor, args.repeticoes)
+            print(
+                f"{quantidade:>7} {nome:<20}{resultado['primeira_ms']:>10.1f}{resultado['mediana_ms']:>10.1f}"
+                f"{resultado['chamadas_por_execucao']:>10}{resultado['bytes_recebidos_por_execucao'] / 1024:>16.1f}"
+                f"{resultado['pico_memoria_kib']:>12.1f}"
+            )
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(relatorio, arquivo, ensure_ascii=False, indent=2)
+        print(f"\nResultados salvos em {args.saida}")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as arquivo:
+            comparar(relatorio, json.load(arquivo))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+Planilha em memória no lugar do gspread, para os benchmarks
+
+Implementa só o que o código de api/ usa de gspread.Spreadsheet
+(values_batch_get, values_get, batch_update com appendCells/deleteDimension,
+values_batch_update e worksheets) e de gspread.Worksheet (delete_rows).
+Os valores são guardados e devolvidos como texto, como a API devolve com
+FORMATTED_VALUE.
+
+Cada chamada à "API" espera a latência configurada e é contabilizada
+(quantidade por método e bytes de requisição/resposta em JSON), para
+comparar o número de idas ao Sheets entre versões do código.
+"""
+import json
+import re
+import threading
+import time
+from collections import Counter
+
+from gspread.utils import a1_to_rowcol
+
+
+REGEX_INTERVALO = re.compile(r"^'((?:[^']|'')+)'(?:!(.+))?$")
+REGEX_PONTA = re.compile(r"^([A-Z]*)(\d*)$")
+
+
+def _coluna_para_indice(letras):
+    return a1_to_rowcol(f"{letras}1")[1]
+
+
+def _texto_celula(celula):
+    """CellData.userEnteredValue -> valor formatado"""
+    valor = celula.get("userEnteredValue")
+    if not valor:
+        return ""
+    if "boolValue" in valor:
+        return "TRUE" if valor["boolValue"] else "FALSE"
+    if "numberValue" in valor:
+        numero = valor["numberValue"]
+        return str(int(numero)) if float(numero).is_integer() else str(numero)
+    return str(next(iter(valor.values())))
+
+
+def _aparar(linhas):
+    """Remove células vazias no fim das linhas e linhas vazias no fim, como a API"""
+    aparadas = []
+    for linha in linhas:
+        linha = list(linha)
+        while linha and linha[-1] == "":
+            linha.pop()
+        aparadas.append(linha)
+    while aparadas and not aparadas[-1]:
+        aparadas.pop()
+    return aparadas
+
+
+class Medidor:
+    """Contadores de chamadas e bytes, com latência simulada por chamada"""
+
+    def __init__(self, latencia=0.0):
+        self.latencia = latencia
+        self._lock = threading.Lock()
+        self.zerar()
+
+    def zerar(self):
+        with self._lock:
+            self.chamadas = Counter()
+            self.bytes_enviados = 0
+            self.bytes_recebidos = 0
+            # Tempo gasto contando bytes, descontado do tempo medido
+            self.sobrecarga = 0.0
+
+    def registrar(self, metodo, requisicao, resposta):
+        if self.latencia:
+            time.sleep(self.latencia)
+
+        inicio = time.perf_counter()
+        enviados = len(json.dumps(requisicao, ensure_ascii=False).encode())
+        recebidos = len(json.dumps(resposta, ensure_ascii=False).encode())
+        with self._lock:
+            self.chamadas[metodo] += 1
+            self.bytes_enviados += enviados
+            self.bytes_recebidos += recebidos
+            self.sobrecarga += time.perf_counter() - inicio
+        return resposta
+
+    def resumo(self):
+        with self._lock:
+            return {
+                "chamadas": sum(self.chamadas.values()),
+                "chamadas_por_metodo": dict(self.chamadas),
+                "bytes_enviados": self.bytes_enviados,
+                "bytes_recebidos": self.bytes_recebidos
+            }
+
+
+class AbaFalsa:
+    """Aba: título, sheetId e linhas (listas de texto, incluindo o cabeçalho)"""
+
+    def __init__(self, planilha, titulo, sheet_id, linhas):
+        self.planilha = planilha
+        self.title = titulo
+        self.id = sheet_id
+        self.linhas = linhas
+
+    def delete_rows(self, inicio, fim=None):
+        """Como gspread.Worksheet.delete_rows (um batchUpdate com deleteDimension)"""
+        fim = fim or inicio
+        return self.planilha.batch_update({"requests": [{
+            "deleteDimension": {
+                "range": {"sheetId": self.id, "dimension": "ROWS", "startIndex": inicio - 1, "endIndex": fim}
+            }
+        }]})
+
+
+class PlanilhaFalsa:
+    """Subconjunto de gspread.Spreadsheet sobre abas em memória"""
+
+    def __init__(self, abas, medidor=None, id_planilha="planilha-falsa"):
+        self.id = id_planilha
+        self.medidor = medidor or Medidor()
+        self.client = None
+        self._lock = threading.Lock()
+        self._abas = {}
+        for sheet_id, (titulo, linhas) in enumerate(abas.items()):
+            self._abas[titulo] = AbaFalsa(self, titulo, sheet_id, linhas)
+
+    def aba(self, titulo):
+        return self._abas[titulo]
+
+    def _recortar(self, intervalo, colunas=False):
+        encontrado = REGEX_INTERVALO.match(intervalo)
+        if not encontrado:
+            raise ValueError(f"Intervalo não suportado: {intervalo}")
+
+        linhas = self._abas[encontrado.group(1).replace("''", "'")].linhas
+        if encontrado.group(2) is None:
+            recorte = linhas
+        else:
+            partes = encontrado.group(2).split(":")
+            inicio = REGEX_PONTA.match(partes[0])
+            fim = REGEX_PONTA.match(partes[-1])
+
+            linha_inicio = int(inicio.group(2) or 1)
+            linha_fim = int(fim.group(2)) if fim.group(2) else len(linhas)
+            coluna_inicio = _coluna_para_indice(inicio.group(1)) if inicio.group(1) else 1
+            coluna_fim = _coluna_para_indice(fim.group(1)) if fim.group(1) else None
+
+            recorte = [linha[coluna_inicio - 1:coluna_fim] for linha in linhas[linha_inicio - 1:linha_fim]]
+
+        recorte = _aparar(recorte)
+        if colunas and recorte:
+            largura = max(len(linha) for linha in recorte)
+            recorte = _aparar(
+                [[linha[i] if i < len(linha) else "" for linha in recorte] for i in range(largura)]
+            )
+
+        resposta = {"range": intervalo}
+        if recorte:
+            resposta["values"] = recorte
+        return resposta
+
+    def worksheets(self):
+        self.medidor.registrar("worksheets", {}, list(self._abas))
+        return list(self._abas.values())
+
+    def values_batch_get(self, ranges, params=None):
+        colunas = (params or {}).get("majorDimension") == "COLUMNS"
+        with self._lock:
+            resposta = {"valueRanges": [self._recortar(intervalo, colunas) for intervalo in ranges]}
+        return self.medidor.registrar("values_batch_get", {"ranges": ranges, "params": params}, resposta)
+
+    def values_get(self, range, params=None):
+        colunas = (params or {}).get("majorDimension") == "COLUMNS"
+        with self._lock:
+            resposta = self._recortar(range, colunas)
+        return self.medidor.registrar("values_get", {"range": range, "params": params}, resposta)
+
+    def batch_update(self, body):
+        por_id = {aba.id: aba for aba in self._abas.values()}
+        with self._lock:
+            for requisicao in body["requests"]:
+                if "appendCells" in requisicao:
+                    dados = requisicao["appendCells"]
+                    por_id[dados["sheetId"]].linhas.extend(
+                        [_texto_celula(celula) for celula in linha["values"]] for linha in dados["rows"]
+                    )
+                elif "deleteDimension" in requisicao:
+                    faixa = requisicao["deleteDimension"]["range"]
+                    del por_id[faixa["sheetId"]].linhas[faixa["startIndex"]:faixa["endIndex"]]
+                else:
+                    raise ValueError(f"Requisição não suportada: {list(requisicao)}")
+        return self.medidor.registrar("batch_update", body, {"replies": [{} for _ in body["requests"]]})
+
+    def values_batch_update(self, body):
+        with self._lock:
+            for dados in body["data"]:
+                encontrado = REGEX_INTERVALO.match(dados["range"])
+                linhas = self._abas[encontrado.group(1).replace("''", "'")].linhas
+                linha, coluna = a1_to_rowcol(encontrado.group(2))
+                for i, valores in enumerate(dados["values"]):
+                    alvo = linhas[linha - 1 + i]
+                    for j, valor in enumerate(valores):
+                        while len(alvo) < coluna + j:
+                            alvo.append("")
+                        alvo[coluna - 1 + j] = str(valor)
+        return self.medidor.registrar("values_batch_update", body, {"totalUpdatedCells": len(body["data"])})
+
+
+class ClienteFalso:
+    """Substitui o gspread.Client devolvido por _pacd.conexao.obter_cliente()"""
+
+    def __init__(self, planilha):
+        self.planilha = planilha
+        self.http_client = object()
+        planilha.client = self.http_client
+
+    def open(self, titulo):
+        return self.planilha
+
+    def open_by_key(self, chave):
+        return self.planilha
@@ -0,0 +1,88 @@
+"""
+Benchmark de inicialização (cold start) da serverless function
+
+Executa `python -X importtime -c "import <módulo>"` para api/index.py (a
+função única, paga antes da primeira requisição de uma instância nova) e
+para cada rota de api/_rotas (importada na primeira requisição à rota) e
+reporta o tempo cumulativo de importação, junto com as dependências
+diretas mais pesadas.
+
+Uso:
+    python benchmarks/tempo_importacao.py [--repeticoes 5] [--top 5]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+
+PASTA_API = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api")
+
+# import time: self [us] | cumulative | imported package
+REGEX_LINHA = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def listar_endpoints():
+    """A função (index) e os módulos das rotas em api/_rotas"""
+    return ["index"] + sorted(
+        f"_rotas.{nome[:-3]}" for nome in os.listdir(os.path.join(PASTA_API, "_rotas"))
+        if nome.endswith(".py") and not nome.startswith("_")
+    )
+
+
+def medir_importacao(endpoint):
+    """
+    Importa o endpoint em um processo novo e devolve os tempos
+
+    Returns:
+        tuple: (total em µs, {dependência direta: µs cumulativos})
+    """
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {endpoint}"],
+        cwd=PASTA_API,
+        capture_output=True,
+        text=True
+    )
+    if processo.returncode != 0:
+        raise RuntimeError(f"Falha ao importar {endpoint}:\n{processo.stderr}")
+
+    total = 0
+    dependencias = {}
+    for linha in processo.stderr.splitlines():
+        encontrado = REGEX_LINHA.match(linha)
+        if not encontrado:
+            continue
+
+        # A indentação cresce 2 espaços por nível: 1 = o próprio módulo,
+        # 3 = o que ele importa diretamente
+        nivel = len(encontrado.group(3))
+        if nivel == 3:
+            dependencias[encontrado.group(4)] = int(encontrado.group(2))
+        elif nivel == 1 and encontrado.group(4) == endpoint:
+            total = int(encontrado.group(2))
+
+    return total, dependencias
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5, help="pacotes mais pesados exibidos por endpoint")
+    args = parser.parse_args()
+
+    print(f"{'módulo':<30}{'mediana (ms)':>14}{'mín (ms)':>12}   mais pesados")
+    for endpoint in listar_endpoints():
+        totais = []
+        for _ in range(args.repeticoes):
+            total, dependencias = medir_importacao(endpoint)
+            totais.append(total)
+
+        pesados = sorted(dependencias.items(), key=lambda item: item[1], reverse=True)[:args.top]
+        descricao = ", ".join(f"{nome} {tempo / 1000:.0f}" for nome, tempo in pesados)
+        print(f"{endpoint:<30}{statistics.median(totais) / 1000:>14.1f}{min(totais) / 1000:>12.1f}   {descricao}")
+
+
+if __name__ == "__main__":
+    main()
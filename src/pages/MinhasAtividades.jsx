@@ -5,6 +5,7 @@ import { ToastContainer, toast } from 'react-toastify';
 import 'react-toastify/dist/ReactToastify.css';
 import '../styles/MinhasAtividades.css';
 import pacdLogo from '../assets/PACD_LOGO.png';
+import { cabecalhosListagem, registrarGravacao } from '../utils/frescor';
 
 const MinhasAtividades = () => {
   const [atividades, setAtividades] = useState([]);
@@ -70,7 +71,7 @@ const MinhasAtividades = () => {
     console.log('🔄 Carregando exercícios...');
 
     try {
-      const response = await fetch('/api/listar_exercicios');
+      const response = await fetch('/api/listar_exercicios', { headers: cabecalhosListagem() });
       console.log('📥 Status da resposta (exercícios):', response.status);
 
       const data = await response.json();
@@ -92,7 +93,7 @@ const MinhasAtividades = () => {
     console.log('🔄 Carregando redações...');
 
     try {
-      const response = await fetch('/api/listar_redacoes');
+      const response = await fetch('/api/listar_redacoes', { headers: cabecalhosListagem() });
       console.log('📥 Status da resposta (redações):', response.status);
 
       const data = await response.json();
@@ -116,7 +117,18 @@ const MinhasAtividades = () => {
     setErro('');
 
     try {
-      await Promise.all([carregarAtividades(), carregarRedacoes()]);
+      // Exercícios e redações vêm juntos em uma única chamada
+      const response = await fetch('/api/listar_painel', { headers: cabecalhosListagem() });
+      console.log('📥 Status da resposta (painel):', response.status);
+
+      const data = await response.json();
+
+      if (response.ok && data.success) {
+        setAtividades(data.data.exercicios);
+        setRedacoes(data.data.redacoes);
+      } else {
+        throw new Error(data.error || 'Erro ao carregar dados');
+      }
       console.log('✅ Todos os dados carregados com sucesso');
     } catch (error) {
       console.error('❌ Erro ao carregar dados:', error);
@@ -334,6 +346,7 @@ const MinhasAtividades = () => {
       const result = await response.json();
 
       if (response.ok && result.success) {
+        registrarGravacao(response);
         alert(`${isSimulado ? 'Simulado' : 'Bloco'} criado com sucesso!`);
         fecharModalNovaEntrada();
         // Recarregar atividades para atualizar os dados
@@ -356,7 +369,7 @@ const MinhasAtividades = () => {
 
   const buscarAtividadeAtualizada = async (idAtividade) => {
     try {
-      const response = await fetch('/api/listar_exercicios');
+      const response = await fetch('/api/listar_exercicios', { headers: cabecalhosListagem() });
       const data = await response.json();
       if (response.ok && data.success) {
         return data.data.find(a => a.ID_ATIVIDADE === idAtividade);
@@ -401,6 +414,7 @@ const MinhasAtividades = () => {
       const result = await response.json();
 
       if (response.ok && result.success) {
+        registrarGravacao(response);
         toast.success('Registro excluído com sucesso!', {
           position: 'top-right',
           autoClose: 3000,
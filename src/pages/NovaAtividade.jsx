@@ -2,6 +2,7 @@ import React, { useState } from 'react';
 import Sidebar from '../components/Sidebar';
 import '../styles/NovaAtividade.css';
 import pacdLogo from '../assets/PACD_LOGO.png';
+import { registrarGravacao } from '../utils/frescor';
 
 const NovaAtividade = () => {
   const [formData, setFormData] = useState({
@@ -277,6 +278,7 @@ const NovaAtividade = () => {
 
       if (response.ok && data.success) {
         console.log('✅ Sucesso!', data);
+        registrarGravacao(response);
         setMensagem({
           tipo: 'sucesso',
           texto: `Atividade criada com sucesso! ID: ${data.id_atividade}`
@@ -0,0 +1,16 @@
+// O cache das listagens é por instância da Vercel: depois de uma gravação,
+// outra instância pode responder com a listagem antiga até o TTL expirar.
+// Guardamos o horário (cabeçalho Date do servidor) da última gravação e o
+// enviamos nas listagens, para que caches anteriores a ela sejam ignorados.
+const CHAVE_GRAVADO_EM = 'pacd_gravado_em';
+
+export const registrarGravacao = (response) => {
+  const data = Date.parse(response.headers.get('Date'));
+  const gravadoEm = Math.floor((Number.isNaN(data) ? Date.now() : data) / 1000);
+  localStorage.setItem(CHAVE_GRAVADO_EM, String(gravadoEm));
+};
+
+export const cabecalhosListagem = () => {
+  const gravadoEm = localStorage.getItem(CHAVE_GRAVADO_EM);
+  return gravadoEm ? { 'X-Pacd-Gravado-Em': gravadoEm } : {};
+};
@@ -0,0 +1,111 @@
+"""
+Configuração comum dos testes: api/ no caminho e a planilha em memória
+
+Os módulos de api/ leem a configuração do ambiente na importação, então
+ela é fixada aqui, antes de qualquer teste importá-los: sem cota local,
+cache em pasta temporária e sem diário, réplica ou exclusão lógica.
+"""
+import io
+import json
+import os
+import sys
+import tempfile
+
+import pytest
+
+PASTA_TESTES = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(PASTA_TESTES, "..", "api"))
+sys.path.insert(0, os.path.join(PASTA_TESTES, "..", "benchmarks"))
+
+os.environ["PACD_COTA_LEITURA"] = "0"
+os.environ["PACD_COTA_ESCRITA"] = "0"
+os.environ["PACD_CACHE_DIR"] = tempfile.mkdtemp(prefix="pacd_testes_cache_")
+os.environ["GOOGLE_SPREADSHEET_ID"] = "planilha-falsa"
+for variavel in ("PACD_ESCRITA_DIFERIDA", "PACD_REPLICA", "PACD_EXCLUSAO_LOGICA", "PACD_ARMAZENAMENTO"):
+    os.environ.pop(variavel, None)
+
+
+@pytest.fixture
+def planilha_falsa(monkeypatch):
+    """
+    Fábrica de planilhas em memória ligadas no lugar do cliente gspread
+
+    Uso: planilha_falsa({"atividades": [[...cabeçalho...], [...], ...], ...});
+    abas não informadas são criadas só com o cabeçalho.
+    """
+    from planilha_falsa import ClienteFalso, PlanilhaFalsa
+
+    from _pacd import indice, planilha
+    from _pacd.cache import invalidar_listagens
+    from _pacd.registros import COLUNAS_POR_ABA
+
+    def criar(abas=None):
+        linhas = {nome: [list(colunas)] for nome, colunas in COLUNAS_POR_ABA.items()}
+        for nome, valores in (abas or {}).items():
+            linhas[nome] = [list(linha) for linha in valores]
+
+        falsa = PlanilhaFalsa(linhas)
+        cliente = ClienteFalso(falsa)
+        monkeypatch.setattr(planilha, "obter_cliente", lambda: cliente)
+        planilha.invalidar_cache_planilha()
+        indice.descartar_indices()
+        invalidar_listagens()
+        return falsa
+
+    yield criar
+
+    planilha.invalidar_cache_planilha()
+    indice.descartar_indices()
+    invalidar_listagens()
+
+
+class _Conexao:
+    """Socket em memória: o handler lê a requisição e escreve a resposta em bytes"""
+
+    def __init__(self, requisicao):
+        self.entrada = io.BytesIO(requisicao)
+        self.saida = io.BytesIO()
+
+    def makefile(self, modo, *args, **kwargs):
+        return self.entrada
+
+    def sendall(self, dados):
+        self.saida.write(dados)
+
+
+def _juntar_blocos(dados):
+    """Corpo de uma resposta com Transfer-Encoding: chunked"""
+    corpo = b""
+    while True:
+        tamanho, _, dados = dados.partition(b"\r\n")
+        tamanho = int(tamanho, 16)
+        if not tamanho:
+            return corpo
+        corpo += dados[:tamanho]
+        dados = dados[tamanho + 2:]
+
+
+@pytest.fixture
+def requisitar():
+    """
+    Executa uma requisição HTTP em um handler (classe BaseHTTPRequestHandler)
+
+    Uso: status, cabecalhos, corpo = requisitar(handler, "POST", "/api/x", {"a": 1});
+    o corpo da resposta volta decodificado de JSON quando houver.
+    """
+    def executar(handler, metodo, caminho, corpo=None, cabecalhos=None):
+        dados = b"" if corpo is None else json.dumps(corpo).encode("utf-8")
+        linhas = [f"{metodo} {caminho} HTTP/1.1", "Host: teste", f"Content-Length: {len(dados)}"]
+        linhas += [f"{nome}: {valor}" for nome, valor in (cabecalhos or {}).items()]
+        conexao = _Conexao(("\r\n".join(linhas) + "\r\n\r\n").encode("latin-1") + dados)
+
+        handler(conexao, ("127.0.0.1", 0), None)
+
+        cabecalho, _, resposta = conexao.saida.getvalue().partition(b"\r\n\r\n")
+        status_linha, *campos = cabecalho.decode("latin-1").split("\r\n")
+        var_dicCabecalhos = dict(campo.split(": ", 1) for campo in campos)
+        if var_dicCabecalhos.get("Transfer-Encoding") == "chunked":
+            resposta = _juntar_blocos(resposta)
+        return int(status_linha.split()[1]), var_dicCabecalhos, json.loads(resposta) if resposta else None
+
+    return executar
@@ -0,0 +1,73 @@
+"""
+Interface de armazenamento (_pacd.armazenamento): Sheets (planilha em memória) e SQLite
+
+Uso:
+    python -m pytest tests
+"""
+import pytest
+
+from _pacd.armazenamento import Armazenamento, ArmazenamentoSheets, ArmazenamentoSQLite
+from _pacd.registros import COLUNAS_POR_ABA
+
+ATIVIDADES = [
+    ["1088000000000001", "Simulado 1", "Simulado", "01/02/2025", "01/02/2025 10:00:00"],
+    ["1088000000000002", "Questões 1", "Questões", "", ""],
+]
+SIMULADOS = [
+    ["SIM1088000000000003", "1088000000000001", "Natureza", "45", "30", "", "", "", ""],
+    ["SIM1088000000000004", "1088000000000001", "Humanas", "45", "40", "", "", "", ""],
+]
+
+
+@pytest.fixture(params=["sheets", "sqlite"])
+def armazenamento(request, planilha_falsa, tmp_path):
+    if request.param == "sheets":
+        planilha_falsa({
+            "atividades": [COLUNAS_POR_ABA["atividades"]] + ATIVIDADES,
+            "simulados": [COLUNAS_POR_ABA["simulados"]] + SIMULADOS,
+        })
+        return ArmazenamentoSheets()
+
+    armazenamento = ArmazenamentoSQLite(str(tmp_path / "dados.sqlite3"))
+    armazenamento.acrescentar_lote({"atividades": ATIVIDADES, "simulados": SIMULADOS})
+    return armazenamento
+
+
+def test_interface_incompleta_falha_ao_criar():
+    class SemExclusao(Armazenamento):
+        def acrescentar_lote(self, linhas_por_aba):
+            pass
+
+        def ler_tabelas(self, *nomes_abas):
+            return {}
+
+        def ler_colunas(self, nome_aba, *colunas):
+            return {}
+
+        def buscar_por_id(self, nome_aba, id_registro):
+            return None
+
+    with pytest.raises(TypeError):
+        SemExclusao()
+
+
+def test_buscar_por_id(armazenamento):
+    registro = armazenamento.buscar_por_id("simulados", "SIM1088000000000004")
+    assert registro["ID_ATIVIDADE"] == 1088000000000001
+    assert registro["AREA"] == "Humanas"
+    assert armazenamento.buscar_por_id("simulados", "NAOEXISTE") is None
+
+
+def test_ler_colunas(armazenamento):
+    colunas = armazenamento.ler_colunas("atividades", "ID_ATIVIDADE", "TIPO")
+    assert colunas == {
+        "ID_ATIVIDADE": ["1088000000000001", "1088000000000002"],
+        "TIPO": ["Simulado", "Questões"],
+    }
+
+
+def test_excluir_por_id(armazenamento):
+    assert armazenamento.excluir_por_id("simulados", "SIM1088000000000003") is True
+    assert armazenamento.excluir_por_id("simulados", "SIM1088000000000003") is False
+    assert armazenamento.buscar_por_id("simulados", "SIM1088000000000003") is None
+    assert armazenamento.buscar_por_id("simulados", "SIM1088000000000004") is not None
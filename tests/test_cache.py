@@ -0,0 +1,79 @@
+"""
+Frescor do cache de listagens entre instâncias (_pacd.cache, _pacd.resposta)
+
+Uso:
+    python -m pytest tests
+"""
+import os
+import sys
+import time
+from email.message import Message
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api"))
+
+from _pacd import cache  # noqa: E402
+from _pacd.resposta import ler_desde  # noqa: E402
+
+
+class Contador:
+    """Carregador que conta as leituras e devolve o número da leitura"""
+
+    def __init__(self):
+        self.leituras = 0
+
+    def __call__(self):
+        self.leituras += 1
+        return [self.leituras]
+
+
+class Requisicao:
+    """Só o que ler_desde usa de um BaseHTTPRequestHandler"""
+
+    def __init__(self, **cabecalhos):
+        self.headers = Message()
+        for nome, valor in cabecalhos.items():
+            self.headers[nome.replace("_", "-")] = valor
+
+
+def test_item_anterior_a_gravacao_e_recarregado(tmp_path):
+    instancia = cache.CacheListagens(pasta=str(tmp_path))
+    carregar = Contador()
+    assert instancia.obter("exercicios:padrao", carregar) == [1]
+
+    # Sem gravação posterior, o item em cache serve
+    assert instancia.obter("exercicios:padrao", carregar) == [1]
+    assert instancia.obter("exercicios:padrao", carregar, desde=time.time() - 60) == [1]
+
+    # Uma gravação feita em outra instância depois do carregamento força nova leitura
+    assert instancia.obter("exercicios:padrao", carregar, desde=time.time() + 0.01) == [2]
+    assert carregar.leituras == 2
+
+    # O valor recarregado volta a servir às próximas requisições
+    assert instancia.obter("exercicios:padrao", carregar) == [2]
+    assert carregar.leituras == 2
+
+
+def test_item_em_disco_anterior_a_gravacao_e_recarregado(tmp_path):
+    pasta = str(tmp_path / "compartilhada")
+    carregar = Contador()
+    cache.CacheListagens(pasta=pasta).obter("redacoes", carregar)
+
+    # Nova instância (memória vazia) lendo o mesmo disco
+    nova = cache.CacheListagens(pasta=pasta)
+    assert nova.obter("redacoes", carregar) == [1]
+    assert cache.CacheListagens(pasta=pasta).obter("redacoes", carregar, desde=time.time() + 0.01) == [2]
+
+
+def test_ler_desde():
+    assert ler_desde(Requisicao()) is None
+    assert ler_desde(Requisicao(X_Pacd_Gravado_Em="abc")) is None
+
+    # O Date da gravação tem resolução de segundos: o segundo inteiro conta
+    assert ler_desde(Requisicao(X_Pacd_Gravado_Em="1000")) == 1001
+
+    # Um horário no futuro (relógio adiantado) pede um valor novo, sem mais efeitos
+    antes = time.time()
+    assert antes <= ler_desde(Requisicao(X_Pacd_Gravado_Em=str(int(antes) + 3600))) <= time.time()
+
+    assert ler_desde(Requisicao(Cache_Control="no-cache")) >= antes
+    assert ler_desde(Requisicao(Pragma="no-cache")) >= antes
@@ -0,0 +1,115 @@
+"""
+Filtros e paginação por cursor da listagem de exercícios (_pacd.consulta)
+
+Uso:
+    python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api"))
+
+from _pacd.consulta import aplicar_consulta, codificar_cursor, ler_consulta  # noqa: E402
+from _pacd.registros import COLUNAS_POR_ABA  # noqa: E402
+from _rotas import listar_exercicios  # noqa: E402
+
+
+def atividade(id_atividade, tipo="Simulado"):
+    return {"ID_ATIVIDADE": id_atividade, "TIPO": tipo, "INFO": []}
+
+
+def paginar(var_listAtividades, limite, **filtros):
+    """Percorre todas as páginas, seguindo next_cursor (com limite de voltas)"""
+    var_listIds = []
+    cursor = ""
+    for _ in range(len(var_listAtividades) + 2):
+        var_dicParametros = {"limit": [str(limite)], **{k: [v] for k, v in filtros.items()}}
+        if cursor:
+            var_dicParametros["cursor"] = [cursor]
+        pagina, _, cursor = aplicar_consulta(var_listAtividades, ler_consulta(var_dicParametros))
+        var_listIds.extend(item["ID_ATIVIDADE"] for item in pagina)
+        if not cursor:
+            return var_listIds
+    raise AssertionError(f"paginação não terminou: {var_listIds}")
+
+
+@pytest.fixture
+def ids_atuais():
+    # Formato atual: '1' + segundos (9 dígitos) + contador (6 dígitos), convertido pela planilha
+    return [int(f"1{50_000_000 + i // 3:09d}{500_000 + i:06d}") for i in range(8)]
+
+
+def test_legados_repetidos_nao_repetem_paginas():
+    var_listAtividades = [atividade(i) for i in (14302, 9301, 14302, 10001)]
+    assert sorted(paginar(var_listAtividades, 1)) == sorted([14302, 9301, 14302, 10001])
+
+
+@pytest.mark.parametrize("limite", [1, 2, 3, 5])
+def test_percorre_tudo_uma_vez_em_ordem_de_tempo(ids_atuais, limite):
+    # Legados (só a hora do dia) antes dos atuais, ordenados pela hora
+    var_listAtividades = [atividade(i) for i in [ids_atuais[0], 14302, 9301, 14302] + ids_atuais[1:]]
+    assert paginar(var_listAtividades, limite) == [9301, 14302, 14302] + ids_atuais
+
+
+def test_exclusao_do_ultimo_item_da_pagina(ids_atuais):
+    var_listAtividades = [atividade(i) for i in ids_atuais]
+    pagina, _, cursor = aplicar_consulta(var_listAtividades, ler_consulta({"limit": ["3"]}))
+
+    var_listRestante = [a for a in var_listAtividades if a["ID_ATIVIDADE"] != pagina[-1]["ID_ATIVIDADE"]]
+    pagina, _, _ = aplicar_consulta(var_listRestante, ler_consulta({"limit": ["3"], "cursor": [cursor]}))
+    assert [a["ID_ATIVIDADE"] for a in pagina] == ids_atuais[3:6]
+
+
+def test_inclusao_antes_do_cursor_nao_desloca(ids_atuais):
+    var_listAtividades = [atividade(i) for i in ids_atuais[1:]]
+    _, _, cursor = aplicar_consulta(var_listAtividades, ler_consulta({"limit": ["2"]}))
+
+    var_listAtividades.insert(0, atividade(ids_atuais[0]))
+    pagina, total, _ = aplicar_consulta(var_listAtividades, ler_consulta({"limit": ["2"], "cursor": [cursor]}))
+    assert [a["ID_ATIVIDADE"] for a in pagina] == ids_atuais[3:5]
+    assert total == len(ids_atuais)
+
+
+def test_filtro_por_tipo(ids_atuais):
+    var_listAtividades = [atividade(i, "Simulado" if n % 2 else "Questões") for n, i in enumerate(ids_atuais)]
+    assert paginar(var_listAtividades, 2, tipo="simulado") == ids_atuais[1::2]
+
+
+def test_sem_limite_mantem_a_ordem_do_payload():
+    var_listAtividades = [atividade(i) for i in (14302, 9301, 10001)]
+    pagina, total, cursor = aplicar_consulta(var_listAtividades, ler_consulta({}))
+    assert pagina == var_listAtividades and total == 3 and cursor is None
+
+
+@pytest.mark.parametrize("cursor", ["x", "eyJwIjogMn0", codificar_cursor(""), codificar_cursor("1", -1)])
+def test_cursor_invalido(cursor):
+    with pytest.raises(ValueError):
+        ler_consulta({"cursor": [cursor]})
+
+
+@pytest.mark.parametrize("limite", ["0", "abc", "501"])
+def test_limite_invalido(limite):
+    with pytest.raises(ValueError):
+        ler_consulta({"limit": [limite]})
+
+
+def test_paginacao_pela_rota(planilha_falsa, requisitar):
+    # IDs legados repetidos e atuais, como a planilha os guarda
+    var_listIds = ["14302", "14302", "9301", "1088000000000001", "1088000000000002"]
+    planilha_falsa({"atividades": [COLUNAS_POR_ABA["atividades"]] + [
+        [id_atividade, f"Atividade {n}", "Simulado", "", ""] for n, id_atividade in enumerate(var_listIds)
+    ]})
+
+    var_listTitulos = []
+    caminho = "/api/listar-atividades?limit=2&fields=TITULO"
+    while caminho:
+        status, _, corpo = requisitar(listar_exercicios.handler, "GET", caminho)
+        assert status == 200 and corpo["total"] == 5
+        var_listTitulos.extend(item["TITULO"] for item in corpo["data"])
+        cursor = corpo["next_cursor"]
+        caminho = f"/api/listar-atividades?limit=2&fields=TITULO&cursor={cursor}" if cursor else None
+
+    assert sorted(var_listTitulos) == [f"Atividade {n}" for n in range(5)]
+    assert var_listTitulos[:3] == ["Atividade 2", "Atividade 0", "Atividade 1"]
@@ -0,0 +1,69 @@
+"""
+Rotas criar_simulado e criar_questoes sobre a planilha em memória
+
+Uso:
+    python -m pytest tests
+"""
+import json
+
+from _pacd.ids import interpretar_id
+from _pacd.registros import COLUNAS_POR_ABA
+from _rotas import criar_questoes, criar_simulado
+
+
+DADOS = {
+    "area": "Linguagens",
+    "materia": "Português",
+    "assunto": "Gramática",
+    "questoes": 45,
+    "acertos": 42,
+    "tempo_total": "02:00",
+    "comentarios": "Teste",
+    "dt_realizado": "01/01/2025",
+}
+
+
+def como_registro(aba, linha):
+    return dict(zip(COLUNAS_POR_ABA[aba], linha))
+
+
+def test_criar_simulado(planilha_falsa):
+    planilha = planilha_falsa()
+    resultado = criar_simulado.inserir_simulado("1088000000000001", DADOS)
+
+    registro = como_registro("simulados", planilha.aba("simulados").linhas[1])
+    assert resultado == {"id_simulado": registro["ID_SIMULADO"], "id_atividade": "1088000000000001", "pendente": False}
+    assert interpretar_id(registro["ID_SIMULADO"])["formato"] == "atual"
+    assert registro["ID_ATIVIDADE"] == "1088000000000001"
+    assert (registro["AREA"], registro["QUESTOES"], registro["ACERTOS"]) == ("Linguagens", "45", "42")
+    assert registro["DT_REALIZADO"] == "01/01/2025"
+
+
+def test_criar_questoes(planilha_falsa):
+    planilha = planilha_falsa()
+    resultado = criar_questoes.inserir_questoes("14302", DADOS)
+
+    registro = como_registro("questoes", planilha.aba("questoes").linhas[1])
+    assert resultado == {"id_questoes": registro["ID_QUESTOES"], "id_atividade": "14302", "pendente": False}
+    assert (registro["MATERIA"], registro["ASSUNTO"]) == ("Português", "Gramática")
+    assert registro["DT_REALIZADO"] == "01/01/2025"
+    assert planilha.aba("simulados").linhas[1:] == []
+
+
+def test_erro_na_gravacao_e_registrado(planilha_falsa, requisitar, monkeypatch, capsys):
+    planilha_falsa()
+
+    def falhar(linhas_por_aba):
+        raise RuntimeError("planilha indisponível")
+
+    for rota in (criar_simulado, criar_questoes):
+        monkeypatch.setattr(rota, "gravar_linhas", falhar)
+        status, _, corpo = requisitar(rota.handler, "POST", "/api/x", {"id_atividade": "14302", **DADOS})
+
+        assert status == 500
+        assert corpo == {"success": False, "error": "planilha indisponível"}
+
+        var_listErros = [json.loads(linha) for linha in capsys.readouterr().out.splitlines()]
+        var_listErros = [registro for registro in var_listErros if registro.get("nivel") == "ERROR"]
+        assert var_listErros and var_listErros[0]["tipo_erro"] == "RuntimeError"
+        assert "Traceback" in var_listErros[0]["erro"]
@@ -0,0 +1,81 @@
+"""
+Diário de gravação (write-behind): ordem, repetição e descarte sobre a planilha em memória
+
+Uso:
+    python -m pytest tests
+"""
+import pytest
+
+from _pacd import diario
+
+
+@pytest.fixture
+def diario_local(tmp_path):
+    return diario.DiarioEscrita(str(tmp_path / "diario.sqlite3"))
+
+
+def ids(planilha, aba):
+    return [linha[0] for linha in planilha.aba(aba).linhas[1:]]
+
+
+def descarregar_ate_esvaziar(diario_local, voltas=diario.MAX_TENTATIVAS + 2):
+    """Chama descarregar() como as próximas requisições fariam, até não haver pendências"""
+    for _ in range(voltas):
+        try:
+            diario_local.descarregar()
+        except Exception:
+            pass
+        if not diario_local.pendentes():
+            return
+    raise AssertionError("o diário não esvaziou")
+
+
+def test_descarga_em_ordem_em_um_lote(planilha_falsa, diario_local):
+    planilha = planilha_falsa()
+    diario_local.registrar({"atividades": [["A1", "t", "Simulado"]], "simulados": [["S1", "A1"]]})
+    diario_local.registrar({"atividades": [["A2", "t", "Questões"]]})
+
+    planilha.medidor.zerar()
+    assert diario_local.descarregar() == 2
+
+    assert ids(planilha, "atividades") == ["A1", "A2"]
+    assert ids(planilha, "simulados") == ["S1"]
+    assert planilha.medidor.chamadas["batch_update"] == 1
+    assert diario_local.pendentes() == 0
+
+
+def test_entrada_rejeitada_e_descartada_sem_travar_as_seguintes(planilha_falsa, diario_local):
+    planilha = planilha_falsa()
+    diario_local.registrar({"aba_inexistente": [["X1", "a"]]})
+    diario_local.registrar({"atividades": [["A1", "t", "Simulado"]]})
+
+    descarregar_ate_esvaziar(diario_local)
+
+    assert diario_local.descartadas() == 1
+    assert ids(planilha, "atividades") == ["A1"]
+
+
+def test_repeticao_pula_linhas_ja_gravadas(planilha_falsa, diario_local, monkeypatch):
+    planilha = planilha_falsa()
+    diario_local.registrar({"atividades": [["A1", "t", "Simulado"]]})
+
+    # A gravação chega à planilha, mas a resposta se perde (ex.: timeout)
+    acrescentar_linhas = diario.acrescentar_linhas
+    falhas = [TimeoutError("sem resposta")]
+
+    def acrescentar_e_perder_resposta(linhas_por_aba):
+        acrescentar_linhas(linhas_por_aba)
+        if falhas:
+            raise falhas.pop()
+
+    monkeypatch.setattr(diario, "acrescentar_linhas", acrescentar_e_perder_resposta)
+    with pytest.raises(TimeoutError):
+        diario_local.descarregar()
+    assert diario_local.pendentes() == 1
+
+    # A nova tentativa confere a coluna A e não duplica a linha
+    diario_local.registrar({"atividades": [["A2", "t", "Questões"]]})
+    descarregar_ate_esvaziar(diario_local)
+
+    assert ids(planilha, "atividades") == ["A1", "A2"]
+    assert diario_local.descartadas() == 0
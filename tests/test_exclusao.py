@@ -0,0 +1,124 @@
+"""
+Exclusão em cascata, em lote e lógica (tombstones + compactação) sobre a planilha em memória
+
+Uso:
+    python -m pytest tests
+"""
+import pytest
+
+from _pacd import armazenamento
+from _pacd.exclusao_logica import compactar_exclusoes
+from _pacd.ids import MARCA_EXCLUSAO
+from _pacd.registros import COLUNAS_POR_ABA
+from _rotas import excluir_registro, listar_exercicios
+
+
+SIMULADO = "1088000000000001"
+QUESTOES = "1088000000000002"
+REDACAO = "1088000000000003"
+
+
+@pytest.fixture
+def planilha(planilha_falsa):
+    return planilha_falsa({
+        "atividades": [
+            COLUNAS_POR_ABA["atividades"],
+            [SIMULADO, "Simulado 1", "Simulado", "01/02/2025", ""],
+            [QUESTOES, "Bloco 1", "Questões", "02/02/2025", ""],
+            [REDACAO, "Redação 1", "Redação", "03/02/2025", ""],
+        ],
+        "simulados": [
+            COLUNAS_POR_ABA["simulados"],
+            ["SIM1088000000000011", SIMULADO, "Natureza", "45", "30"],
+            ["SIM1088000000000012", QUESTOES, "Humanas", "10", "5"],
+            ["SIM1088000000000013", SIMULADO, "Humanas", "45", "40"],
+        ],
+        "questoes": [
+            COLUNAS_POR_ABA["questoes"],
+            ["QST1088000000000021", QUESTOES, "Natureza", "Física", "Óptica", "10", "8"],
+            ["QST1088000000000022", SIMULADO, "Natureza", "Química", "Soluções", "5", "5"],
+        ],
+        "redacoes": [
+            COLUNAS_POR_ABA["redacoes"],
+            ["RDC1088000000000031", REDACAO, "Redação", "160", "160", "120", "160", "200"],
+        ],
+    })
+
+
+def ids(planilha, aba):
+    return [linha[0] for linha in planilha.aba(aba).linhas[1:]]
+
+
+def test_exclusao_em_cascata(planilha):
+    planilha.medidor.zerar()
+    assert excluir_registro.excluir_atividade(SIMULADO) is True
+
+    assert ids(planilha, "atividades") == [QUESTOES, REDACAO]
+    assert ids(planilha, "simulados") == ["SIM1088000000000012"]
+    assert ids(planilha, "questoes") == ["QST1088000000000021"]
+    assert ids(planilha, "redacoes") == ["RDC1088000000000031"]
+
+    # Uma leitura das colunas envolvidas e um único batchUpdate (atômico)
+    assert planilha.medidor.chamadas["values_batch_get"] == 1
+    assert planilha.medidor.chamadas["batch_update"] == 1
+
+
+def test_exclusao_em_lote(planilha):
+    planilha.medidor.zerar()
+    resultados = excluir_registro.excluir_em_lote([
+        {"tipo": "Atividade", "id": REDACAO},
+        {"tipo": "Simulado", "id": "SIM1088000000000012"},
+        {"tipo": "Questões", "id": "NAOEXISTE"},
+        {"tipo": "Outro", "id": "1"},
+        {"tipo": "Simulado"},
+    ])
+
+    assert [resultado["success"] for resultado in resultados] == [True, True, False, False, False]
+    assert resultados[2]["error"] == "Registro não encontrado"
+    assert resultados[3]["error"] == "Tipo inválido para exclusão"
+    assert resultados[4]["error"] == "Campos obrigatórios: tipo, id"
+
+    assert ids(planilha, "atividades") == [SIMULADO, QUESTOES]
+    assert ids(planilha, "simulados") == ["SIM1088000000000011", "SIM1088000000000013"]
+    assert ids(planilha, "redacoes") == []
+    assert planilha.medidor.chamadas["values_batch_get"] == 1
+    assert planilha.medidor.chamadas["batch_update"] == 1
+
+
+def test_exclusao_de_registro_pelo_indice(planilha):
+    assert excluir_registro.excluir_registro("simulados", "SIM1088000000000012") is True
+    assert excluir_registro.excluir_registro("simulados", "SIM1088000000000013") is True
+    assert excluir_registro.excluir_registro("simulados", "SIM1088000000000013") is False
+    assert ids(planilha, "simulados") == ["SIM1088000000000011"]
+
+
+def test_exclusao_logica_e_compactacao(planilha, monkeypatch):
+    monkeypatch.setattr(armazenamento, "EXCLUSAO_LOGICA", True)
+
+    planilha.medidor.zerar()
+    assert excluir_registro.excluir_atividade(SIMULADO) is True
+
+    # Só as células de ID são reescritas, em um values:batchUpdate; nenhuma linha sai do lugar
+    assert planilha.medidor.chamadas["values_batch_update"] == 1
+    assert planilha.medidor.chamadas["batch_update"] == 0
+    assert ids(planilha, "atividades")[0] == f"{MARCA_EXCLUSAO}{SIMULADO}"
+    assert ids(planilha, "simulados") == [
+        f"{MARCA_EXCLUSAO}SIM1088000000000011", "SIM1088000000000012", f"{MARCA_EXCLUSAO}SIM1088000000000013"
+    ]
+
+    # As listagens já ignoram as linhas marcadas
+    atividades, _ = listar_exercicios.listar_atividades()
+    assert [str(atividade["ID_ATIVIDADE"]) for atividade in atividades] == [QUESTOES]
+
+    # Excluir de novo não encontra a atividade nem remarca os derivados
+    assert excluir_registro.excluir_atividade(SIMULADO) is False
+    assert excluir_registro.excluir_registro("simulados", "SIM1088000000000012") is True
+
+    # A compactação remove fisicamente as linhas marcadas, em lotes
+    removidas = compactar_exclusoes(lote=2)
+    assert removidas == {"atividades": 1, "simulados": 3, "questoes": 1, "redacoes": 0}
+    assert ids(planilha, "atividades") == [QUESTOES, REDACAO]
+    assert ids(planilha, "simulados") == []
+    assert ids(planilha, "questoes") == ["QST1088000000000021"]
+
+    assert compactar_exclusoes() == {"atividades": 0, "simulados": 0, "questoes": 0, "redacoes": 0}
@@ -0,0 +1,62 @@
+"""
+Importação em lote (api/_rotas/importar_atividades.py) sobre a planilha em memória
+
+Uso:
+    python -m pytest tests
+"""
+import pytest
+
+from _pacd.registros import COLUNAS_POR_ABA
+from _rotas import importar_atividades
+
+
+@pytest.fixture
+def planilha(planilha_falsa):
+    return planilha_falsa({"atividades": [
+        COLUNAS_POR_ABA["atividades"],
+        ["1088000000000001", "Simulado 1", "Simulado", "01/02/2025", "01/02/2025 10:00:00"],
+        ["14302", "Legada", "Questões", "", ""],
+    ]})
+
+
+def test_acrescenta_a_atividade_existente_do_mesmo_tipo(planilha):
+    resultado = importar_atividades.importar_registros([
+        {"id_atividade": "1088000000000001", "tipo": "Simulado", "questoes": "10", "acertos": "7"},
+        {"id_atividade": 14302, "tipo": "Questões", "questoes": 5, "acertos": 5},
+    ])
+
+    assert resultado["importados"] == 2
+    assert [linha[1] for linha in planilha.aba("simulados").linhas[1:]] == ["1088000000000001"]
+    assert [linha[1] for linha in planilha.aba("questoes").linhas[1:]] == ["14302"]
+    assert len(planilha.aba("atividades").linhas) == 3
+
+
+def test_rejeita_atividade_inexistente_ou_de_outro_tipo(planilha):
+    resultado = importar_atividades.importar_registros([
+        {"id_atividade": "NAOEXISTE", "tipo": "Simulado"},
+        {"id_atividade": "1088000000000001", "tipo": "Questões"},
+        {"titulo": "Nova", "tipo": "Redação", "tempo_total": "60"},
+    ])
+
+    assert resultado["importados"] == 1
+    assert resultado["resultados"][0]["errors"] == ["Atividade não encontrada: 'NAOEXISTE'"]
+    assert "diferente do tipo da atividade" in resultado["resultados"][1]["errors"][0]
+    assert planilha.aba("simulados").linhas[1:] == []
+    assert planilha.aba("questoes").linhas[1:] == []
+    assert len(planilha.aba("redacoes").linhas) == 2
+
+
+def test_uma_unica_leitura_das_atividades(planilha):
+    planilha.medidor.zerar()
+    importar_atividades.importar_registros([
+        {"id_atividade": "1088000000000001", "tipo": "Simulado"},
+        {"id_atividade": "NAOEXISTE", "tipo": "Simulado"},
+        {"id_atividade": "14302", "tipo": "Questões"},
+    ])
+    assert planilha.medidor.chamadas["values_batch_get"] == 1
+
+
+def test_sem_id_atividade_nao_le_a_planilha(planilha):
+    planilha.medidor.zerar()
+    importar_atividades.importar_registros([{"titulo": "Nova", "tipo": "Simulado", "tempo_total": "90"}])
+    assert planilha.medidor.chamadas["values_batch_get"] == 0
@@ -0,0 +1,52 @@
+"""
+Despacho das rotas pela função única (api/index.py)
+
+Uso:
+    python -m pytest tests
+"""
+import pytest
+
+import index
+
+
+@pytest.mark.parametrize("caminho, rota", [
+    ("/api/listar-painel?motor=pandas", "listar_painel"),
+    ("/api/listar_painel/", "listar_painel"),
+    ("/api/listar/painel", None),
+    ("/api/", None),
+    ("/api", None),
+])
+def test_nome_rota(caminho, rota):
+    assert index.nome_rota(caminho) == rota
+
+
+@pytest.mark.parametrize("caminho", ["/api/nao_existe", "/api/listar/painel", "/api"])
+def test_rota_desconhecida_responde_404_em_json(requisitar, caminho):
+    for metodo in ("GET", "POST", "DELETE"):
+        status, cabecalhos, corpo = requisitar(index.handler, metodo, caminho)
+        assert status == 404
+        assert cabecalhos["Content-Type"] == "application/json"
+        assert corpo == {"success": False, "error": "Rota não encontrada"}
+
+
+def test_metodo_nao_tratado_responde_405_com_allow(requisitar):
+    for metodo in ("DELETE", "PUT", "PATCH", "GET"):
+        status, cabecalhos, corpo = requisitar(index.handler, metodo, "/api/criar-atividade")
+        assert status == 405
+        assert cabecalhos["Allow"] == "OPTIONS, POST"
+        assert corpo["success"] is False
+
+    # HEAD não tem corpo
+    status, cabecalhos, corpo = requisitar(index.handler, "HEAD", "/api/criar_atividade")
+    assert (status, corpo) == (405, None)
+
+
+def test_rota_existente_e_despachada(requisitar, planilha_falsa):
+    planilha_falsa()
+    status, cabecalhos, corpo = requisitar(index.handler, "GET", "/api/listar-painel")
+    assert status == 200
+    assert corpo["total"] == {"exercicios": 0, "redacoes": 0}
+
+    status, cabecalhos, _ = requisitar(index.handler, "OPTIONS", "/api/criar_simulado")
+    assert status == 200
+    assert cabecalhos["Access-Control-Allow-Methods"] == "POST, OPTIONS"
@@ -0,0 +1,53 @@
+"""
+Índice ID -> linha das abas (_pacd.indice) sobre a planilha em memória
+
+Uso:
+    python -m pytest tests
+"""
+import pytest
+
+from _pacd import indice
+from _pacd.armazenamento import obter_armazenamento
+from _pacd.registros import COLUNAS_POR_ABA
+
+
+@pytest.fixture
+def planilha(planilha_falsa):
+    return planilha_falsa({"simulados": [COLUNAS_POR_ABA["simulados"]] + [
+        [f"SIM10880000000000{i:02d}", "1088000000000001"] for i in range(10)
+    ]})
+
+
+def test_coluna_lida_uma_vez_e_linha_conferida(planilha):
+    planilha.medidor.zerar()
+    assert indice.localizar_linha("simulados", "SIM1088000000000003") == 5
+    assert planilha.medidor.chamadas["values_batch_get"] == 1
+
+    # Com o índice em memória, só a célula encontrada é lida
+    assert indice.localizar_linha("simulados", "SIM1088000000000007") == 9
+    assert planilha.medidor.chamadas["values_batch_get"] == 1
+    assert planilha.medidor.chamadas["values_get"] == 1
+
+
+def test_indice_desatualizado_e_reconstruido(planilha):
+    assert indice.localizar_linha("simulados", "SIM1088000000000003") == 5
+
+    # Outra instância insere uma linha no meio da aba
+    planilha.aba("simulados").linhas.insert(1, ["SIM1000000000000001", "1000000000000001"])
+
+    planilha.medidor.zerar()
+    assert indice.localizar_linha("simulados", "SIM1088000000000003") == 6
+    assert planilha.medidor.chamadas["values_batch_get"] == 1
+    assert indice.localizar_linha("simulados", "NAOEXISTE") is None
+
+
+def test_exclusao_e_insercao_atualizam_o_indice(planilha):
+    armazenamento = obter_armazenamento()
+    assert armazenamento.excluir_por_id("simulados", "SIM1088000000000002") is True
+    armazenamento.acrescentar("simulados", ["SIM1088000000000099", "1088000000000001"])
+
+    # As linhas de baixo subiram e a nova está no fim, sem reler a coluna
+    planilha.medidor.zerar()
+    assert indice.localizar_linha("simulados", "SIM1088000000000003") == 4
+    assert indice.localizar_linha("simulados", "SIM1088000000000099") == 11
+    assert planilha.medidor.chamadas["values_batch_get"] == 0
@@ -0,0 +1,148 @@
+"""
+Regressão da listagem de exercícios: os dois motores e o formato original
+
+Compara, sobre abas sintéticas, a saída de:
+- referencia_iterrows(): o laço iterrows que montava a listagem antes do
+  groupby/merge (mesmo formato, com células vazias contando 0 nos totais);
+- listagem_pandas.montar_exercicios() (motor analítico);
+- listagem.montar_exercicios(..., MOTOR_PADRAO) (biblioteca padrão).
+
+Uso:
+    python -m pytest tests
+"""
+import os
+import random
+import sys
+from collections import defaultdict
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api"))
+
+pd = pytest.importorskip("pandas")
+
+from _pacd import listagem, listagem_pandas  # noqa: E402
+from _pacd.leitura import para_tabela  # noqa: E402
+from _pacd.registros import COLUNAS_POR_ABA  # noqa: E402
+
+
+def _numero(valor):
+    return valor if isinstance(valor, (int, float)) and not isinstance(valor, bool) else 0
+
+
+def referencia_iterrows(var_dicTabelas):
+    """Montagem original (iterrows) da listagem de exercícios"""
+    var_dfDadosAtividades = pd.DataFrame(var_dicTabelas["atividades"].colunas)
+    var_dfDadosAtividades = var_dfDadosAtividades[var_dfDadosAtividades['TIPO'] != 'Redação']
+    var_dfDadosSimulados = pd.DataFrame(var_dicTabelas["simulados"].colunas)
+    var_dfDadosQuestoes = pd.DataFrame(var_dicTabelas["questoes"].colunas)
+
+    var_listSimuladosPorAtividade = defaultdict(list)
+    var_listQuestoesPorAtividade = defaultdict(list)
+
+    for _, row in var_dfDadosSimulados.iterrows():
+        var_listSimuladosPorAtividade[str(row['ID_ATIVIDADE'])].append(
+            {campo: row[campo] for campo in listagem.CAMPOS_INFO_SIMULADO}
+        )
+
+    for _, row in var_dfDadosQuestoes.iterrows():
+        var_listQuestoesPorAtividade[str(row['ID_ATIVIDADE'])].append(
+            {campo: row[campo] for campo in listagem.CAMPOS_INFO_QUESTOES}
+        )
+
+    var_jsonFinal = []
+    for _, atividade in var_dfDadosAtividades.iterrows():
+        item = {
+            'ID_ATIVIDADE': atividade['ID_ATIVIDADE'],
+            'TITULO': atividade['TITULO'],
+            'TIPO': atividade['TIPO'],
+            'QUESTOES': 0,
+            'ACERTOS': 0,
+            'DT_INICIO': atividade['DT_INICIO'],
+            'INFO': []
+        }
+
+        if item['TIPO'] == 'Simulado':
+            item['INFO'] = var_listSimuladosPorAtividade.get(str(item['ID_ATIVIDADE']), [])
+        elif item['TIPO'] == 'Questões':
+            item['INFO'] = var_listQuestoesPorAtividade.get(str(item['ID_ATIVIDADE']), [])
+
+        for registro in item['INFO']:
+            item['QUESTOES'] += _numero(registro['QUESTOES'])
+            item['ACERTOS'] += _numero(registro['ACERTOS'])
+
+        var_jsonFinal.append(item)
+
+    return var_jsonFinal
+
+
+def semear_tabelas(quantidade=300, semente=3):
+    """
+    Abas sintéticas como ler_abas() devolve (valores convertidos por para_tabela)
+
+    Inclui atividades sem registros derivados, com vários registros, células
+    vazias (inclusive em QUESTOES/ACERTOS), redações, registros órfãos e
+    registros em aba que não corresponde ao TIPO da atividade.
+    """
+    aleatorio = random.Random(semente)
+    abas = {nome: [list(COLUNAS_POR_ABA[nome])] for nome in ("atividades", "simulados", "questoes")}
+
+    def talvez_vazio(valor):
+        return "" if aleatorio.random() < 0.15 else valor
+
+    for i in range(quantidade):
+        id_atividade = str(1000 + i)
+        tipo = aleatorio.choice(["Simulado", "Questões", "Redação"])
+        abas["atividades"].append([id_atividade, f"Atividade {i}", tipo, talvez_vazio("01/02/2025"), "01/02/2025 10:00:00"])
+
+        # 0 (sem filhos), 1 ou vários registros derivados
+        for j in range(aleatorio.choice([0, 1, 1, 2, 3, 5])):
+            questoes = talvez_vazio(str(aleatorio.randint(1, 90)))
+            acertos = talvez_vazio(str(aleatorio.randint(0, 50)))
+            # Às vezes o registro vai para a aba do outro tipo (não deve entrar na INFO)
+            aba = ("simulados" if tipo == "Simulado" else "questoes") if aleatorio.random() < 0.9 \
+                else aleatorio.choice(["simulados", "questoes"])
+            if aba == "simulados":
+                abas[aba].append([f"SIM{i}_{j}", id_atividade, talvez_vazio("Natureza"), questoes, acertos,
+                                  talvez_vazio("02:00"), talvez_vazio("ok"), "02/02/2025", "02/02/2025 10:00:00"])
+            else:
+                abas[aba].append([f"QST{i}_{j}", id_atividade, talvez_vazio("Humanas"), talvez_vazio("História"),
+                                  talvez_vazio("Brasil"), questoes, acertos, talvez_vazio("01:00"), "",
+                                  "02/02/2025", "02/02/2025 10:00:00"])
+
+    # Registros órfãos (atividade inexistente)
+    abas["simulados"].append(["SIM_ORFAO", "999999", "Natureza", "10", "5", "", "", "", ""])
+    abas["questoes"].append(["QST_ORFAO", "999998", "Humanas", "", "", "", "", "", "", "", ""])
+
+    return {nome: para_tabela(linhas) for nome, linhas in abas.items()}
+
+
+@pytest.fixture(scope="module")
+def tabelas():
+    return semear_tabelas()
+
+
+def test_pandas_igual_a_referencia_iterrows(tabelas):
+    assert listagem_pandas.montar_exercicios(tabelas) == referencia_iterrows(tabelas)
+
+
+def test_motor_padrao_igual_a_referencia_iterrows(tabelas):
+    assert listagem.montar_exercicios(tabelas, listagem.MOTOR_PADRAO) == referencia_iterrows(tabelas)
+
+
+def test_motor_padrao_igual_a_pandas(tabelas):
+    assert listagem.montar_exercicios(tabelas, listagem.MOTOR_PADRAO) == listagem_pandas.montar_exercicios(tabelas)
+
+
+def test_abas_vazias():
+    vazias = {nome: para_tabela([list(COLUNAS_POR_ABA[nome])]) for nome in ("atividades", "simulados", "questoes")}
+    assert listagem.montar_exercicios(vazias, listagem.MOTOR_PADRAO) == []
+    assert listagem_pandas.montar_exercicios(vazias) == []
+
+
+def test_semeadura_cobre_os_casos(tabelas):
+    ids_com_filhos = set(tabelas["simulados"].coluna("ID_ATIVIDADE")) | set(tabelas["questoes"].coluna("ID_ATIVIDADE"))
+    ids_atividades = tabelas["atividades"].coluna("ID_ATIVIDADE")
+    assert any(id_atividade not in ids_com_filhos for id_atividade in ids_atividades)
+    assert "" in tabelas["simulados"].coluna("QUESTOES")
+    assert max(list(tabelas["simulados"].coluna("ID_ATIVIDADE")).count(i) for i in ids_atividades) > 1
@@ -0,0 +1,116 @@
+"""
+Listagens juntadas em SQL (SQLite e réplica) e reconciliação da réplica (_pacd.replica)
+
+Uso:
+    python -m pytest tests
+"""
+import pytest
+
+from _pacd import replica
+from _pacd.armazenamento import ABAS_PAINEL, ArmazenamentoSheets, ArmazenamentoSQLite
+from _pacd.ids import MARCA_EXCLUSAO
+from _pacd.listagem import montar_exercicios, montar_redacoes
+from _pacd.registros import COLUNAS_POR_ABA
+
+
+# IDs atuais e legados (com repetição), números inteiros e decimais,
+# células vazias e linhas marcadas pela exclusão lógica
+ABAS = {
+    "atividades": [
+        ["1088000000000001", "Simulado 1", "Simulado", "01/02/2025", ""],
+        ["14302", "Legada", "Questões", "", ""],
+        ["14302", "Legada repetida", "Questões", "", ""],
+        ["1088000000000002", "Sem registros", "Simulado", "", ""],
+        [f"{MARCA_EXCLUSAO}1088000000000003", "Excluída", "Simulado", "", ""],
+        ["1088000000000004", "Redação 1", "Redação", "03/02/2025", ""],
+        ["1088000000000005", "Redação sem notas", "Redação", "", ""],
+        ["1088000000000006", "Outro tipo", "Outro", "", ""],
+    ],
+    "simulados": [
+        ["SIM1088000000000011", "1088000000000001", "Natureza", "45", "30", "02:00", "", "01/02/2025", ""],
+        [f"{MARCA_EXCLUSAO}SIM1088000000000012", "1088000000000001", "Humanas", "45", "45", "", "", "", ""],
+        ["SIM1088000000000013", "1088000000000001", "Humanas", "", "1,5", "", "", "", ""],
+        ["SIM1088000000000014", "1088000000000003", "Humanas", "10", "10", "", "", "", ""],
+        ["SIM1088000000000015", "14302", "Humanas", "10", "10", "", "", "", ""],
+    ],
+    "questoes": [
+        ["QST1088000000000021", "14302", "Natureza", "Física", "Óptica", "10", "8", "", "", "", ""],
+        ["QST1088000000000022", "14302", "Natureza", "Química", "", "5", "2.5", "", "", "", ""],
+        ["QST1088000000000023", "1088000000000001", "Natureza", "Química", "", "5", "5", "", "", "", ""],
+    ],
+    "redacoes": [
+        ["RDC1088000000000031", "1088000000000004", "Redação", "160", "160", "120", "160", "200"],
+        ["RDC1088000000000032", "1088000000000004", "Redação", "200", "200", "200", "200", "200"],
+        [f"{MARCA_EXCLUSAO}RDC1088000000000033", "1088000000000004", "Redação", "0", "0", "0", "0", "0"],
+    ],
+}
+
+
+@pytest.fixture
+def sqlite(tmp_path):
+    armazenamento = ArmazenamentoSQLite(str(tmp_path / "dados.sqlite3"))
+    armazenamento.acrescentar_lote(ABAS)
+    return armazenamento
+
+
+def test_join_em_sql_igual_a_montagem_em_python(sqlite):
+    var_dicTabelas = sqlite.ler_tabelas(*ABAS_PAINEL)
+    exercicios = montar_exercicios(var_dicTabelas)
+    redacoes = montar_redacoes(var_dicTabelas)
+
+    assert sqlite.listar_exercicios() == exercicios
+    assert sqlite.listar_redacoes() == redacoes
+    assert sqlite.listar_painel() == {"exercicios": exercicios, "redacoes": redacoes}
+
+    # Conferência de alguns valores, além da igualdade
+    assert [item["QUESTOES"] for item in exercicios] == [45, 15, 15, 0, 0]
+    assert [item["C1"] for item in redacoes] == [200, 0]
+
+
+def test_join_usa_o_indice_em_id_atividade(sqlite):
+    plano = " ".join(
+        str(linha[-1]) for linha in sqlite._conectar().execute(
+            f"EXPLAIN QUERY PLAN {sqlite._sql_exercicios()}", {"marca": MARCA_EXCLUSAO}
+        )
+    )
+    assert "idx_simulados_ID_ATIVIDADE" in plano
+    assert "idx_questoes_ID_ATIVIDADE" in plano
+
+
+def test_replica_lista_como_a_planilha(planilha_falsa, tmp_path):
+    planilha = planilha_falsa({nome: [COLUNAS_POR_ABA[nome]] + linhas for nome, linhas in ABAS.items()})
+    esperado = ArmazenamentoSheets().listar_painel()
+
+    armazenamento = ArmazenamentoSheets(replica.ReplicaPlanilha(str(tmp_path / "replica.sqlite3")))
+    assert armazenamento.listar_painel() == esperado
+
+    # Linha nova na planilha: a réplica traz só o incremento e a listagem a inclui
+    planilha.aba("simulados").linhas.append(
+        ["SIM1088000000000016", "1088000000000002", "Natureza", "3", "3", "", "", "", ""]
+    )
+    planilha.medidor.zerar()
+    assert armazenamento.listar_exercicios()[3]["QUESTOES"] == 3
+    assert planilha.medidor.chamadas["values_batch_get"] == 1
+
+
+def test_pedido_de_reconciliacao_durante_a_sincronizacao_nao_se_perde(planilha_falsa, tmp_path, monkeypatch):
+    planilha_falsa({nome: [COLUNAS_POR_ABA[nome]] + linhas for nome, linhas in ABAS.items()})
+    copia = replica.ReplicaPlanilha(str(tmp_path / "replica.sqlite3"))
+    copia.sincronizar(*ABAS_PAINEL)
+
+    # Uma exclusão pede a reconciliação enquanto a planilha está sendo lida
+    replica.exigir_reconciliacao("simulados")
+    ler_planilha = copia._ler_planilha
+
+    def ler_e_excluir(intervalos):
+        valores = ler_planilha(intervalos)
+        replica.exigir_reconciliacao("simulados")
+        return valores
+
+    monkeypatch.setattr(copia, "_ler_planilha", ler_e_excluir)
+    assert copia.sincronizar("simulados") == {"simulados": "completa"}
+
+    # A leitura pode não ter a exclusão: a próxima sincronização relê a aba
+    monkeypatch.setattr(copia, "_ler_planilha", ler_planilha)
+    assert copia.sincronizar("simulados") == {"simulados": "completa"}
+    assert copia.sincronizar("simulados") == {"simulados": "incremental"}